@@ -40,12 +40,15 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'core.middleware.MaintenanceModeMiddleware',  # 503 for the API during maintenance
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'core.middleware.SecurityLoggingMiddleware',  # Security logging middleware
+    'core.middleware.IPAllowlistMiddleware',  # SiteSettings.allowedIPs for admin and API writes
+    'core.middleware.ActivityBatchMiddleware',  # One Activity INSERT per request
 ]
 
 ROOT_URLCONF = 'backend.urls'
@@ -119,13 +122,115 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Uploads are stored content-addressed (core.storage): identical files share
+# one blob, served with immutable cache headers; run `manage.py media_gc` to
+# reclaim blobs no image field references any more
+STORAGES = {
+    'default': {
+        'BACKEND': 'core.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# Media serving (core.media_views). MEDIA_SENDFILE hands file bodies to the
+# web server: 'x-accel-redirect' (nginx, internal location at
+# MEDIA_SENDFILE_PREFIX aliased to MEDIA_ROOT) or 'x-sendfile' (Apache,
+# lighttpd); empty to stream from Django. Non-blob files are cached for
+# MEDIA_CACHE_MAX_AGE seconds and then revalidated by ETag
+MEDIA_SENDFILE = os.environ.get('MEDIA_SENDFILE', '')
+MEDIA_SENDFILE_PREFIX = os.environ.get('MEDIA_SENDFILE_PREFIX', '/protected-media/')
+MEDIA_CACHE_MAX_AGE = int(os.environ.get('MEDIA_CACHE_MAX_AGE', 3600))
+
+# Origin (e.g. https://cdn.example.com) prefixed to media URLs in API
+# responses instead of the request's own host; empty to use the request host
+MEDIA_CDN_URL = os.environ.get('MEDIA_CDN_URL', '')
+
+# Widths (px) of the responsive renditions generated for uploaded images
+MEDIA_RENDITION_WIDTHS = [320, 640, 960, 1280, 1920]
+
+# Generate renditions in `manage.py run_media_worker` (True) or inline in the
+# upload request (False, handy when no worker is running)
+MEDIA_RENDITIONS_ASYNC = os.environ.get('MEDIA_RENDITIONS_ASYNC', 'True').lower() == 'true'
+
+# Activity rows that could not be written are kept here and retried
+# (core.activity, `manage.py replay_activity_spool`)
+ACTIVITY_SPOOL_PATH = os.path.join(BASE_DIR, 'logs', 'activity_spool.jsonl')
+
+# `manage.py archive_activity` moves Activity rows older than this many days
+# to gzipped JSONL files in ACTIVITY_ARCHIVE_DIR (daily rollups are kept)
+ACTIVITY_RETENTION_DAYS = int(os.environ.get('ACTIVITY_RETENTION_DAYS', 365))
+ACTIVITY_ARCHIVE_DIR = os.path.join(BASE_DIR, 'activity_archive')
+
+# Search backend (core.search): 'auto' uses the database's full-text index
+# (FTS5, PostgreSQL) when there is one and the in-memory engine otherwise;
+# 'memory' always uses the in-memory engine. Each process's engine picks up
+# other processes' writes at most SEARCH_ENGINE_SYNC_SECONDS later
+SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND', 'auto')
+SEARCH_ENGINE_SYNC_SECONDS = int(os.environ.get('SEARCH_ENGINE_SYNC_SECONDS', 30))
+
+# How often (ms) each process checks whether its in-memory copy of the site
+# settings (core.site_settings) is still current
+SITE_SETTINGS_REVALIDATE_MS = int(os.environ.get('SITE_SETTINGS_REVALIDATE_MS', 1000))
+
+# Number of reverse proxies (nginx, load balancer) in front of Django that
+# append to X-Forwarded-For; 0 ignores the header (core.ip_allowlist)
+TRUSTED_PROXY_COUNT = int(os.environ.get('TRUSTED_PROXY_COUNT', 0))
+
+# While SiteSettings.maintenanceMode is on, API requests other than these
+# (and those of admins) get a 503 telling clients to retry after
+# MAINTENANCE_RETRY_AFTER seconds (core.middleware.MaintenanceModeMiddleware)
+MAINTENANCE_EXEMPT_PATHS = ['/api/auth/login/', '/api/auth/token/refresh/']
+MAINTENANCE_RETRY_AFTER = int(os.environ.get('MAINTENANCE_RETRY_AFTER', 300))
+
+# Login brute-force protection (core.login_limiter): failures are counted per
+# username (limit SiteSettings.maxLoginAttempts) and per client IP over a
+# sliding window; a lock starts at LOGIN_LOCKOUT_SECONDS and doubles with each
+# repeat, up to LOGIN_LOCKOUT_MAX_SECONDS
+LOGIN_WINDOW_SECONDS = int(os.environ.get('LOGIN_WINDOW_SECONDS', 900))
+LOGIN_MAX_ATTEMPTS_PER_IP = int(os.environ.get('LOGIN_MAX_ATTEMPTS_PER_IP', 50))
+LOGIN_LOCKOUT_SECONDS = int(os.environ.get('LOGIN_LOCKOUT_SECONDS', 60))
+LOGIN_LOCKOUT_MAX_SECONDS = int(os.environ.get('LOGIN_LOCKOUT_MAX_SECONDS', 3600))
+
+# Resumable uploads (core.uploads): where partial files live, the largest
+# accepted file, how long an unfinished session is kept and after how long a
+# chunk write that never finished (e.g. a killed worker) stops blocking the
+# session
+UPLOAD_SESSION_DIR = os.path.join(BASE_DIR, 'upload_sessions')
+UPLOAD_SESSION_MAX_SIZE = 200 * 1024 * 1024
+UPLOAD_SESSION_TTL_HOURS = 24
+UPLOAD_CHUNK_TIMEOUT_SECONDS = 600
+
+# Cache configuration
+# The local-memory cache is per process. When running several workers, set
+# CACHE_BACKEND to a shared backend so cache versions bumped by one worker are
+# seen by all of them (run_media_worker is one of them: it bumps the versions
+# of models whose images got new renditions), e.g.
+# django.core.cache.backends.redis.RedisCache with
+# CACHE_LOCATION=redis://127.0.0.1:6379/1, or
+# django.core.cache.backends.filebased.FileBasedCache with a directory path.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'mkdss-default'),
+    }
+}
+
+# How long (in seconds) a rendered public API response is kept in the cache
+API_CACHE_TIMEOUT = 600
+
+# How long (in seconds) an assembled page bundle is kept in the cache
+PAGE_BUNDLE_CACHE_TIMEOUT = 300
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # JWTAuthentication that trusts the role claims of its tokens (core.tokens)
+        'core.tokens.ClaimsJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',  # Allow GET requests without authentication
@@ -150,6 +255,8 @@ SIMPLE_JWT = {
     'ALGORITHM': 'HS256',
     'AUTH_HEADER_TYPES': ('Bearer',),
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    # Refreshed access tokens carry the user's current role (core.tokens)
+    'TOKEN_REFRESH_SERIALIZER': 'core.tokens.RoleTokenRefreshSerializer',
 }
 
 # CORS settings
@@ -217,11 +324,23 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
-        'security_file': {
+        'core_console': {
+            # Level is decided by the 'core' logger below
+            'class': 'logging.StreamHandler',
+            'formatter': 'verbose',
+        },
+        # Audit records are queued and written in batches by a background
+        # thread (core.audit); when the queue is full they are dropped and
+        # counted rather than slowing down requests
+        'security_queue': {
+            '()': 'core.audit.AuditQueueHandler',
             'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': os.path.join(BASE_DIR, 'logs/security.log'),
             'formatter': 'verbose',
+            'filename': os.path.join(BASE_DIR, 'logs/security.log'),
+            'echo': True,
+            'queue_size': 10000,
+            'batch_size': 200,
+            'overflow': os.environ.get('AUDIT_LOG_OVERFLOW', 'drop'),
         },
     },
     'loggers': {
@@ -231,10 +350,17 @@ LOGGING = {
             'propagate': True,
         },
         'security': {
-            'handlers': ['console', 'security_file'],
+            'handlers': ['security_queue'],
             'level': 'INFO',
             'propagate': False,
         },
+        # Application logging (core.logging); set CORE_LOG_LEVEL=DEBUG to
+        # see request payload summaries while debugging
+        'core': {
+            'handlers': ['core_console'],
+            'level': os.environ.get('CORE_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
     },
 }
 
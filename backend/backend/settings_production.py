@@ -51,6 +51,8 @@ SIMPLE_JWT = {
     'ALGORITHM': 'HS256',
     'AUTH_HEADER_TYPES': ('Bearer',),
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    # Refreshed access tokens carry the user's current role (core.tokens)
+    'TOKEN_REFRESH_SERIALIZER': 'core.tokens.RoleTokenRefreshSerializer',
 }
 
 # CORS settings
@@ -59,6 +61,15 @@ CORS_ALLOWED_ORIGINS = [
     # Add any other domains that need to access your API
 ]
 
+# Cache settings
+# Shared between workers so model cache versions bumped by one are seen by all
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', os.path.join(BASE_DIR, 'cache')),
+    }
+}
+
 # Static and media files
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_ROOT = os.path.join(BASE_DIR, 'mediafiles')
@@ -101,11 +112,23 @@ LOGGING = {
             'filename': os.path.join(BASE_DIR, 'logs/django.log'),
             'formatter': 'verbose',
         },
-        'security_file': {
+        'core_console': {
+            # Level is decided by the 'core' logger below
+            'class': 'logging.StreamHandler',
+            'formatter': 'verbose',
+        },
+        # Audit records are queued and written in batches by a background
+        # thread (core.audit); when the queue is full they are dropped and
+        # counted rather than slowing down requests
+        'security_queue': {
+            '()': 'core.audit.AuditQueueHandler',
             'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': os.path.join(BASE_DIR, 'logs/security.log'),
             'formatter': 'verbose',
+            'filename': os.path.join(BASE_DIR, 'logs/security.log'),
+            'echo': True,
+            'queue_size': 10000,
+            'batch_size': 200,
+            'overflow': os.environ.get('AUDIT_LOG_OVERFLOW', 'drop'),
         },
     },
     'loggers': {
@@ -115,10 +138,17 @@ LOGGING = {
             'propagate': True,
         },
         'security': {
-            'handlers': ['console', 'security_file'],
+            'handlers': ['security_queue'],
             'level': 'INFO',
             'propagate': False,
         },
+        # Application logging (core.logging); set CORE_LOG_LEVEL=DEBUG to
+        # see request payload summaries while debugging
+        'core': {
+            'handlers': ['core_console', 'file'],
+            'level': os.environ.get('CORE_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
     },
 }
 
@@ -1,7 +1,6 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
 from rest_framework_simplejwt.views import TokenRefreshView
 from core.auth import (
     LoginView,
@@ -10,6 +9,8 @@ from core.auth import (
     PasswordResetConfirmView
 )
 from core.urls import router
+from core.views import DashboardStatsView, PageBundleView, SearchSuggestView, SearchView
+from core.media_views import serve_media
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -19,11 +20,21 @@ urlpatterns = [
     # Add these new paths for password reset
     path('api/auth/password-reset/', PasswordResetRequestView.as_view(), name='password-reset-request'),
     path('api/auth/password-reset/confirm/', PasswordResetConfirmView.as_view(), name='password-reset-confirm'),
+    # Aggregated public page content (one request per page)
+    path('api/pages/<str:page>/bundle/', PageBundleView.as_view(), name='page-bundle'),
+    # Full-text search over products, solutions and news
+    path('api/search/', SearchView.as_view(), name='search'),
+    path('api/search/suggest/', SearchSuggestView.as_view(), name='search-suggest'),
+    # Row counts for the admin dashboard
+    path('api/dashboard/stats/', DashboardStatsView.as_view(), name='dashboard-stats'),
     path('api/', include(router.urls)),
 ]
 
-# Always serve media files in development
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Media files, with Range, conditional GETs and optional X-Accel-Redirect/
+# X-Sendfile offload (see core.media_views)
+urlpatterns += [
+    re_path(r'^%s(?P<path>.*)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
+]
 
 # Debug output for media URL configuration
 print(f"MEDIA_URL: {settings.MEDIA_URL}")
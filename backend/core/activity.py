@@ -0,0 +1,328 @@
+"""
+Buffered Activity recording.
+
+log_action() no longer inserts a row per call. Events are added to the
+buffer of the current activity batch once the surrounding transaction
+commits (so rolled back work leaves no trace, as before), and the batch is
+written with a single bulk_create when it closes:
+
+    with activity_batch():
+        for product in products:
+            ...
+            log_action(user, 'delete', 'product', product.id)
+    # one INSERT here
+
+ActivityBatchMiddleware opens a batch per request. Outside of a batch
+(management commands, the shell) events are written as soon as they
+commit, as before.
+
+Events that cannot be written are appended to a spool file
+(ACTIVITY_SPOOL_PATH) and inserted on a later flush, or by
+`manage.py replay_activity_spool`, so they are not lost while the
+database is unavailable.
+
+ActivityRollup holds daily counts per user, content type and action. Every
+write adds its rows to them in the same transaction, so activity_stats()
+(/api/activity/stats/) reads O(days) rollup rows instead of grouping the
+raw table. `manage.py rollup_activity` rebuilds them from the raw rows
+(backfill, repair), and `manage.py archive_activity` moves rows past the
+retention period to compressed JSONL files; their rollups are kept.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .logging import get_logger
+from .models import Activity, ActivityRollup
+
+logger = get_logger(__name__)
+
+# Seconds between attempts to replay the spool from the request path
+SPOOL_RETRY_INTERVAL = 60
+
+_local = threading.local()
+_spool_lock = threading.Lock()
+_last_spool_attempt = 0.0
+
+
+def spool_path():
+    return getattr(settings, 'ACTIVITY_SPOOL_PATH', os.path.join(settings.BASE_DIR, 'logs', 'activity_spool.jsonl'))
+
+
+def record(user, action, content_type=None, object_id=None, details=None):
+    """Queue an Activity row for the current batch, once the transaction commits."""
+    activity = Activity(
+        user=user, action=action, content_type=content_type,
+        object_id=object_id, details=details, timestamp=timezone.now(),
+    )
+    transaction.on_commit(partial(_buffer, activity))
+
+
+def _buffer(activity):
+    buffer = getattr(_local, 'buffer', None)
+    if buffer is None:
+        # No batch open: write it now, as a single row
+        write([activity])
+    else:
+        buffer.append(activity)
+
+
+class activity_batch:
+    """
+    Context manager collecting the Activity rows recorded inside it and
+    writing them together on exit. Nested batches join the outermost one.
+    """
+    def __enter__(self):
+        self.outermost = getattr(_local, 'buffer', None) is None
+        if self.outermost:
+            _local.buffer = []
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.outermost:
+            buffer = _local.buffer
+            _local.buffer = None
+            flush(buffer)
+
+
+def flush(activities):
+    """Write buffered rows; retry spooled ones from time to time."""
+    global _last_spool_attempt
+
+    if activities:
+        write(activities)
+
+    if time.monotonic() - _last_spool_attempt > SPOOL_RETRY_INTERVAL and os.path.exists(spool_path()):
+        _last_spool_attempt = time.monotonic()
+        try:
+            replay_spool()
+        except Exception:
+            logger.exception('Error replaying spooled activity')
+
+
+def write(activities):
+    """
+    Insert Activity rows with one bulk_create. On failure they are spooled
+    to disk instead of being dropped. Returns True if they reached the database.
+    """
+    try:
+        # Savepoint, so a failure cannot break an enclosing transaction
+        with transaction.atomic():
+            Activity.objects.bulk_create(activities)
+            add_to_rollups(activities)
+    except Exception:
+        logger.exception('Error logging activity; spooling', count=len(activities))
+        spool(activities)
+        return False
+    return True
+
+
+def add_to_rollups(activities):
+    """Increment the daily rollups for newly written rows; one UPDATE per (day, user, type, action)."""
+
+    counts = Counter(
+        (timezone.localtime(activity.timestamp).date(), activity.user_id, activity.content_type or '', activity.action)
+        for activity in activities
+    )
+    for (day, user_id, content_type, action), count in counts.items():
+        key = {'day': day, 'user_id': user_id, 'content_type': content_type, 'action': action}
+        if ActivityRollup.objects.filter(**key).update(count=F('count') + count):
+            continue
+        try:
+            with transaction.atomic():
+                ActivityRollup.objects.create(count=count, **key)
+        except IntegrityError:
+            # Created by a concurrent writer in between
+            ActivityRollup.objects.filter(**key).update(count=F('count') + count)
+
+
+def spool(activities):
+    """Append rows to the spool file as JSON lines."""
+    path = spool_path()
+    lines = ''.join(
+        json.dumps({
+            'user_id': activity.user_id,
+            'action': activity.action,
+            'content_type': activity.content_type,
+            'object_id': activity.object_id,
+            'details': activity.details,
+            'timestamp': activity.timestamp.isoformat(),
+        }) + '\n'
+        for activity in activities
+    )
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _spool_lock, open(path, 'a', encoding='utf-8') as file:
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
+    except OSError:
+        logger.exception('Could not spool activity; events lost', count=len(activities))
+
+
+def replay_spool():
+    """
+    Insert the rows waiting in the spool file. Returns the number written.
+
+    The file is renamed before it is read, so events spooled meanwhile (by
+    this or another process) go to a fresh file and are picked up next time.
+    Rows that fail again are spooled again.
+    """
+    path = spool_path()
+    claimed = f'{path}.{os.getpid()}.{threading.get_ident()}'
+    try:
+        with _spool_lock:
+            os.replace(path, claimed)
+    except FileNotFoundError:
+        return 0
+
+    with open(claimed, encoding='utf-8') as file:
+        activities = []
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError:
+                logger.warning('Skipping unreadable spooled activity', line=line[:200])
+                continue
+            data['timestamp'] = parse_datetime(data['timestamp'])
+            activities.append(Activity(**data))
+
+    # Users deleted since would make the whole batch fail forever
+    user_ids = set(User.objects.filter(
+        pk__in={activity.user_id for activity in activities}
+    ).values_list('pk', flat=True))
+    activities = [activity for activity in activities if activity.user_id in user_ids]
+
+    # write() spools rows that fail again, so the claimed file can go now
+    written = write(activities) if activities else True
+    os.remove(claimed)
+    if written and activities:
+        logger.info('Replayed spooled activity', count=len(activities))
+        return len(activities)
+    return 0
+
+
+def start_of_day(day):
+    """Aware datetime of midnight at the start of a date, in the current time zone."""
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+
+def rebuild_rollups(start, end):
+    """
+    Recompute the ActivityRollup rows of the days in [start, end) from the
+    raw Activity rows, with one GROUP BY. Returns the number of rollup rows.
+
+    Days before the oldest remaining Activity row have been archived and are
+    left untouched, since their raw rows are gone.
+    """
+    oldest = Activity.objects.order_by('timestamp').values_list('timestamp', flat=True).first()
+    if oldest is None:
+        return 0
+    start = max(start, timezone.localtime(oldest).date())
+    if start >= end:
+        return 0
+
+    counts = (
+        Activity.objects
+        .filter(timestamp__gte=start_of_day(start), timestamp__lt=start_of_day(end))
+        .annotate(day=TruncDate('timestamp'))
+        .values('day', 'user_id', 'content_type', 'action')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    rollups = [
+        ActivityRollup(
+            day=row['day'], user_id=row['user_id'], content_type=row['content_type'] or '',
+            action=row['action'], count=row['count'],
+        )
+        for row in counts
+    ]
+    with transaction.atomic():
+        ActivityRollup.objects.filter(day__gte=start, day__lt=end).delete()
+        ActivityRollup.objects.bulk_create(rollups)
+    return len(rollups)
+
+
+def recent_days(days):
+    """(start, end) covering the last `days` days including today."""
+    today = timezone.localdate()
+    return today - timedelta(days=days - 1), today + timedelta(days=1)
+
+
+BUCKETS = ('day', 'week', 'month')
+
+
+def bucket_start(day, bucket):
+    """First day of the bucket a date falls in (weeks start on Monday)."""
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def activity_stats(start, end, bucket='day', user=None, content_type=None, action=None):
+    """
+    Activity counts for the days from start through end, from the rollups:
+    totals by action, content type and user, and a zero-filled series per
+    time bucket. Cost depends on the number of days and distinct
+    user/type/action combinations, not on how many rows were logged.
+    """
+    queryset = ActivityRollup.objects.filter(day__gte=start, day__lte=end)
+    if user:
+        queryset = queryset.filter(user_id=user)
+    if content_type:
+        queryset = queryset.filter(content_type=content_type)
+    if action:
+        queryset = queryset.filter(action=action)
+
+    by_action = Counter()
+    by_content_type = Counter()
+    by_user = Counter()
+    usernames = {}
+    series = Counter()
+    rows = queryset.values_list('day', 'user_id', 'user__username', 'content_type', 'action', 'count').order_by()
+    for day, user_id, username, row_content_type, row_action, count in rows:
+        by_action[row_action] += count
+        by_content_type[row_content_type] += count
+        by_user[user_id] += count
+        usernames[user_id] = username
+        series[bucket_start(day, bucket)] += count
+
+    buckets = []
+    current = bucket_start(start, bucket)
+    while current <= end:
+        buckets.append({'bucket': current.isoformat(), 'count': series[current]})
+        if bucket == 'month':
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=7 if bucket == 'week' else 1)
+
+    return {
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'bucket': bucket,
+        'total': sum(by_action.values()),
+        'by_action': dict(by_action.most_common()),
+        'by_content_type': dict(by_content_type.most_common()),
+        'by_user': [
+            {'user_id': user_id, 'username': usernames[user_id], 'count': count}
+            for user_id, count in by_user.most_common()
+        ],
+        'series': buckets,
+    }
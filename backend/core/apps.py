@@ -1,5 +1,5 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
+from django.db.models.signals import post_migrate, pre_save, post_save, post_delete
 
 
 class CoreConfig(AppConfig):
@@ -8,7 +8,65 @@ class CoreConfig(AppConfig):
 
     def ready(self):
         # Import the signal handler here to avoid circular imports
-        from .signals import create_default_admin
+        from django.contrib.auth.models import User
+        from .media import image_field_names
+        from .signals import (
+            create_default_admin, bump_cached_model_version, record_uploaded_media,
+            remember_media_names, release_deleted_media, update_search_index, remove_from_search_index,
+            patch_search_engine, unpatch_search_engine, reload_site_settings, refresh_role_claims,
+            remember_author_name, bump_news_on_author_rename,
+        )
+        from .search import indexed_models
+
+        # Write audit records from a background thread from the start, rather
+        # than starting it inside the first request that logs one
+        from .audit import start_audit_listeners
+        start_audit_listeners()
 
         # Connect the signal handler to the post_migrate signal
         post_migrate.connect(create_default_admin, sender=self)
+
+        # Bump the cache version of a model whenever one of its rows changes,
+        # so cached responses and page bundles built from it are skipped. Only
+        # models something reads a version of: the cached viewsets register
+        # theirs when the views module is imported
+        from . import views  # noqa: F401
+        from .cache import register_versioned_models, versioned_models
+        register_versioned_models(self.get_model('SiteSettings'))
+        for model in versioned_models():
+            post_save.connect(bump_cached_model_version, sender=model)
+            post_delete.connect(bump_cached_model_version, sender=model)
+        # News shows its author's name: renaming a user invalidates it, while
+        # other User saves (last_login on every login) do not
+        pre_save.connect(remember_author_name, sender=User)
+        post_save.connect(bump_news_on_author_rename, sender=User)
+
+        # Record size, hash and dimensions of uploaded images once, at write
+        # time, so the read path never has to stat the files, and count the
+        # references to each file for media_gc
+        for model in self.get_models():
+            if image_field_names(model):
+                pre_save.connect(remember_media_names, sender=model)
+                post_save.connect(record_uploaded_media, sender=model)
+                post_delete.connect(release_deleted_media, sender=model)
+
+        # Keep the full-text search index (core.search) in step with the content
+        for model in indexed_models():
+            post_save.connect(update_search_index, sender=model)
+            post_delete.connect(remove_from_search_index, sender=model)
+
+        # Patch the in-memory search engine (core.search_engine) as documents change
+        SearchDocument = self.get_model('SearchDocument')
+        post_save.connect(patch_search_engine, sender=SearchDocument)
+        post_delete.connect(unpatch_search_engine, sender=SearchDocument)
+
+        # Keep the process-local site settings copy (core.site_settings) current
+        SiteSettings = self.get_model('SiteSettings')
+        post_save.connect(reload_site_settings, sender=SiteSettings)
+        post_delete.connect(reload_site_settings, sender=SiteSettings)
+
+        # Re-check tokens issued before a role or account change (core.tokens)
+        UserRole = self.get_model('UserRole')
+        for model in (User, UserRole):
+            post_save.connect(refresh_role_claims, sender=model)
+            post_delete.connect(refresh_role_claims, sender=model)
@@ -0,0 +1,299 @@
+"""
+Asynchronous security audit log.
+
+The 'security' logger writes through AuditQueueHandler: the request thread
+only puts the record on a bounded in-memory queue, and a background
+listener thread serializes the queued records, writes them to the audit
+file (and console) and flushes once per batch. A slow or stalled disk
+therefore never adds latency to a request.
+
+The listener is started by CoreConfig.ready (and again in each forked
+worker), never by a request. It does not wake for every record: it drains
+the queue every flush_interval seconds, or early once the queue is half
+full, and pauses every few records while formatting, so a batch being
+written holds up a request thread for a few records at most.
+
+When the queue is full the overflow policy decides:
+
+    'drop'   discard the record at once (the default)
+    'block'  wait up to block_timeout seconds for room, then discard
+
+Dropped records are counted (see audit_stats()) and reported as a warning
+on the 'core.audit' logger.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from logging.handlers import QueueHandler, QueueListener
+
+from .logging import SENSITIVE_KEYS, get_logger
+
+logger = get_logger(__name__)
+
+
+class AuditEvent:
+    """An audit record payload, serialized to JSON only when written."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return json.dumps(self.data, default=str)
+
+
+def redact_body(data):
+    """Copy of parsed request data with sensitive keys masked, recursively."""
+    if isinstance(data, dict):
+        return {
+            key: '[REDACTED]' if any(sensitive in str(key).lower() for sensitive in SENSITIVE_KEYS)
+            else redact_body(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact_body(value) for value in data]
+    return data
+
+
+def parsed_body(response):
+    """
+    Return the JSON body DRF already parsed for the view that produced the
+    response, or None. Never parses the body itself.
+    """
+    # Imported here: this module is loaded while LOGGING is configured,
+    # before DRF can be
+    from rest_framework.request import Empty
+
+    renderer_context = getattr(response, 'renderer_context', None) or {}
+    drf_request = renderer_context.get('request')
+    if drf_request is None or getattr(drf_request, '_full_data', Empty) is Empty:
+        return None
+    if not (drf_request.content_type or '').startswith('application/json'):
+        return None
+    return drf_request._full_data
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener over a deque that wakes every flush_interval seconds (or
+    when woken through `wakeup`), drains what is queued in batches of up to
+    batch_size and writes each batch with a single flush per handler.
+    """
+
+    # Records formatted between two pauses that let request threads run
+    yield_every = 8
+
+    def __init__(self, queue, *handlers, batch_size=200, flush_interval=0.05, on_batch=None):
+        super().__init__(queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_batch = on_batch
+        self.wakeup = threading.Event()
+
+    def enqueue_sentinel(self):
+        self.queue.append(self._sentinel)
+        self.wakeup.set()
+
+    def _monitor(self):
+        q = self.queue
+        stop = False
+        while not stop:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            while q and not stop:
+                batch = []
+                while q and len(batch) < self.batch_size:
+                    record = q.popleft()
+                    if record is self._sentinel:
+                        stop = True
+                        break
+                    batch.append(record)
+                if batch:
+                    self.handle_batch(batch)
+
+    def handle_batch(self, batch):
+        for handler in self.handlers:
+            records = [record for record in batch if record.levelno >= handler.level]
+            if not records:
+                continue
+            if not isinstance(handler, logging.StreamHandler):
+                for record in records:
+                    handler.handle(record)
+                continue
+
+            lines = []
+            for index, record in enumerate(records, 1):
+                try:
+                    lines.append(handler.format(record) + handler.terminator)
+                except Exception:
+                    handler.handleError(record)
+                if index % self.yield_every == 0:
+                    # sleep(0) would take the GIL straight back; sleeping for
+                    # real hands it to a request thread waiting for it
+                    time.sleep(0.0001)
+            with handler.lock:
+                try:
+                    if handler.stream is None:
+                        handler.stream = handler._open()
+                    handler.stream.write(''.join(lines))
+                    handler.flush()
+                except Exception:
+                    handler.handleError(records[-1])
+        if self.on_batch:
+            self.on_batch(len(batch))
+
+
+class AuditQueueHandler(QueueHandler):
+    """
+    Queue-backed handler for the 'security' logger. Configured from LOGGING:
+
+        'security_queue': {
+            '()': 'core.audit.AuditQueueHandler',
+            'filename': os.path.join(BASE_DIR, 'logs/security.log'),
+            'formatter': 'verbose',
+            'echo': True,          # also write to stderr
+            'queue_size': 10000,
+            'batch_size': 200,
+            'flush_interval': 0.05,
+            'overflow': 'drop',    # or 'block'
+            'block_timeout': 0.05,
+        }
+
+    The queue is a deque, whose append and popleft are atomic, so emitting
+    a record takes no lock. The listener thread is started by
+    start_listener(), called from CoreConfig.ready; a worker forked from a
+    process that had one starts its own right after the fork.
+    """
+
+    def __init__(self, filename, echo=False, queue_size=10000, batch_size=200, flush_interval=0.05,
+                 overflow='drop', block_timeout=0.05):
+        if overflow not in ('drop', 'block'):
+            raise ValueError(f'Unknown audit overflow policy: {overflow}')
+        super().__init__(deque())
+        self.filename = filename
+        self.echo = echo
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        # Queue length at which the listener is woken early
+        self.wake_at = max(batch_size, queue_size // 2)
+        self.listener = None
+        # Updated by the listener thread only, except 'dropped'
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._dropped_reported = 0
+        # Threads do not survive fork(); give the child a listener of its own
+        os.register_at_fork(after_in_child=self._restart_after_fork)
+
+    def count(self, key, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def stats(self):
+        queued_now = len(self.queue)
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queued'] = stats.get('written', 0) + queued_now
+        stats['queued_now'] = queued_now
+        return stats
+
+    def start_listener(self):
+        if self.listener is not None:
+            return
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        handlers = [logging.FileHandler(self.filename, encoding='utf-8')]
+        if self.echo:
+            handlers.append(logging.StreamHandler(sys.stderr))
+        for handler in handlers:
+            handler.setFormatter(self.formatter)
+
+        self.listener = BatchingQueueListener(
+            self.queue, *handlers, batch_size=self.batch_size, flush_interval=self.flush_interval,
+            on_batch=self.batch_written,
+        )
+        self.listener.start()
+
+    def _restart_after_fork(self):
+        if self.listener is not None:
+            # The inherited queue holds records the parent will write
+            self.queue = deque()
+            self.listener = None
+            self.start_listener()
+
+    def batch_written(self, size):
+        self.count('written', size)
+        self.count('batches')
+        with self._stats_lock:
+            dropped = self._stats['dropped']
+        if dropped > self._dropped_reported:
+            logger.warning('Audit log records dropped', dropped=dropped - self._dropped_reported, total=dropped)
+            self._dropped_reported = dropped
+
+    def handle(self, record):
+        # Handler.handle would take the handler lock around emit(); the
+        # deque needs none
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def prepare(self, record):
+        # Leave formatting (and the JSON serialization of AuditEvent) to the
+        # listener thread; the record never leaves this process
+        return record
+
+    def enqueue(self, record):
+        q = self.queue
+        if len(q) >= self.queue_size:
+            if self.overflow == 'block' and self.listener is not None:
+                self.listener.wakeup.set()
+                deadline = time.monotonic() + self.block_timeout
+                while len(q) >= self.queue_size and time.monotonic() < deadline:
+                    time.sleep(0.001)
+            if len(q) >= self.queue_size:
+                self.count('dropped')
+                return
+        q.append(record)
+        # Otherwise the listener wakes on its own every flush_interval
+        if len(q) >= self.wake_at and self.listener is not None and not self.listener.wakeup.is_set():
+            self.listener.wakeup.set()
+
+    def close(self):
+        # logging.shutdown() closes handlers at exit: write what is queued
+        if self.listener is not None:
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+            self.listener = None
+        super().close()
+
+
+def audit_handlers():
+    return [
+        handler for handler in logging.getLogger('security').handlers
+        if isinstance(handler, AuditQueueHandler)
+    ]
+
+
+def start_audit_listeners():
+    """Start the listener threads of the 'security' logger's audit handlers."""
+    for handler in audit_handlers():
+        handler.start_listener()
+
+
+def audit_stats():
+    """Counters of the audit handlers of the 'security' logger, summed."""
+    totals = Counter()
+    for handler in audit_handlers():
+        totals.update(handler.stats())
+    return dict(totals)
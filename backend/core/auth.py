@@ -1,7 +1,6 @@
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework.permissions import AllowAny
@@ -12,6 +11,13 @@ from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 
+from . import login_limiter
+from .ip_allowlist import client_ip
+from .logging import get_logger
+from .tokens import RoleRefreshToken
+
+logger = get_logger(__name__)
+
 class LoginView(APIView):
     permission_classes = [AllowAny]
     parser_classes = [JSONParser]
@@ -25,11 +31,20 @@ class LoginView(APIView):
                 'error': 'Please provide both username and password'
             }, status=status.HTTP_400_BAD_REQUEST)
         
+        # Refuse locked logins before authenticate() spends a password hash
+        ip = client_ip(request)
+        retry_after = login_limiter.locked_for(username, ip)
+        if retry_after:
+            return Response({
+                'error': f'Too many failed login attempts. Try again in {retry_after} seconds.'
+            }, status=status.HTTP_429_TOO_MANY_REQUESTS, headers={'Retry-After': str(retry_after)})
+
         user = authenticate(username=username, password=password)
         
         if user:
-            refresh = RefreshToken.for_user(user)
-            role = getattr(user.role, 'role', 'viewer') if hasattr(user, 'role') else 'viewer'
+            login_limiter.record_success(username)
+            refresh = RoleRefreshToken.for_user(user)
+            role = refresh['role'] or 'viewer'
             
             return Response({
                 'user': {
@@ -48,6 +63,7 @@ class LoginView(APIView):
                 }
             })
         
+        login_limiter.record_failure(username, ip)
         return Response({
             'error': 'Invalid credentials'
         }, status=status.HTTP_401_UNAUTHORIZED)
@@ -93,7 +109,7 @@ class PasswordResetRequestView(APIView):
                         fail_silently=False,
                     )
                 except Exception as email_error:
-                    print(f"Email sending error: {str(email_error)}")
+                    logger.exception('Password reset email failed', user=user.pk)
                     return Response({
                         'error': f'Failed to send email: {str(email_error)}'
                     }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -109,7 +125,7 @@ class PasswordResetRequestView(APIView):
                 })
                 
         except Exception as e:
-            print(f"Password reset error: {str(e)}")
+            logger.exception('Password reset failed')
             return Response({
                 'error': f'Password reset failed: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
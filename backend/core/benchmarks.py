@@ -0,0 +1,463 @@
+"""
+Benchmark scenarios for the API hot paths.
+
+    python manage.py benchmark                 # every scenario
+    python manage.py benchmark logging -n 500  # one scenario, 500 objects
+
+Scenarios are plain functions registered with @scenario. They receive the
+parsed command options, run against the throwaway database the benchmark
+command creates, and return rows of (label, seconds per operation, detail)
+for the command to print; seconds may be None for rows that only report a
+count.
+"""
+
+import io
+import json
+import logging
+import statistics
+import time
+from contextlib import contextmanager, redirect_stdout
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import Client
+
+from .logging import get_logger, redact
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    """Register a benchmark scenario under the given name."""
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+def measure(func, repeat=20):
+    """Return the median wall time of func() in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@contextmanager
+def log_level(name, level):
+    """Temporarily set the level of a logger."""
+    logger = logging.getLogger(name)
+    previous = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+
+def anonymous_get(client, url):
+    """GET a URL, bypassing the response cache so the view really runs."""
+    def request():
+        cache.clear()
+        response = client.get(url)
+        assert response.status_code == 200, (url, response.status_code)
+    return request
+
+
+def anonymous_request(client, url):
+    """Like anonymous_get, for responses of any status."""
+    def request():
+        cache.clear()
+        client.get(url)
+    return request
+
+
+@scenario('logging')
+def logging_overhead(options):
+    """
+    Per-object cost of the description list endpoints with the old
+    print()-per-object logging replayed and with the structured logger, plus
+    the cost of one print() debug line against a disabled log call.
+    """
+    from . import views
+    from .fields import build_media_url
+    from .models import NewsDescription, ProductDescription, SolutionDescription
+
+    objects = options['objects']
+    repeat = options['repeat']
+    rows = []
+
+    # The old code wrote several lines per object; stdout is swapped for an
+    # in-memory buffer so the comparison is not dominated by the terminal
+    data = {'title': 'Title', 'description': 'x' * 200, 'password': 'secret'}
+    sink = io.StringIO()
+    logger = get_logger('core.benchmarks')
+
+    def legacy():
+        with redirect_stdout(sink):
+            print("Creating product description with data:", data)
+            print("Files:", {})
+        sink.seek(0)
+        sink.truncate()
+
+    def structured():
+        logger.debug('Creating product description', data=redact(data), files=redact({}))
+
+    with log_level('core', logging.INFO):
+        rows.append(('print() debug line', measure(legacy, repeat * 50), 'per call'))
+        rows.append(('logger.debug (disabled)', measure(structured, repeat * 50), 'per call'))
+
+    for model in (ProductDescription, SolutionDescription, NewsDescription):
+        model.objects.bulk_create(
+            model(title=f'{model.__name__} {i}', description='Benchmark ' * 20)
+            for i in range(objects)
+        )
+
+    client = Client()
+    endpoints = (
+        ('product-descriptions', '/api/product-descriptions/'),
+        ('solution-descriptions', '/api/solution-descriptions/'),
+        ('news-descriptions', '/api/news-descriptions/'),
+    )
+
+    # The list views used to print() a count line (one more COUNT query) and
+    # two lines per object; replay them around the current view to time the
+    # same endpoint before and after
+    def print_per_object(request, field):
+        url = build_media_url(request, field)
+        print(f"Hero image URL for product {field.instance.id}: {url}" if url
+              else f"No hero image for product {field.instance.id}")
+        print(f"Added product {field.instance.id} to result")
+        return url
+
+    def legacy_get(url, model):
+        request = anonymous_get(client, url)
+
+        def run():
+            with redirect_stdout(sink), mock.patch.object(views, 'build_media_url', print_per_object):
+                print("Listing descriptions")
+                print(f"Found {model.objects.count()} descriptions")
+                request()
+            sink.seek(0)
+            sink.truncate()
+        return run
+
+    models = (ProductDescription, SolutionDescription, NewsDescription)
+    with log_level('core', logging.INFO):
+        for (label, url), model in zip(endpoints, models):
+            before = measure(legacy_get(url, model), repeat)
+            after = measure(anonymous_get(client, url), repeat)
+            rows.append((f'GET {label} (print per object)', before, f'{before / objects * 1e6:.1f} us per object'))
+            rows.append((f'GET {label} (structured log)', after, f'{after / objects * 1e6:.1f} us per object'))
+    return rows
+
+
+@scenario('media-urls')
+def media_url_overhead(options):
+    """
+    Serialize a list of products with images and count how often the
+    request's host had to be resolved while building their URLs.
+    """
+    from django.test import RequestFactory
+    from rest_framework.request import Request
+
+    from .models import Product
+    from .serializers import ProductSerializer
+
+    objects = options['objects']
+    Product.objects.bulk_create(
+        Product(name=f'Product {i}', description='Benchmark', items=[], image=f'products/product-{i}.png')
+        for i in range(objects)
+    )
+    products = list(Product.objects.all())
+
+    host_lookups = 0
+
+    def serialize():
+        nonlocal host_lookups
+        django_request = RequestFactory().get('/api/products/')
+        get_host = django_request.get_host
+
+        def counting_get_host():
+            nonlocal host_lookups
+            host_lookups += 1
+            return get_host()
+
+        django_request.get_host = counting_get_host
+        ProductSerializer(products, many=True, context={'request': Request(django_request)}).data
+
+    repeat = options['repeat']
+    seconds = measure(serialize, repeat)
+    return [
+        ('serialize products', seconds, f'{seconds / objects * 1e6:.1f} us per object'),
+        ('host lookups per list', None, f'{host_lookups / repeat:.0f} for {objects} objects'),
+    ]
+
+
+@scenario('audit')
+def audit_logging_overhead(options):
+    """
+    Request-thread cost of one security audit record: the old synchronous
+    FileHandler (also with an fsync per record, as a stand-in for a slow
+    disk) against the queue-backed AuditQueueHandler.
+    """
+    import os
+    import tempfile
+
+    from .audit import AuditEvent, AuditQueueHandler
+
+    class FsyncFileHandler(logging.FileHandler):
+        def flush(self):
+            super().flush()
+            if self.stream:
+                os.fsync(self.stream.fileno())
+
+    records = options['objects']
+    event = {
+        'timestamp': '2025-01-01T00:00:00+00:00', 'user_id': 1, 'username': 'admin', 'method': 'POST',
+        'path': '/api/products/', 'status_code': 201, 'ip_address': '127.0.0.1',
+        'user_agent': 'benchmark', 'duration': '0.0100s', 'body': {'name': 'Product', 'items': []},
+    }
+    formatter = logging.Formatter('{levelname} {asctime} {module} {message}', style='{')
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'security.log')
+        handlers = (
+            ('FileHandler + json.dumps', logging.FileHandler(path), lambda: json.dumps(event)),
+            ('FileHandler + fsync', FsyncFileHandler(path), lambda: json.dumps(event)),
+            ('AuditQueueHandler', AuditQueueHandler(path, queue_size=records * 2), lambda: AuditEvent(event)),
+        )
+        for label, handler, message in handlers:
+            handler.setFormatter(formatter)
+            if isinstance(handler, AuditQueueHandler):
+                # As CoreConfig.ready does for the configured handler
+                handler.start_listener()
+            logger = logging.getLogger('core.benchmarks.audit')
+            logger.propagate = False
+            logger.addHandler(handler)
+            timings = []
+            try:
+                for _ in range(records):
+                    start = time.perf_counter()
+                    logger.info(message())
+                    timings.append(time.perf_counter() - start)
+            finally:
+                logger.removeHandler(handler)
+                handler.close()
+            timings.sort()
+            p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+            rows.append((label, statistics.median(timings), f'p99 {p99 * 1e6:.1f} us'))
+    return rows
+
+
+@scenario('activity')
+def activity_logging_overhead(options):
+    """
+    Cost of logging a bulk operation's actions: one Activity.objects.create
+    per action (the previous log_action) against the batched recorder,
+    which writes the request's rows with one bulk_create.
+    """
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from .activity import activity_batch
+    from .models import Activity
+    from .utils import log_action
+
+    actions = options['objects']
+    repeat = options['repeat']
+    user = User.objects.create(username='benchmark')
+
+    def per_row():
+        for i in range(actions):
+            Activity.objects.create(user=user, action='delete', content_type='product', object_id=str(i))
+
+    def batched():
+        with activity_batch():
+            for i in range(actions):
+                log_action(user, 'delete', 'product', i)
+
+    rows = []
+    for label, func in (('Activity.objects.create per action', per_row), ('log_action in activity_batch', batched)):
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        seconds = measure(func, repeat)
+        rows.append((label, seconds, f'{len(queries)} queries for {actions} actions'))
+    return rows
+
+
+@scenario('search-engine')
+def search_engine_cost(options):
+    """
+    Build time, memory per document and query/suggestion latency of the
+    in-memory search engine over 10k and 100k synthetic documents with a
+    Zipf-distributed vocabulary.
+    """
+    import itertools
+    import random
+    import tracemalloc
+
+    from .search_engine import SearchEngine
+
+    rng = random.Random(42)
+    syllables = ['ka', 'ri', 'to', 'sen', 'mal', 'cor', 'di', 'vex', 'lu', 'pra', 'ti', 'nos', 'ge', 'bar', 'qu', 'ent']
+    vocabulary = list(dict.fromkeys(
+        ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(40000)
+    ))
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def words(count):
+        return ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=count))
+
+    def build(documents):
+        engine = SearchEngine()
+        # As get_engine() loads it
+        with engine.bulk():
+            for key, (title, body) in enumerate(documents):
+                engine.add(('product', key), title, body)
+        return engine
+
+    rows = []
+    for size in (10_000, 100_000):
+        documents = [(words(6), words(80)) for _ in range(size)]
+
+        start = time.perf_counter()
+        engine = build(documents)
+        rows.append((f'{size} docs: build', time.perf_counter() - start, f'{len(engine.postings)} terms'))
+
+        del engine
+        tracemalloc.start()
+        engine = build(documents)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        rows.append((f'{size} docs: index memory', None, f'{memory / size:.0f} bytes per document'))
+
+        queries = itertools.cycle([
+            [rng.choice(vocabulary[:2000]), rng.choice(vocabulary[:200])[:3]] for _ in range(50)
+        ])
+        rows.append((f'{size} docs: 2-term query, prefix last', measure(
+            lambda: engine.search(next(queries), limit=20), options['repeat'] * 5
+        ), 'median'))
+
+        prefixes = itertools.cycle([rng.choice(vocabulary)[:rng.randint(2, 4)] for _ in range(50)])
+
+        rows.append((f'{size} docs: suggest', measure(
+            lambda: engine.suggest(next(prefixes)), options['repeat'] * 5
+        ), 'median'))
+    return rows
+
+
+@scenario('maintenance')
+def maintenance_overhead(options):
+    """
+    Per-request cost of MaintenanceModeMiddleware: the flag check in normal
+    mode, and the precomputed 503 while maintenance is on, against a full
+    pass through the stack to a cheap API view.
+    """
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+
+    from .middleware import MaintenanceModeMiddleware
+    from .models import SiteSettings
+
+    repeat = options['repeat'] * 50
+    request = RequestFactory().get('/api/features/')
+    middleware = MaintenanceModeMiddleware(lambda request: HttpResponse())
+    client = Client()
+    site_settings, _ = SiteSettings.objects.get_or_create(pk=1)
+    rows = []
+
+    for maintenance in (False, True):
+        site_settings.maintenanceMode = maintenance
+        site_settings.save()
+        mode = 'maintenance' if maintenance else 'normal mode'
+        response = middleware(request)
+        assert response.status_code == (503 if maintenance else 200), response.status_code
+        rows.append((f'{mode}: middleware alone', measure(lambda: middleware(request), repeat),
+                     f'status {response.status_code}'))
+        rows.append((f'{mode}: full request', measure(anonymous_request(client, '/api/features/'), options['repeat']),
+                     '/api/features/'))
+    return rows
+
+
+@scenario('ip-allowlist')
+def ip_allowlist_lookup(options):
+    """
+    Lookup cost of the compiled allowedIPs prefix trie against testing each
+    entry in turn, for an allowlist of -n random networks.
+    """
+    import ipaddress
+    import random
+
+    from .ip_allowlist import Allowlist
+
+    rng = random.Random(42)
+    entries = [
+        str(ipaddress.ip_network(f'{ipaddress.IPv4Address(rng.getrandbits(32))}/{rng.randint(16, 32)}', strict=False))
+        for _ in range(options['objects'])
+    ]
+    networks = [ipaddress.ip_network(entry) for entry in entries]
+    allowlist = Allowlist(entries)
+    # An address outside every network: the worst case for the scan
+    outside = '255.255.255.254'
+
+    def linear():
+        address = ipaddress.ip_address(outside)
+        return any(address in network for network in networks)
+
+    repeat = options['repeat'] * 10
+    return [
+        ('linear scan', measure(linear, repeat), f'{len(entries)} networks'),
+        ('prefix trie', measure(lambda: allowlist.allows(outside), repeat), f'{len(entries)} networks'),
+        ('prefix trie, compile', measure(lambda: Allowlist(entries), options['repeat']), 'once per settings change'),
+    ]
+
+
+@scenario('login-flood')
+def login_flood_cost(options):
+    """
+    CPU time of a credential-stuffing flood of -n wrong logins against the
+    login endpoint: from one IP across many usernames, and against one
+    username from many IPs. Without the limiter every attempt costs a
+    password hash; with it, only those before the lock do.
+    """
+    from django.contrib.auth import authenticate
+    from django.contrib.auth.models import User
+
+    User.objects.create_user(username='victim', password='correct horse battery staple')
+    attempts = options['objects']
+    client = Client()
+
+    def hash_cost():
+        authenticate(username='victim', password='wrong')
+
+    def flood(credentials):
+        cache.clear()
+        statuses = {}
+        start = time.process_time()
+        # Every refused attempt would log a warning
+        with log_level('django.request', logging.ERROR), log_level('security', logging.ERROR), \
+                log_level('core.login_limiter', logging.ERROR):
+            for username, ip in credentials:
+                response = client.post('/api/auth/login/', {'username': username, 'password': 'wrong'},
+                                       content_type='application/json', REMOTE_ADDR=ip)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        elapsed = time.process_time() - start
+        return elapsed / attempts, f'{elapsed:.2f}s CPU in total, ' + ', '.join(
+            f'{count} x {code}' for code, count in sorted(statuses.items()))
+
+    start = time.process_time()
+    for _ in range(3):
+        hash_cost()
+    per_hash = (time.process_time() - start) / 3
+
+    rows = [('unprotected, per attempt', per_hash, f'{per_hash * attempts:.2f}s CPU for {attempts} attempts')]
+    seconds, detail = flood((f'user{i}', '203.0.113.7') for i in range(attempts))
+    rows.append(('one IP, many usernames', seconds, detail))
+    seconds, detail = flood(('victim', f'10.0.{i // 256}.{i % 256}') for i in range(attempts))
+    rows.append(('one username, many IPs', seconds, detail))
+    return rows
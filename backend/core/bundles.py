@@ -0,0 +1,109 @@
+"""
+Page bundles: every section a public page needs, assembled in one response.
+
+Each page maps section names (the same names as the individual API endpoints)
+to a queryset and the serializer that endpoint already uses, so a bundle is
+exactly what the frontend would have fetched section by section.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
+
+from .cache import get_model_versions, make_cache_key, register_versioned_models
+from .models import (
+    Product, Solution, NewsArticle, ContactInfo, ContactDescription,
+    HeroSection, Feature, TargetMarket, WhyChooseUs, AboutHero,
+    CompanyOverview, MissionVision, TeamMember, Partner, PartnersDescription,
+    TeamDescription, ProductDescription, SolutionDescription, NewsDescription
+)
+from .serializers import (
+    ProductSerializer, SolutionSerializer, NewsArticleListSerializer,
+    ContactInfoSerializer, ContactDescriptionSerializer, HeroSectionSerializer,
+    FeatureSerializer, TargetMarketSerializer, WhyChooseUsSerializer,
+    AboutHeroSerializer, CompanyOverviewSerializer, MissionVisionSerializer,
+    TeamMemberSerializer, PartnerSerializer, PartnersDescriptionSerializer,
+    TeamDescriptionSerializer, ProductDescriptionSerializer,
+    SolutionDescriptionSerializer, NewsDescriptionSerializer
+)
+
+# page -> {section name: (model or queryset, serializer class)}
+PAGE_BUNDLES = {
+    'home': {
+        'hero-section': (HeroSection, HeroSectionSerializer),
+        'features': (Feature, FeatureSerializer),
+        'target-markets': (TargetMarket, TargetMarketSerializer),
+        'why-choose-us': (WhyChooseUs, WhyChooseUsSerializer),
+    },
+    'about': {
+        'about-hero': (AboutHero, AboutHeroSerializer),
+        'company-overview': (CompanyOverview, CompanyOverviewSerializer),
+        'mission-vision': (MissionVision, MissionVisionSerializer),
+        'team-members': (TeamMember, TeamMemberSerializer),
+        'team-descriptions': (TeamDescription, TeamDescriptionSerializer),
+        'partners': (Partner, PartnerSerializer),
+        'partner-descriptions': (PartnersDescription, PartnersDescriptionSerializer),
+    },
+    'products': {
+        'product-descriptions': (ProductDescription, ProductDescriptionSerializer),
+        'products': (Product, ProductSerializer),
+    },
+    'solutions': {
+        'solution-descriptions': (SolutionDescription, SolutionDescriptionSerializer),
+        'solutions': (Solution, SolutionSerializer),
+    },
+    'news': {
+        'news-descriptions': (NewsDescription, NewsDescriptionSerializer),
+        'news': (NewsArticle.objects.select_related('author').defer('content'), NewsArticleListSerializer),
+    },
+    'contact': {
+        'contact-descriptions': (ContactDescription, ContactDescriptionSerializer),
+        'contact-info': (ContactInfo, ContactInfoSerializer),
+    },
+}
+
+
+def build_bundle(page, request):
+    """
+    Serialize every section of a page.
+
+    Each section costs exactly one query because the bundled serializers
+    resolve their fields (including image URLs) without touching related rows.
+    """
+    context = {'request': request}
+    return {
+        name: serializer_class(source.all() if isinstance(source, QuerySet) else source.objects.all(),
+                               many=True, context=context).data
+        for name, (source, serializer_class) in PAGE_BUNDLES[page].items()
+    }
+
+
+def section_model(source):
+    return source.model if isinstance(source, QuerySet) else source
+
+
+register_versioned_models(*(
+    section_model(source) for sections in PAGE_BUNDLES.values() for source, _ in sections.values()
+))
+
+
+def get_bundle(page, request):
+    """
+    Return the bundle for a page, served from the cache when possible.
+
+    The cache key carries the version of every model in the page, so a write
+    to any of them invalidates the bundle. Image URLs are absolute, so the
+    key also includes the scheme and host the request was made with.
+    """
+    versions = get_model_versions(section_model(source) for source, _ in PAGE_BUNDLES[page].values())
+    key = make_cache_key(
+        f'page-bundle:{page}',
+        sorted((model._meta.label_lower, version) for model, version in versions.items()),
+        request.scheme,
+        request.get_host(),
+    )
+    bundle = cache.get(key)
+    if bundle is None:
+        bundle = build_bundle(page, request)
+        cache.set(key, bundle, getattr(settings, 'PAGE_BUNDLE_CACHE_TIMEOUT', 300))
+    return bundle
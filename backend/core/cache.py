@@ -0,0 +1,149 @@
+"""
+Versioned response caching for the public read-only API.
+
+Every cached model has a version counter in the cache. The counter is bumped
+by post_save/post_delete signals (see core.signals), and the counter is part
+of every cache key built from that model, so a write makes all previously
+cached responses unreachable at once without having to find and delete them.
+
+The counters live in the configured cache backend, so the locmem backend is
+enough for tests and a single process, while deployments running several
+workers should point CACHES at a shared file or Redis backend.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from rest_framework.response import Response
+
+
+# Models whose version counter something reads. Only these are bumped on
+# writes (see CoreConfig.ready): a counter nobody reads is a wasted cache
+# write on every save
+_versioned_models = set()
+
+
+def register_versioned_models(*models):
+    """Declare that cached data is built from these models."""
+    _versioned_models.update(models)
+
+
+def versioned_models():
+    return set(_versioned_models)
+
+
+def _version_key(model):
+    return f'model-version:{model._meta.label_lower}'
+
+
+def get_model_version(model):
+    """Return the current cache version of a model, starting at 1."""
+    key = _version_key(model)
+    cache.add(key, 1, None)
+    return cache.get(key, 1)
+
+
+def get_model_versions(models):
+    """Return {model: version} for several models with a single cache read."""
+    keys = {_version_key(model): model for model in models}
+    found = cache.get_many(keys.keys())
+    versions = {}
+    for key, model in keys.items():
+        if key in found:
+            versions[model] = found[key]
+        else:
+            versions[model] = get_model_version(model)
+    return versions
+
+
+def bump_model_version(model):
+    """Invalidate every cached response built from the given model."""
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The counter was evicted; any value above the initial one will do
+        cache.set(key, 2, None)
+
+
+def make_cache_key(prefix, *parts):
+    """Build a fixed-length cache key from arbitrary (possibly long) parts."""
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'{prefix}:{digest}'
+
+
+class CachedReadMixin:
+    """
+    Serve anonymous list/retrieve responses from pre-rendered JSON bytes.
+
+    The key covers the model version, the negotiated media type and the full
+    URL (image URLs in responses are absolute, so the host matters too).
+    Authenticated requests always go to the database so editors see their
+    own writes and anything permission-dependent is never shared.
+
+    The lookup happens in initial() rather than in list()/retrieve() so that
+    viewsets which override those actions are cached the same way.
+    """
+    cached_actions = ('list', 'retrieve')
+    cached_headers = ('ETag', 'Last-Modified')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, 'queryset', None) is not None:
+            register_versioned_models(cls.queryset.model)
+
+    def get_response_cache_key(self, request):
+        if (self.action not in self.cached_actions
+                or request.method != 'GET'
+                or request.user.is_authenticated):
+            return None
+
+        model = self.queryset.model
+        return make_cache_key(
+            f'api:{model._meta.label_lower}',
+            get_model_version(model),
+            request.accepted_media_type,
+            request.build_absolute_uri(),
+        )
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        self.cached_entry = None
+        self.response_cache_key = self.get_response_cache_key(request)
+        if self.response_cache_key is None:
+            return
+
+        self.cached_entry = cache.get(self.response_cache_key)
+        if self.cached_entry is not None:
+            # Replace the action handler for this request only; dispatch()
+            # looks the handler up after initial() has run
+            response = HttpResponse(
+                self.cached_entry['content'],
+                content_type=self.cached_entry['content_type'],
+            )
+            for header, value in self.cached_entry.get('headers', {}).items():
+                response[header] = value
+            setattr(self, request.method.lower(), lambda *args, **kwargs: response)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        key = getattr(self, 'response_cache_key', None)
+        if key and response.status_code == 200 and isinstance(response, Response):
+            timeout = getattr(settings, 'API_CACHE_TIMEOUT', 600)
+
+            def store(rendered):
+                cache.set(key, {
+                    'content': rendered.content,
+                    'content_type': rendered['Content-Type'],
+                    'headers': {
+                        header: rendered[header]
+                        for header in self.cached_headers if header in rendered
+                    },
+                }, timeout)
+
+            response.add_post_render_callback(store)
+        return response
@@ -0,0 +1,105 @@
+"""
+Conditional GET support (ETag / Last-Modified) for the public API.
+
+Validators are computed from the database without serializing anything:
+a list is described by COUNT(*) and MAX(<timestamp>) over the filtered
+queryset, a single object by its own timestamp. A matching If-None-Match or
+If-Modified-Since is answered with 304 before the action runs.
+
+Lists carry an ETag only. Deleting a row leaves MAX(<timestamp>) where it
+was, so a Last-Modified would let If-Modified-Since clients keep a list
+that has lost items; the ETag also covers the count and the model version.
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+from .cache import get_model_version, register_versioned_models
+
+
+def make_etag(*parts):
+    """Return a strong ETag (quoted) derived from the given parts."""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'"{digest}"'
+
+
+class ConditionalGetMixin:
+    """
+    Emit ETag and Last-Modified on list/retrieve and answer 304 when the
+    client already holds the current representation.
+
+    Combine with CachedReadMixin by listing this mixin first: on a cache hit
+    the validators stored with the cached response are reused, so a
+    revalidation costs no queries at all.
+    """
+    last_modified_field = 'updated_at'
+    conditional_actions = ('list', 'retrieve')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, 'queryset', None) is not None:
+            register_versioned_models(cls.queryset.model)
+
+    def get_response_validators(self, request):
+        """Return (etag, last_modified datetime or None) for this request."""
+        model = self.queryset.model
+        field = self.last_modified_field
+        # The model version also changes when data outside the row that is
+        # part of the representation (e.g. generated image renditions) does
+        variant = (get_model_version(model), request.accepted_media_type, request.build_absolute_uri())
+
+        if self.action == 'list':
+            stats = self.filter_queryset(self.get_queryset()).aggregate(
+                last_modified=Max(field), count=Count('pk')
+            )
+            etag = make_etag(model._meta.label_lower, stats['count'], stats['last_modified'], *variant)
+            # No Last-Modified: it would not move when a row is deleted
+            return etag, None
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        found = list(self.get_queryset().filter(**filter_kwargs).values_list('pk', field)[:1])
+        if not found:
+            return None, None
+        pk, last_modified = found[0]
+        return make_etag(model._meta.label_lower, pk, last_modified, *variant), last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        self.response_validators = None
+        if (self.last_modified_field is None
+                or self.action not in self.conditional_actions
+                or request.method not in ('GET', 'HEAD')):
+            return
+
+        cached = getattr(self, 'cached_entry', None)
+        if cached is not None:
+            headers = cached.get('headers', {})
+            etag = headers.get('ETag')
+            last_modified = parse_http_date_safe(headers.get('Last-Modified', ''))
+        else:
+            etag, last_modified = self.get_response_validators(request)
+            if last_modified is not None:
+                last_modified = int(last_modified.timestamp())
+
+        if etag is None:
+            return
+
+        self.response_validators = (etag, last_modified)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            setattr(self, request.method.lower(), lambda *args, **kwargs: not_modified)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        validators = getattr(self, 'response_validators', None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+
+        return super().finalize_response(request, response, *args, **kwargs)
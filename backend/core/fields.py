@@ -0,0 +1,103 @@
+"""
+Serializer fields shared by the core API.
+"""
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from rest_framework import serializers
+
+from .media import get_media_metadata
+
+
+def get_media_base_url(request):
+    """
+    Return the origin media URLs are prefixed with, or None for relative URLs.
+
+    MEDIA_CDN_URL wins when it is set. Otherwise the scheme and host of the
+    request are resolved once and remembered on the request, so a list of N
+    images parses the Host header once instead of N times.
+    """
+    cdn_url = getattr(settings, 'MEDIA_CDN_URL', '')
+    if cdn_url:
+        return cdn_url.rstrip('/')
+    if request is None:
+        return None
+
+    base_url = getattr(request, '_media_base_url', None)
+    if base_url is None:
+        base_url = request.build_absolute_uri('/').rstrip('/')
+        request._media_base_url = base_url
+    return base_url
+
+
+def build_media_url(request, field_file):
+    """Return the absolute URL of a stored file, or None if there is no file."""
+    if not field_file:
+        return None
+    return absolute_media_url(request, field_file.url)
+
+
+def absolute_media_url(request, url):
+    """Prefix a storage URL with the media base URL of the request."""
+    if url.startswith(('http://', 'https://')):
+        # The storage backend already serves absolute URLs
+        return url
+
+    base_url = get_media_base_url(request)
+    if base_url is None:
+        return url
+    if url.startswith('/'):
+        return f"{base_url}{url}"
+    return f"{base_url}/{url}"
+
+
+class MediaURLField(serializers.Field):
+    """
+    Read-only absolute URL of an image or file field.
+
+        image = MediaURLField()
+        logo = MediaURLField(source='logo')
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return build_media_url(self.context.get('request'), value)
+
+
+def rendition_urls(request, media):
+    """
+    Return {format: {width: url}} for the renditions of a MediaFile, or None
+    if the file was never recorded. Renditions must be prefetched.
+    """
+    if media is None:
+        return None
+
+    urls = {}
+    for rendition in media.renditions.all():
+        urls.setdefault(rendition.format, {})[rendition.width] = absolute_media_url(
+            request, default_storage.url(rendition.name)
+        )
+    return urls
+
+
+class MediaRenditionsField(serializers.Field):
+    """
+    Read-only srcset-ready URL map of the renditions of an image field.
+
+        image_renditions = MediaRenditionsField(source='image')
+
+    Renditions of every image in the serialized list are loaded together
+    (see core.media.get_media_metadata).
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        return rendition_urls(self.context.get('request'), get_media_metadata(self, value))
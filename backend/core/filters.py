@@ -0,0 +1,228 @@
+"""
+Query parameters shared by the public content viewsets (ContentQueryMixin).
+
+    ?fields=id,title,slug          only these fields in each item
+    ?exclude=content               every field but these
+    ?ordering=-published_at,id     sort order
+    ?published_after=2025-01-01    published (or created) at or after
+    ?published_before=2025-02-01   published (or created) before
+    ?slug=access-control           per-field filters: field=value, or
+    ?author__in=1,2                field__<lookup>=value with lookup one of
+    ?published_at__gte=2025-01-01  exact, in, gt, gte, lt, lte, isnull
+
+Filters and ordering are accepted on indexed columns only - the primary
+key, unique and foreign key columns, db_index fields and the leading column
+of each Meta.indexes / unique_together entry - plus a view's own
+filter_fields, so each one becomes a WHERE or ORDER BY clause the database
+can answer from an index. Other parameters are ignored. Views paginated
+by a keyset cursor (core.pagination) have a fixed order and answer
+?ordering= with a 400.
+
+Field selection trims the serializer and loads only the columns the
+remaining fields read, with .only(); a news listing with ?exclude=content
+never reads the article bodies. When a remaining field is computed
+(SerializerMethodField, source='*') its columns are unknown and every
+column is loaded.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+LOOKUPS = ('exact', 'in', 'gt', 'gte', 'lt', 'lte', 'isnull')
+
+# Fields tried, in order, for ?published_after / ?published_before
+PUBLISHED_FIELDS = ('published_at', 'created_at')
+
+
+def indexed_fields(model):
+    """Names of the concrete fields that lead some index of the model's table."""
+    meta = model._meta
+    names = {meta.pk.name}
+    for field in meta.concrete_fields:
+        if field.unique or field.db_index:
+            names.add(field.name)
+    for index in meta.indexes:
+        if index.fields:
+            names.add(index.fields[0].lstrip('-'))
+    for fields in meta.unique_together:
+        names.add(fields[0])
+    return names
+
+
+def filterable_fields(view, model):
+    return indexed_fields(model) | set(getattr(view, 'filter_fields', ()))
+
+
+def published_field(view, model):
+    field = getattr(view, 'published_field', None)
+    if field:
+        return field
+    names = {field.name for field in model._meta.concrete_fields}
+    return next((name for name in PUBLISHED_FIELDS if name in names), None)
+
+
+def parse_value(field, lookup, raw, param):
+    """Convert a query parameter to a filter value for a model field."""
+    if lookup == 'isnull':
+        if raw.lower() in ('true', '1'):
+            return True
+        if raw.lower() in ('false', '0'):
+            return False
+        raise ParseError({'error': f'{param} must be true or false'})
+    if lookup == 'in':
+        return [parse_value(field, 'exact', part, param) for part in raw.split(',') if part]
+
+    target = field.target_field if field.is_relation else field
+    try:
+        value = target.to_python(raw)
+    except DjangoValidationError:
+        raise ParseError({'error': f'Invalid value for {param}: {raw}'})
+    if isinstance(value, datetime) and settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+class ContentFilterBackend(BaseFilterBackend):
+    """Per-field filters and the published_after / published_before range."""
+
+    def filter_queryset(self, request, queryset, view):
+        model = queryset.model
+        allowed = filterable_fields(view, model)
+        filters = {}
+
+        for param, raw in request.query_params.items():
+            name, _, lookup = param.partition('__')
+            lookup = lookup or 'exact'
+            if name not in allowed or lookup not in LOOKUPS:
+                continue
+            filters[f'{name}__{lookup}'] = parse_value(model._meta.get_field(name), lookup, raw, param)
+
+        for param, lookup in (('published_after', 'gte'), ('published_before', 'lt')):
+            raw = request.query_params.get(param)
+            if not raw:
+                continue
+            name = published_field(view, model)
+            if name is None:
+                raise ParseError({'error': f'{param} is not supported here'})
+            filters[f'{name}__{lookup}'] = parse_value(model._meta.get_field(name), lookup, raw, param)
+
+        return queryset.filter(**filters) if filters else queryset
+
+
+class ContentOrderingFilter(OrderingFilter):
+    """?ordering= over the indexed (filterable) fields only."""
+
+    def filter_queryset(self, request, queryset, view):
+        # A keyset paginator orders every page by its own field and would
+        # silently override the requested order
+        if request.query_params.get(self.ordering_param) and getattr(view.paginator, 'ordering_field', None):
+            raise ParseError({'error': f'{self.ordering_param} is not supported here'})
+        return super().filter_queryset(request, queryset, view)
+
+    def get_valid_fields(self, queryset, view, context={}):
+        return [(name, name) for name in sorted(filterable_fields(view, queryset.model))]
+
+
+@lru_cache(maxsize=None)
+def readable_sources(serializer_class):
+    """{field name: model attribute it reads, or None if computed} of a serializer."""
+    fields = serializer_class().fields
+    return {
+        name: field.source_attrs[0] if field.source_attrs else None
+        for name, field in fields.items() if not field.write_only
+    }
+
+
+class ContentQueryMixin:
+    """
+    Viewset mixin adding the query parameters described in this module.
+
+    Views may set filter_fields (extra filterable fields), published_field
+    (the field ?published_after filters on) and required_fields (columns
+    always loaded, e.g. ones read by a custom list()).
+    """
+    filter_backends = [ContentFilterBackend, ContentOrderingFilter]
+    field_selection_actions = ('list', 'retrieve')
+    required_fields = ()
+
+    def selected_field_names(self):
+        """Names of the serializer fields to render, or None for all of them."""
+        request = self.request
+        if request is None or request.method != 'GET' or self.action not in self.field_selection_actions:
+            return None
+        fields = [name for name in request.query_params.get('fields', '').split(',') if name]
+        exclude = [name for name in request.query_params.get('exclude', '').split(',') if name]
+        if not fields and not exclude:
+            return None
+
+        available = readable_sources(self.get_serializer_class())
+        unknown = [name for name in fields + exclude if name not in available]
+        if unknown:
+            raise ParseError({'error': f'Unknown field(s): {", ".join(unknown)}'})
+        return set(fields or available) - set(exclude)
+
+    def selected_columns(self, queryset, names):
+        """Model fields to load for the selected serializer fields, or None for all."""
+        meta = queryset.model._meta
+        sources = readable_sources(self.get_serializer_class())
+        columns = {meta.pk.name, *self.required_fields}
+        for name in names:
+            source = sources[name]
+            if source is None:
+                return None
+            try:
+                field = meta.get_field(source)
+            except FieldDoesNotExist:
+                # A property or method: no telling which columns it reads
+                return None
+            if field.concrete:
+                columns.add(field.name)
+            elif not field.is_relation:
+                return None
+
+        # The keyset paginator reads its ordering field from every page
+        ordering_field = getattr(self.paginator, 'ordering_field', None)
+        if ordering_field:
+            columns.add(ordering_field)
+        # Deferred fields cannot be followed with select_related()
+        if isinstance(queryset.query.select_related, dict):
+            columns.update(queryset.query.select_related)
+        return columns
+
+    def filter_queryset(self, queryset):
+        # Applied here rather than in get_queryset() so that a view's own
+        # select_related()/defer() is already in place
+        queryset = super().filter_queryset(queryset)
+        names = self.selected_field_names()
+        if names is None:
+            return queryset
+        columns = self.selected_columns(queryset, names)
+        return queryset.only(*columns) if columns is not None else queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        names = self.selected_field_names()
+        if names is not None:
+            fields = getattr(serializer, 'child', serializer).fields
+            for name in list(fields):
+                if name not in names:
+                    fields.pop(name)
+        return serializer
+
+    def select_fields(self, data):
+        """
+        Field selection for a custom list() or retrieve() that builds its
+        items without the serializer: data is one item dict or a list of them.
+        """
+        names = self.selected_field_names()
+        if names is None:
+            return data
+        if isinstance(data, list):
+            return [{key: value for key, value in item.items() if key in names} for item in data]
+        return {key: value for key, value in data.items() if key in names}
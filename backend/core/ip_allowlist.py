@@ -0,0 +1,128 @@
+"""
+Client IP resolution and the SiteSettings.allowedIPs allowlist.
+
+client_ip() reads X-Forwarded-For only as far as it was written by proxies
+we run: with TRUSTED_PROXY_COUNT = N, the client is the address N hops
+before REMOTE_ADDR. With N = 0 (the default) the header is ignored, since
+anyone can send it.
+
+The allowlist (single addresses and CIDR networks, IPv4 and IPv6) is
+compiled into a binary prefix trie per address family, so a lookup walks at
+most one node per bit of the longest matching prefix instead of testing
+every entry. It is compiled once per settings version (see
+core.site_settings), not per request.
+"""
+
+import ipaddress
+
+from django.conf import settings
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def client_ip(request):
+    """The address of the client, as seen by the outermost trusted proxy."""
+    remote_addr = request.META.get('REMOTE_ADDR', '')
+    trusted = getattr(settings, 'TRUSTED_PROXY_COUNT', 0)
+    if trusted <= 0:
+        return remote_addr
+
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '')
+    chain = [address.strip() for address in forwarded.split(',') if address.strip()]
+    chain.append(remote_addr)
+    # Each trusted proxy appended the address it received the request from
+    return chain[max(0, len(chain) - 1 - trusted)]
+
+
+def parse_address(value):
+    """An ip_address for a string (IPv4-mapped IPv6 as IPv4), or None."""
+    try:
+        address = ipaddress.ip_address(value.split('%')[0])
+    except ValueError:
+        return None
+    if address.version == 6 and address.ipv4_mapped is not None:
+        return address.ipv4_mapped
+    return address
+
+
+class PrefixTrie:
+    """
+    Binary trie of network prefixes for one address family. Each node is a
+    list [zero child, one child, terminal]; a terminal node ends a network,
+    so every address below it matches.
+    """
+
+    def __init__(self, bits):
+        self.bits = bits
+        self.root = [None, None, False]
+
+    def add(self, network):
+        node = self.root
+        value = int(network.network_address)
+        for depth in range(network.prefixlen):
+            if node[2]:
+                # A shorter network already covers this one
+                return
+            bit = (value >> (self.bits - 1 - depth)) & 1
+            if node[bit] is None:
+                node[bit] = [None, None, False]
+            node = node[bit]
+        node[0] = node[1] = None
+        node[2] = True
+
+    def __contains__(self, address):
+        node = self.root
+        value = int(address)
+        shift = self.bits - 1
+        while node is not None:
+            if node[2]:
+                return True
+            node = node[(value >> shift) & 1]
+            shift -= 1
+        return False
+
+
+class Allowlist:
+    """Compiled allowlist; empty means every address is allowed."""
+
+    def __init__(self, entries):
+        self.tries = {4: PrefixTrie(32), 6: PrefixTrie(128)}
+        self.size = 0
+        for entry in entries or ():
+            try:
+                network = ipaddress.ip_network(str(entry).strip(), strict=False)
+            except ValueError:
+                logger.warning('Ignoring invalid allowedIPs entry', entry=entry)
+                continue
+            if network.version == 6 and network.network_address.ipv4_mapped is not None and network.prefixlen >= 96:
+                network = ipaddress.ip_network(
+                    f'{network.network_address.ipv4_mapped}/{network.prefixlen - 96}', strict=False
+                )
+            self.tries[network.version].add(network)
+            self.size += 1
+
+    def __bool__(self):
+        return self.size > 0
+
+    def allows(self, value):
+        if not self.size:
+            return True
+        address = parse_address(value)
+        return address is not None and address in self.tries[address.version]
+
+
+# (settings instance, Allowlist compiled from it)
+_compiled = (None, None)
+
+
+def allowlist_for(site_settings):
+    """The Allowlist of a settings snapshot, compiled on first use."""
+    global _compiled
+
+    compiled_for, allowlist = _compiled
+    if compiled_for is not site_settings:
+        allowlist = Allowlist(site_settings.allowedIPs)
+        _compiled = (site_settings, allowlist)
+    return allowlist
@@ -0,0 +1,126 @@
+"""
+Structured, level-gated logging for the core app.
+
+    from .logging import get_logger, redact
+
+    logger = get_logger(__name__)
+    logger.debug('Creating product', data=redact(request.data), files=redact(request.FILES))
+
+Keyword arguments become structured fields. Nothing is formatted unless the
+record is actually emitted: the level check happens before the fields are
+touched, and both the message and redact() render lazily, so a disabled debug
+call on a hot path costs one level comparison.
+
+Levels are set through the LOGGING setting ('core' logger, CORE_LOG_LEVEL).
+"""
+
+import logging
+
+# Keys whose values never reach the logs
+SENSITIVE_KEYS = ('password', 'token', 'key', 'secret', 'credential')
+
+
+class StructuredMessage:
+    """A log message with key=value fields, rendered only when formatted."""
+
+    __slots__ = ('message', 'fields')
+
+    def __init__(self, message, fields):
+        self.message = message
+        self.fields = fields
+
+    def __str__(self):
+        if not self.fields:
+            return str(self.message)
+        rendered = ' '.join(f'{key}={value}' for key, value in self.fields.items())
+        return f'{self.message} {rendered}'
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """Logger adapter turning keyword arguments into structured fields."""
+
+    def __init__(self, logger):
+        super().__init__(logger, {})
+
+    def log(self, level, msg, *args, exc_info=None, stack_info=False, stacklevel=1, **fields):
+        # LoggerAdapter.log() calls process() only after the level check, so
+        # disabled calls return here without building anything
+        if not self.isEnabledFor(level):
+            return
+        self.logger.log(
+            level, StructuredMessage(msg, fields), *args,
+            exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel + 2,
+            extra={'fields': fields},
+        )
+
+    def debug(self, msg, *args, **kwargs):
+        self.log(logging.DEBUG, msg, *args, **kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        self.log(logging.INFO, msg, *args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        self.log(logging.WARNING, msg, *args, **kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        self.log(logging.ERROR, msg, *args, **kwargs)
+
+    def exception(self, msg, *args, exc_info=True, **kwargs):
+        self.log(logging.ERROR, msg, *args, exc_info=exc_info, **kwargs)
+
+    def critical(self, msg, *args, **kwargs):
+        self.log(logging.CRITICAL, msg, *args, **kwargs)
+
+
+def get_logger(name):
+    """Return the structured logger for a module (pass __name__)."""
+    return StructuredLogger(logging.getLogger(name))
+
+
+class Redacted:
+    """
+    Lazy, redacted summary of request data, uploaded files or a single file.
+
+    Sensitive keys are masked and uploaded files are reduced to their name,
+    size and content type, so request.data can be logged without dumping
+    credentials or file contents. Nothing is inspected until rendered.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    @staticmethod
+    def _value(value):
+        if hasattr(value, 'size') and hasattr(value, 'name'):
+            content_type = getattr(value, 'content_type', None) or 'unknown'
+            return f'<{value.name} {value.size} bytes {content_type}>'
+        return value
+
+    def __str__(self):
+        data = self.data
+        if data is None:
+            return 'None'
+        if hasattr(data, 'size') and hasattr(data, 'name'):
+            return self._value(data)
+        if not hasattr(data, 'keys'):
+            return repr(data)
+
+        summary = {}
+        for key in data.keys():
+            if any(sensitive in key.lower() for sensitive in SENSITIVE_KEYS):
+                summary[key] = '[REDACTED]'
+            elif hasattr(data, 'getlist'):
+                values = [self._value(value) for value in data.getlist(key)]
+                summary[key] = values[0] if len(values) == 1 else values
+            else:
+                summary[key] = self._value(data[key])
+        return repr(summary)
+
+    __repr__ = __str__
+
+
+def redact(data):
+    """Wrap request data or files for logging; see Redacted."""
+    return Redacted(data)
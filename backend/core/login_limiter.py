@@ -0,0 +1,118 @@
+"""
+Brute-force protection for LoginView.
+
+Failed logins are counted per username and per client IP in the shared
+cache, over a sliding window of LOGIN_WINDOW_SECONDS (approximated from the
+current and previous fixed windows, weighted by how far into the current
+one we are). A username is locked after SiteSettings.maxLoginAttempts
+failures in the window, an IP after LOGIN_MAX_ATTEMPTS_PER_IP.
+
+Each lock lasts LOGIN_LOCKOUT_SECONDS, doubling with every further lock of
+the same username or IP within a day, up to LOGIN_LOCKOUT_MAX_SECONDS. A
+locked login is refused before authenticate() runs, so a flood of guesses
+costs one cache read each instead of a password hash.
+
+unlock() (UserViewSet.unlock_login, `manage.py unlock_login`) lifts a lock
+and forgets the failures.
+"""
+
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .logging import get_logger
+from .site_settings import get_site_settings
+
+logger = get_logger(__name__)
+
+# Lock escalation is remembered for this long
+STRIKE_TTL = 24 * 60 * 60
+
+
+def _identities(username, ip):
+    """(kind, cache-safe identifier) pairs a login attempt is counted under."""
+    identities = []
+    if username:
+        identities.append(('user', hashlib.sha256(username.strip().lower().encode('utf-8')).hexdigest()))
+    if ip:
+        identities.append(('ip', ip))
+    return identities
+
+
+def _limit(kind):
+    if kind == 'user':
+        return get_site_settings().maxLoginAttempts
+    return getattr(settings, 'LOGIN_MAX_ATTEMPTS_PER_IP', 50)
+
+
+def _window():
+    return getattr(settings, 'LOGIN_WINDOW_SECONDS', 900)
+
+
+def _increment(key, timeout):
+    if cache.add(key, 1, timeout):
+        return 1
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Expired between add() and incr()
+        cache.set(key, 1, timeout)
+        return 1
+
+
+def locked_for(username, ip):
+    """Seconds until a login for this username from this IP is allowed again; 0 if it is."""
+    keys = [f'login-lock:{kind}:{ident}' for kind, ident in _identities(username, ip)]
+    until = max(cache.get_many(keys).values(), default=0)
+    return max(0, math.ceil(until - time.time()))
+
+
+def record_failure(username, ip):
+    """Count a failed login; lock the username or IP once over its limit."""
+    window = _window()
+    now = time.time()
+    index = int(now // window)
+    weight = 1 - (now % window) / window
+
+    for kind, ident in _identities(username, ip):
+        limit = _limit(kind)
+        if not limit or limit <= 0:
+            continue
+        current = _increment(f'login-fail:{kind}:{ident}:{index}', window * 2)
+        previous = cache.get(f'login-fail:{kind}:{ident}:{index - 1}', 0)
+        if current + previous * weight >= limit:
+            _lock(kind, ident)
+
+
+def _lock(kind, ident):
+    strikes = _increment(f'login-strikes:{kind}:{ident}', STRIKE_TTL)
+    base = getattr(settings, 'LOGIN_LOCKOUT_SECONDS', 60)
+    duration = min(base * 2 ** (strikes - 1), getattr(settings, 'LOGIN_LOCKOUT_MAX_SECONDS', 3600))
+    cache.set(f'login-lock:{kind}:{ident}', time.time() + duration, duration)
+    logger.warning('Login locked', kind=kind, identity=ident if kind == 'ip' else ident[:12],
+                   seconds=duration, strikes=strikes)
+
+
+def _forget(kind, ident):
+    index = int(time.time() // _window())
+    cache.delete_many([
+        f'login-lock:{kind}:{ident}',
+        f'login-strikes:{kind}:{ident}',
+        f'login-fail:{kind}:{ident}:{index}',
+        f'login-fail:{kind}:{ident}:{index - 1}',
+    ])
+
+
+def record_success(username):
+    """Forget a username's failures after it logged in; IP counts are kept."""
+    for kind, ident in _identities(username, None):
+        _forget(kind, ident)
+
+
+def unlock(username=None, ip=None):
+    """Lift the lock of a username and/or IP and forget their failures."""
+    for kind, ident in _identities(username, ip):
+        _forget(kind, ident)
@@ -0,0 +1,82 @@
+import gzip
+import json
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.activity import rebuild_rollups, start_of_day
+from core.models import Activity
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves Activity rows older than the retention period to a gzipped JSONL file, '
+        'after rolling up their days so dashboard counts are kept'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than', type=int, default=getattr(settings, 'ACTIVITY_RETENTION_DAYS', 365),
+            help='Archive rows from days more than this many days ago',
+        )
+        parser.add_argument(
+            '--output-dir', default=getattr(settings, 'ACTIVITY_ARCHIVE_DIR', os.path.join(settings.BASE_DIR, 'activity_archive')),
+            help='Directory the archive files are written to',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows read and deleted at a time')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would be archived')
+
+    def handle(self, *args, **options):
+        # Whole days only, so a rolled up day never loses part of its rows
+        cutoff_day = timezone.localdate() - timedelta(days=options['older_than'])
+        expired = Activity.objects.filter(timestamp__lt=start_of_day(cutoff_day))
+
+        oldest = expired.order_by('timestamp').values_list('timestamp', flat=True).first()
+        if oldest is None:
+            self.stdout.write(self.style.SUCCESS('No activity to archive'))
+            return
+        first_day = timezone.localtime(oldest).date()
+
+        if options['dry_run']:
+            self.stdout.write(f'Would archive {expired.count()} row(s) from {first_day} through {cutoff_day - timedelta(days=1)}')
+            return
+
+        rebuild_rollups(first_day, cutoff_day)
+
+        os.makedirs(options['output_dir'], exist_ok=True)
+        name = f'activity-{first_day:%Y%m%d}-{cutoff_day - timedelta(days=1):%Y%m%d}-{timezone.now():%Y%m%d%H%M%S}.jsonl.gz'
+        path = os.path.join(options['output_dir'], name)
+        written, last_pk = self.write_archive(expired, path + '.tmp', options['batch_size'])
+        os.replace(path + '.tmp', path)
+
+        # Only rows that made it into the file; anything older that arrived
+        # meanwhile (e.g. replayed from the spool) waits for the next run
+        deleted = 0
+        archived = expired.filter(pk__lte=last_pk).order_by('pk')
+        while True:
+            pks = list(archived.values_list('pk', flat=True)[:options['batch_size']])
+            if not pks:
+                break
+            deleted += Activity.objects.filter(pk__in=pks).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(f'Archived {written} row(s) to {path}; deleted {deleted}'))
+
+    def write_archive(self, queryset, path, batch_size):
+        """Stream the rows to a gzipped JSONL file in primary key order."""
+        written = last_pk = 0
+        fields = ('id', 'user_id', 'action', 'content_type', 'object_id', 'details', 'timestamp')
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            while True:
+                rows = list(queryset.filter(pk__gt=last_pk).order_by('pk').values(*fields, username=F('user__username'))[:batch_size])
+                if not rows:
+                    break
+                for row in rows:
+                    row['timestamp'] = row['timestamp'].isoformat()
+                    file.write(json.dumps(row) + '\n')
+                written += len(rows)
+                last_pk = rows[-1]['id']
+        return written, last_pk
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from core.media import record_file, stored_image_files
+from core.models import MediaFile
+from core.renditions import generate_renditions
+
+
+class Command(BaseCommand):
+    help = 'Generates responsive renditions for existing media (records unrecorded images first)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate renditions that already exist')
+
+    def handle(self, *args, **options):
+        # Renditions are generated below, in this process, rather than queued
+        known = set(MediaFile.objects.values_list('name', flat=True))
+        recorded = 0
+        for field_file in stored_image_files():
+            if field_file.name not in known:
+                record_file(field_file, renditions=False)
+                known.add(field_file.name)
+                recorded += 1
+
+        queryset = MediaFile.objects.filter(exists=True, width__isnull=False)
+        if not options['force']:
+            queryset = queryset.annotate(rendition_count=Count('renditions')).filter(rendition_count=0)
+
+        generated = 0
+        for media in list(queryset):
+            generated += generate_renditions(media)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Recorded {recorded} new media file(s), generated {generated} rendition(s)'
+        ))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from core.benchmarks import SCENARIOS
+
+
+class Command(BaseCommand):
+    help = 'Runs the API benchmark scenarios against a throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*', help=f'Scenarios to run (default: all of {", ".join(sorted(SCENARIOS))})')
+        parser.add_argument('-n', '--objects', type=int, default=200, help='Number of objects to seed per model')
+        parser.add_argument('-r', '--repeat', type=int, default=20, help='Number of timed runs per measurement')
+
+    def handle(self, *args, **options):
+        names = options['scenarios'] or sorted(SCENARIOS)
+        unknown = [name for name in names if name not in SCENARIOS]
+        if unknown:
+            raise CommandError(f'Unknown scenario(s): {", ".join(unknown)}')
+
+        # Never touch the real database: every run seeds a fresh test database
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            for name in names:
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{name}:'))
+                for label, seconds, detail in SCENARIOS[name](options):
+                    timing = f'{seconds * 1e6:>12.1f} us' if seconds is not None else ''
+                    self.stdout.write(f'  {label:<40} {timing:>15}  {detail}')
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
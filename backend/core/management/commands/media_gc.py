@@ -0,0 +1,137 @@
+import os
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from core.models import MediaFile, MediaRendition
+from core.storage import BLOB_PREFIX
+
+
+class Command(BaseCommand):
+    help = (
+        'Recounts the references to stored media across every ImageField and deletes '
+        'files (and their renditions) that nothing uses any more'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be deleted without deleting it')
+        parser.add_argument(
+            '--min-age', type=float, default=24,
+            help='Only reclaim files older than this many hours, so uploads still being saved are never touched',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        cutoff = timezone.now() - timedelta(hours=options['min_age'])
+
+        references = self.count_references()
+        self.sync_ref_counts(references)
+
+        # Rows nobody references: drop them, their renditions go with them
+        orphans = MediaFile.objects.filter(ref_count=0, created_at__lt=cutoff)
+        orphan_count = orphans.count()
+        if not dry_run:
+            orphans.delete()
+
+        keep = set(references)
+        keep.update(MediaFile.objects.filter(created_at__gte=cutoff).values_list('name', flat=True))
+        renditions = MediaRendition.objects.all()
+        if dry_run:
+            renditions = renditions.exclude(media__in=orphans)
+        keep.update(renditions.values_list('name', flat=True))
+
+        deleted = reclaimed = 0
+        purge = getattr(default_storage, 'purge', default_storage.delete)
+        for name in self.stored_names():
+            if name in keep or default_storage.get_modified_time(name) >= cutoff:
+                continue
+            # `keep` was computed before the walk: an upload may have reused
+            # the blob since (touching it, see ContentAddressedStorage._save)
+            # and a row may point at it by now
+            if self.is_referenced(name, cutoff):
+                continue
+            size = default_storage.size(name)
+            self.stdout.write(f'{"Would delete" if dry_run else "Deleting"} {name} ({size} bytes)')
+            if not dry_run:
+                purge(name)
+            deleted += 1
+            reclaimed += size
+
+        verb = 'Would reclaim' if dry_run else 'Reclaimed'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {deleted} file(s), {reclaimed} bytes; {orphan_count} unreferenced media record(s)'
+        ))
+
+    def image_fields(self):
+        """Yield (model, field) for every ImageField of every model."""
+        for model in apps.get_models():
+            for field in model._meta.get_fields():
+                if isinstance(field, models.ImageField):
+                    yield model, field
+
+    def count_references(self):
+        """Return a Counter of the stored names used by every ImageField of every model."""
+        references = Counter()
+        for model, field in self.image_fields():
+            names = model._default_manager.exclude(**{field.name: ''}).exclude(**{f'{field.name}__isnull': True})
+            references.update(names.values_list(field.name, flat=True).iterator())
+        return references
+
+    def is_referenced(self, name, cutoff):
+        """Check the database, as it is now, for anything still using a stored name."""
+        if MediaRendition.objects.filter(name=name).exists():
+            return True
+        if MediaFile.objects.filter(name=name).filter(
+            models.Q(ref_count__gt=0) | models.Q(created_at__gte=cutoff)
+        ).exists():
+            return True
+        return any(
+            model._default_manager.filter(**{field.name: name}).exists()
+            for model, field in self.image_fields()
+        )
+
+    def sync_ref_counts(self, references):
+        """Correct MediaFile.ref_count wherever it drifted from the actual references."""
+        stale = []
+        for media in MediaFile.objects.only('pk', 'name', 'ref_count').iterator():
+            count = references.get(media.name, 0)
+            if media.ref_count != count:
+                media.ref_count = count
+                stale.append(media)
+        MediaFile.objects.bulk_update(stale, ['ref_count'], batch_size=500)
+        if stale:
+            self.stdout.write(f'Corrected the reference count of {len(stale)} media file(s)')
+
+    def stored_names(self):
+        """
+        Yield the name of every file under the directories media is written
+        to: the blob store, renditions and the upload_to of each ImageField.
+        Anything else in the storage is left alone.
+        """
+        roots = {BLOB_PREFIX, 'renditions/'}
+        for model, field in self.image_fields():
+            if isinstance(field.upload_to, str):
+                # Up to the first strftime placeholder, e.g. photos/%Y/ -> photos/
+                root = field.upload_to.split('%')[0].strip('/')
+                if root:
+                    roots.add(f'{root}/')
+        for root in sorted(roots):
+            # products/ already covers products/hero/
+            if any(root != other and root.startswith(other) for other in roots):
+                continue
+            if default_storage.exists(root.rstrip('/')):
+                yield from self.walk(root.rstrip('/'))
+
+    def walk(self, path):
+        directories, files = default_storage.listdir(path)
+        for name in files:
+            # Skip in-progress writes of ContentAddressedStorage
+            if not name.startswith('.'):
+                yield os.path.join(path, name)
+        for directory in directories:
+            yield from self.walk(os.path.join(path, directory))
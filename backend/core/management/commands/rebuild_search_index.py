@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.search import rebuild_index, search_backend
+
+
+class Command(BaseCommand):
+    help = 'Re-creates the search documents of every product, solution and news article'
+
+    def handle(self, *args, **options):
+        count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} document(s) ({search_backend()} backend)'))
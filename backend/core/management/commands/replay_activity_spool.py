@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.activity import replay_spool, spool_path
+
+
+class Command(BaseCommand):
+    help = 'Inserts Activity rows that were spooled to disk because the database could not take them'
+
+    def handle(self, *args, **options):
+        written = replay_spool()
+        self.stdout.write(self.style.SUCCESS(f'Replayed {written} spooled activity row(s) from {spool_path()}'))
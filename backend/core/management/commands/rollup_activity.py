@@ -0,0 +1,24 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.activity import rebuild_rollups, recent_days
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the daily activity rollups (actions per user, content type and day) from the raw Activity rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=2, help='Rebuild the last N days including today')
+        parser.add_argument('--since', help='Rebuild every day from this date (YYYY-MM-DD) up to today')
+
+    def handle(self, *args, **options):
+        start, end = recent_days(options['days'])
+        if options['since']:
+            try:
+                start = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError('--since must be a date in YYYY-MM-DD format')
+
+        count = rebuild_rollups(start, end)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} rollup row(s) from {start} through {end - timedelta(days=1)}'))
@@ -0,0 +1,67 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.media_jobs import claim_jobs, heartbeat, init_worker_process, requeue_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = 'Processes queued media jobs (image renditions) in a pool of worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help='Number of worker processes')
+        parser.add_argument('--poll', type=float, default=2.0, help='Seconds to wait when the queue is empty')
+        parser.add_argument(
+            '--stale-after', type=int, default=600,
+            help="Requeue other workers' jobs that have shown no sign of life for this many seconds",
+        )
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty instead of polling')
+
+    def handle(self, *args, **options):
+        processes = max(1, options['processes'])
+        # Children must open their own database connections
+        connections.close_all()
+
+        if settings.CACHES['default']['BACKEND'].endswith('.LocMemCache'):
+            # Cache versions bumped here would never reach the web processes
+            self.stderr.write(self.style.WARNING(
+                'CACHES uses the per-process locmem backend: the API keeps serving cached responses '
+                'without new renditions until they expire. Set CACHE_BACKEND to a shared backend.'
+            ))
+
+        self.stdout.write(f'Media worker started with {processes} process(es)')
+        running = {}
+        with ProcessPoolExecutor(max_workers=processes, initializer=init_worker_process) as pool:
+            try:
+                while True:
+                    heartbeat(list(running.values()))
+                    requeue_stale_jobs(options['stale_after'], exclude=running.values())
+
+                    # Keep every process busy, but claim no more than can start now
+                    for job_id in claim_jobs(processes - len(running)):
+                        running[pool.submit(run_job, job_id)] = job_id
+
+                    if not running:
+                        if options['once']:
+                            break
+                        time.sleep(options['poll'])
+                        continue
+
+                    done, _ = wait(running, timeout=options['poll'], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job_id = running.pop(future)
+                        try:
+                            status = future.result()
+                        except Exception as e:
+                            # The job could not even record its own failure
+                            # (e.g. the process died); --stale-after requeues it
+                            self.stderr.write(self.style.ERROR(f'Job {job_id} crashed: {e}'))
+                        else:
+                            style = self.style.SUCCESS if status == 'done' else self.style.WARNING
+                            self.stdout.write(style(f'Job {job_id}: {status}'))
+            except KeyboardInterrupt:
+                self.stdout.write('Stopping; waiting for running jobs to finish')
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.login_limiter import unlock
+
+
+class Command(BaseCommand):
+    help = 'Lifts the brute-force login lock of a username and/or client IP'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', help='Username whose logins to unlock')
+        parser.add_argument('--ip', help='Client IP address to unlock')
+
+    def handle(self, *args, **options):
+        if not options['username'] and not options['ip']:
+            raise CommandError('Give --username, --ip or both')
+        unlock(username=options['username'], ip=options['ip'])
+        unlocked = ', '.join(value for value in (options['username'], options['ip']) if value)
+        self.stdout.write(self.style.SUCCESS(f'Unlocked logins for {unlocked}'))
@@ -0,0 +1,63 @@
+import time
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.media import inspect_file, record_file, stored_image_files
+from core.models import MediaFile
+
+
+class Command(BaseCommand):
+    help = (
+        'Re-checks recorded media files (existence, size, hash, dimensions) against the storage. '
+        'Run it from cron, or keep it running with --every.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backfill', action='store_true', help='Also record images that have no metadata yet')
+        parser.add_argument('--older-than', type=float, default=0, help='Only re-check files last checked more than this many hours ago')
+        parser.add_argument('--every', type=int, default=0, help='Repeat the check every N seconds instead of exiting')
+
+    def handle(self, *args, **options):
+        while True:
+            if options['backfill']:
+                self.backfill()
+            self.verify(options['older_than'])
+
+            if not options['every']:
+                break
+            time.sleep(options['every'])
+
+    def backfill(self):
+        recorded = 0
+        known = set(MediaFile.objects.values_list('name', flat=True))
+        for field_file in stored_image_files():
+            if field_file.name not in known:
+                record_file(field_file)
+                known.add(field_file.name)
+                recorded += 1
+        self.stdout.write(self.style.SUCCESS(f'Recorded {recorded} new media file(s)'))
+
+    def verify(self, older_than):
+        queryset = MediaFile.objects.all()
+        if older_than:
+            queryset = queryset.filter(checked_at__lt=timezone.now() - timedelta(hours=older_than))
+
+        checked = missing = changed = 0
+        for media in queryset.iterator():
+            values = inspect_file(default_storage, media.name)
+            checked += 1
+            if not values['exists']:
+                missing += 1
+                if media.exists:
+                    self.stdout.write(self.style.WARNING(f'Missing: {media.name}'))
+            elif media.sha256 and values['sha256'] != media.sha256:
+                changed += 1
+                self.stdout.write(self.style.WARNING(f'Content changed: {media.name}'))
+
+            MediaFile.objects.filter(pk=media.pk).update(**values)
+
+        style = self.style.WARNING if missing or changed else self.style.SUCCESS
+        self.stdout.write(style(f'Checked {checked} media file(s): {missing} missing, {changed} changed'))
@@ -0,0 +1,205 @@
+"""
+Media integrity metadata.
+
+Existence, byte size, SHA-256 and pixel dimensions of every uploaded image
+are recorded in MediaFile when the owning row is saved, so the read path only
+ever looks them up (once per serialized list) instead of touching the
+storage backend per object. The verify_media command re-checks the files.
+Responsive derivatives are queued at the same time (see core.renditions and
+core.media_jobs), and MediaFile.ref_count follows the image fields that use
+each file, so shared content-addressed blobs (core.storage) can be garbage
+collected by media_gc.
+"""
+
+import hashlib
+from collections import Counter
+
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+from PIL import Image
+
+from .logging import get_logger
+from .models import MediaFile
+from .media_jobs import enqueue_renditions
+
+logger = get_logger(__name__)
+
+
+def image_field_names(model):
+    """Return the names of the ImageFields of a model."""
+    return [field.name for field in model._meta.get_fields() if isinstance(field, models.ImageField)]
+
+
+def inspect_file(storage, name):
+    """
+    Read a stored file once and return its MediaFile field values.
+
+    Missing or unreadable files are reported with exists=False rather than
+    raising, so callers can record the state and move on.
+    """
+    values = {'exists': False, 'size': None, 'sha256': '', 'width': None, 'height': None,
+              'checked_at': timezone.now()}
+    try:
+        with storage.open(name, 'rb') as file:
+            digest = hashlib.sha256()
+            size = 0
+            for chunk in file.chunks():
+                digest.update(chunk)
+                size += len(chunk)
+
+            file.seek(0)
+            try:
+                with Image.open(file) as image:
+                    values['width'], values['height'] = image.size
+            except Exception:
+                logger.warning('Stored media is not a readable image', name=name)
+    except (OSError, ValueError):
+        logger.warning('Stored media could not be read', name=name)
+        return values
+
+    values.update(exists=True, size=size, sha256=digest.hexdigest())
+    return values
+
+
+def record_file(field_file, renditions=True):
+    """
+    Inspect a stored file, create or refresh its MediaFile row and queue the
+    generation of its responsive renditions (see core.media_jobs).
+    """
+    values = inspect_file(field_file.storage, field_file.name)
+    media, _ = MediaFile.objects.update_or_create(name=field_file.name, defaults=values)
+    if renditions and media.exists and media.width:
+        enqueue_renditions(media)
+    return media
+
+
+def stored_image_files():
+    """Yield the FieldFile of every non-empty image field of the core models."""
+    from django.apps import apps
+
+    for model in apps.get_app_config('core').get_models():
+        for field_name in image_field_names(model):
+            queryset = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+            for obj in queryset.only('pk', field_name).iterator():
+                yield getattr(obj, field_name)
+
+
+def snapshot_media_names(instance):
+    """
+    Remember the image names stored for an instance before it is saved, so
+    the save can tell which references it added or dropped. Read from the
+    database rather than kept from when the instance was loaded: only writes
+    pay for it, with one query for rows that already exist.
+    """
+    field_names = image_field_names(type(instance))
+    stored = None
+    if not instance._state.adding and instance.pk is not None:
+        stored = type(instance)._base_manager.filter(pk=instance.pk).values(*field_names).first()
+    instance._media_names = {name: value or '' for name, value in (stored or {}).items()}
+
+
+def record_instance_media(instance):
+    """
+    Record metadata for the images of a saved instance and update the
+    reference counts of the files it started or stopped using.
+
+    Files that already have a MediaFile row are left alone (a re-upload always
+    gets a new storage name), so a save that does not touch the images costs a
+    single query.
+    """
+    previous = getattr(instance, '_media_names', {})
+    current = {name: getattr(instance, name).name or '' for name in image_field_names(type(instance))}
+
+    added = [name for field, name in current.items() if name and previous.get(field) != name]
+    removed = [name for field, name in previous.items() if name and current.get(field) != name]
+
+    files = [
+        getattr(instance, name) for name in image_field_names(type(instance))
+        if getattr(instance, name)
+    ]
+    if files:
+        known = set(MediaFile.objects.filter(name__in=[file.name for file in files]).values_list('name', flat=True))
+        for file in files:
+            if file.name not in known:
+                record_file(file)
+
+    change_ref_counts(added, 1)
+    change_ref_counts(removed, -1)
+
+
+def release_instance_media(instance):
+    """Drop the references a deleted instance held on its images."""
+    change_ref_counts([
+        getattr(instance, name).name for name in image_field_names(type(instance))
+        if getattr(instance, name)
+    ], -1)
+
+
+def change_ref_counts(names, delta):
+    """
+    Adjust MediaFile.ref_count by `delta` for each occurrence of a name.
+
+    The counts are kept up to date cheaply at write time; media_gc recounts
+    them from the image fields before reclaiming anything, which corrects
+    drift from bulk updates or raw SQL.
+    """
+    for name, count in Counter(names).items():
+        queryset = MediaFile.objects.filter(name=name)
+        if delta < 0:
+            queryset = queryset.filter(ref_count__gte=count)
+        queryset.update(ref_count=F('ref_count') + delta * count)
+
+
+def get_media_metadata(serializer, field_file):
+    """
+    Return the MediaFile for a field file, or None if it was never recorded.
+
+    The rows (and their renditions) for every image in the root serializer's
+    instance(s) are fetched the first time and kept on the root serializer,
+    so a list of N objects costs two queries, not N.
+    """
+    if not field_file:
+        return None
+
+    root = serializer.root
+    index = getattr(root, '_media_index', None)
+    if index is None:
+        instances = root.instance
+        if instances is None:
+            instances = []
+        elif isinstance(instances, models.Model):
+            instances = [instances]
+
+        names = {
+            getattr(obj, name).name
+            for obj in instances
+            for name in image_field_names(type(obj))
+            if getattr(obj, name)
+        }
+        names.add(field_file.name)
+        index = load_media_index(names)
+        root._media_index = index
+    return index.get(field_file.name)
+
+
+def load_media_index(names):
+    """Return {name: MediaFile} (renditions prefetched) for the given names."""
+    names = {name for name in names if name}
+    if not names:
+        return {}
+    queryset = MediaFile.objects.filter(name__in=names).prefetch_related('renditions')
+    return {media.name: media for media in queryset}
+
+
+def media_metadata_dict(media):
+    """Serialize a MediaFile (or None) for API responses."""
+    if media is None:
+        return None
+    return {
+        'exists': media.exists,
+        'size': media.size,
+        'sha256': media.sha256 or None,
+        'width': media.width,
+        'height': media.height,
+    }
@@ -0,0 +1,138 @@
+"""
+DB-backed queue for background media processing.
+
+Uploads only record the file and enqueue a MediaJob; run_media_worker claims
+jobs and runs them in a process pool, so decoding and resizing never blocks
+a web worker. Jobs are claimed with a conditional UPDATE (status='pending'
+-> 'running'), which is safe with several workers on any database backend.
+"""
+
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, models
+from django.utils import timezone
+
+from .cache import bump_model_version
+from .logging import get_logger
+from .models import MediaJob
+from .renditions import generate_renditions
+
+logger = get_logger(__name__)
+
+# Seconds before the first retry; doubled for every further attempt
+RETRY_DELAY = 30
+
+
+def enqueue_renditions(media):
+    """
+    Queue rendition generation for a MediaFile, unless a job for it is already
+    waiting. Runs inline when MEDIA_RENDITIONS_ASYNC is off.
+    """
+    if not getattr(settings, 'MEDIA_RENDITIONS_ASYNC', True):
+        generate_renditions(media)
+        return None
+
+    job = MediaJob.objects.filter(media=media, kind='renditions', status__in=('pending', 'running')).first()
+    if job is None:
+        job = MediaJob.objects.create(media=media, kind='renditions', available_at=timezone.now())
+    return job
+
+
+def claim_jobs(limit):
+    """Atomically take up to `limit` available pending jobs; return their ids."""
+    now = timezone.now()
+    candidates = MediaJob.objects.filter(status='pending', available_at__lte=now).order_by('available_at', 'pk')
+    claimed = []
+    for pk in candidates.values_list('pk', flat=True)[:limit]:
+        # Another worker may have claimed the job in between
+        if MediaJob.objects.filter(pk=pk, status='pending').update(status='running', started_at=now, updated_at=now):
+            claimed.append(pk)
+    return claimed
+
+
+def heartbeat(job_ids):
+    """Mark jobs still running in this worker as alive, so no worker requeues them."""
+    if job_ids:
+        MediaJob.objects.filter(pk__in=job_ids, status='running').update(updated_at=timezone.now())
+
+
+def requeue_stale_jobs(timeout, exclude=()):
+    """
+    Put back jobs left 'running' by a worker that died: jobs with no
+    heartbeat (or progress update) for more than `timeout` seconds. `exclude`
+    is the caller's own in-flight jobs, which are alive however long they take.
+    """
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    stale = MediaJob.objects.filter(status='running', updated_at__lt=cutoff).exclude(pk__in=list(exclude))
+    return stale.update(status='pending', available_at=timezone.now(), updated_at=timezone.now())
+
+
+def init_worker_process():
+    """
+    Process pool initializer: children must not share the parent's database
+    connections, and need Django set up when the pool spawns instead of forks.
+    """
+    import django
+
+    if not apps.ready:
+        django.setup()
+    connections.close_all()
+
+
+def run_job(job_id):
+    """
+    Run one claimed job. Executed in a pool process; returns the final status.
+
+    Failures are retried with exponential backoff until max_attempts is
+    reached, after which the job is marked failed with the last error.
+    """
+    job = MediaJob.objects.select_related('media').get(pk=job_id)
+
+    def progress(done, total):
+        MediaJob.objects.filter(pk=job.pk).update(progress=done * 100 // total, updated_at=timezone.now())
+
+    try:
+        if job.kind == 'renditions':
+            generate_renditions(job.media, progress=progress, fail_silently=False)
+        else:
+            raise ValueError(f'Unknown job kind: {job.kind}')
+    except Exception as e:
+        attempts = job.attempts + 1
+        now = timezone.now()
+        if attempts < job.max_attempts:
+            status = 'pending'
+            available_at = now + timedelta(seconds=RETRY_DELAY * 2 ** (attempts - 1))
+        else:
+            status = 'failed'
+            available_at = job.available_at
+        logger.exception('Media job failed', job=job.pk, attempts=attempts, status=status)
+        MediaJob.objects.filter(pk=job.pk).update(
+            status=status, attempts=attempts, error=f'{type(e).__name__}: {e}',
+            available_at=available_at, finished_at=now if status == 'failed' else None, updated_at=now,
+        )
+        return status
+
+    now = timezone.now()
+    MediaJob.objects.filter(pk=job.pk).update(
+        status='done', progress=100, attempts=job.attempts + 1, error='', finished_at=now, updated_at=now
+    )
+    invalidate_image_models()
+    return 'done'
+
+
+def invalidate_image_models():
+    """
+    Bump the cache version of every model with an image field, so cached
+    responses and ETags pick up renditions that appeared after the row was
+    saved. Uploads are rare, so this coarse invalidation is cheap.
+
+    The bump is made in the worker process, so the web processes only see it
+    through a shared cache backend (see CACHES in settings); with the
+    per-process locmem cache they keep serving responses without the new
+    renditions until API_CACHE_TIMEOUT. run_media_worker warns about this.
+    """
+    for model in apps.get_app_config('core').get_models():
+        if any(isinstance(field, models.ImageField) for field in model._meta.get_fields()):
+            bump_model_version(model)
@@ -0,0 +1,206 @@
+"""
+Serving of uploaded media.
+
+serve_media answers conditional requests (If-None-Match, If-Modified-Since)
+and single byte ranges (Range, If-Range) itself. Its ETags come from hashes
+that are already known: a content-addressed blob (see core.storage) carries
+its SHA-256 in its name, and other files have one recorded in MediaFile, so
+the file is never read to compute one. Blobs never change once written, so
+their responses are marked immutable and cacheable for a year.
+
+With MEDIA_SENDFILE set, the file body is left to the web server:
+
+    MEDIA_SENDFILE = 'x-accel-redirect'   # nginx
+    MEDIA_SENDFILE_PREFIX = '/protected-media/'
+
+        location /protected-media/ {
+            internal;
+            alias /path/to/mediafiles/;
+        }
+
+    MEDIA_SENDFILE = 'x-sendfile'          # Apache mod_xsendfile, lighttpd
+
+Django then only checks the request, answers 304s and sets the headers; the
+server streams the file (and handles ranges) without holding a Python worker.
+"""
+
+import mimetypes
+import os
+import re
+import stat
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+from .models import MediaFile
+from .storage import is_blob_name
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Bytes read from disk at a time when streaming a range
+READ_SIZE = 64 * 1024
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def media_etag(name, file_stat):
+    """
+    Return the ETag of a stored file from its known SHA-256, falling back to
+    a weak tag built from the modification time and size.
+    """
+    if is_blob_name(name):
+        digest = os.path.splitext(os.path.basename(name))[0]
+    else:
+        digest = MediaFile.objects.filter(name=name).values_list('sha256', flat=True).first()
+    if digest:
+        return f'"{digest}"'
+    return f'W/"{int(file_stat.st_mtime):x}-{file_stat.st_size:x}"'
+
+
+def is_not_modified(request, etag, last_modified):
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent."""
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        # Weak comparison, as required for If-None-Match
+        tags = parse_etags(if_none_match)
+        return '*' in tags or etag.removeprefix('W/') in [tag.removeprefix('W/') for tag in tags]
+
+    since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return since is not None and int(last_modified) <= since
+
+
+def parse_range(header, size):
+    """
+    Return (start, end) inclusive for a single 'bytes=' range, None to send
+    the whole file (absent, malformed or multipart ranges) or raise
+    ValueError when the range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.replace(' ', '')) if header else None
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise ValueError(header)
+    return start, end
+
+
+def range_applies(request, etag, last_modified):
+    """If-Range: only honour Range when the client's copy is still current."""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        # Strong comparison; weak tags never match
+        return not etag.startswith('W/') and if_range == etag
+    date = parse_http_date_safe(if_range)
+    return date is not None and int(last_modified) <= date
+
+
+def iter_range(path, start, length):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        while length > 0:
+            data = file.read(min(READ_SIZE, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+
+def sendfile_response(path, name, content_type):
+    """An empty response telling the web server to send the file itself."""
+    response = HttpResponse(content_type=content_type)
+    backend = settings.MEDIA_SENDFILE.lower()
+    if backend == 'x-accel-redirect':
+        prefix = getattr(settings, 'MEDIA_SENDFILE_PREFIX', '/protected-media/')
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(name)
+    elif backend == 'x-sendfile':
+        response['X-Sendfile'] = path
+    else:
+        raise ValueError(f'Unknown MEDIA_SENDFILE backend: {settings.MEDIA_SENDFILE}')
+    return response
+
+
+def set_headers(response, headers):
+    for header, value in headers.items():
+        response[header] = value
+    return response
+
+
+@require_safe
+def serve_media(request, path):
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404('Not found')
+    try:
+        file_stat = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404('Not found')
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise Http404('Not found')
+
+    size = file_stat.st_size
+    etag = media_etag(path, file_stat)
+    headers = {
+        'ETag': etag,
+        'Last-Modified': http_date(file_stat.st_mtime),
+        'Cache-Control': IMMUTABLE_CACHE_CONTROL if is_blob_name(path) else
+                         f'public, max-age={getattr(settings, "MEDIA_CACHE_MAX_AGE", 3600)}',
+        'Accept-Ranges': 'bytes',
+    }
+
+    if is_not_modified(request, etag, file_stat.st_mtime):
+        return set_headers(HttpResponseNotModified(), {
+            header: headers[header] for header in ('ETag', 'Last-Modified', 'Cache-Control')
+        })
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+
+    if getattr(settings, 'MEDIA_SENDFILE', ''):
+        # The server handles Range itself
+        return set_headers(sendfile_response(full_path, path, content_type), headers)
+
+    byte_range = None
+    if range_applies(request, etag, file_stat.st_mtime):
+        try:
+            byte_range = parse_range(request.headers.get('Range'), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return set_headers(response, headers)
+
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+        response['Content-Length'] = size
+    elif byte_range is not None:
+        start, end = byte_range
+        response = StreamingHttpResponse(iter_range(full_path, start, end - start + 1),
+                                         status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = end - start + 1
+    else:
+        # FileResponse lets the WSGI server use its file_wrapper (sendfile)
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+
+    if encoding:
+        response['Content-Encoding'] = encoding
+    return set_headers(response, headers)
@@ -1,12 +1,119 @@
-import logging
 import json
+import logging
 import time
+from django.http import HttpResponse, HttpResponseForbidden
 from django.utils import timezone
 from django.conf import settings
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+from .activity import activity_batch
+from .audit import AuditEvent, parsed_body, redact_body
+from .ip_allowlist import allowlist_for, client_ip
+from .site_settings import get_site_settings
+from .tokens import token_claims
 
 # Create a dedicated security logger
 security_logger = logging.getLogger('security')
 
+class MaintenanceModeMiddleware:
+    """
+    Answer API requests with 503 and Retry-After while
+    SiteSettings.maintenanceMode is on, before routing, authentication or
+    any view runs. Admins presenting a valid access token still get through,
+    as do the login and token refresh endpoints so they can obtain one.
+
+    The flag comes from the process-local settings copy
+    (core.site_settings), so in normal mode this costs no query; the 503
+    body is rendered once per settings version.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.exempt_paths = tuple(getattr(settings, 'MAINTENANCE_EXEMPT_PATHS', ()))
+        self.retry_after = str(getattr(settings, 'MAINTENANCE_RETRY_AFTER', 300))
+        # (settings instance, rendered body)
+        self.payload = (None, b'')
+
+    def __call__(self, request):
+        path = request.path
+        if path.startswith('/api/') and not path.startswith(self.exempt_paths):
+            site_settings = get_site_settings()
+            if site_settings.maintenanceMode and not self.is_admin(request):
+                return self.maintenance_response(site_settings)
+        return self.get_response(request)
+
+    def is_admin(self, request):
+        header = request.headers.get('Authorization', '')
+        if not header.startswith('Bearer '):
+            return False
+        try:
+            token = AccessToken(header[len('Bearer '):].strip())
+        except TokenError:
+            return False
+        claims = token_claims(token)
+        return claims['is_active'] and claims['role'] == 'admin'
+
+    def maintenance_response(self, site_settings):
+        rendered_for, body = self.payload
+        if rendered_for is not site_settings:
+            body = json.dumps({
+                'error': site_settings.maintenanceMessage or 'Site is currently under maintenance.',
+                'maintenance': True,
+            }).encode('utf-8')
+            self.payload = (site_settings, body)
+        response = HttpResponse(body, status=503, content_type='application/json')
+        response['Retry-After'] = self.retry_after
+        response['Cache-Control'] = 'no-store'
+        # An expected 503, not a server error: keep it out of django.request's error log
+        response._has_been_logged = True
+        return response
+
+
+class IPAllowlistMiddleware:
+    """
+    Restrict the admin site and authenticated API writes to the addresses in
+    SiteSettings.allowedIPs (see core.ip_allowlist). An empty list allows
+    every address. Anonymous API requests and reads are never restricted.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if self.is_restricted(request):
+            allowlist = allowlist_for(get_site_settings())
+            if allowlist and not allowlist.allows(client_ip(request)):
+                if request.path.startswith('/api/'):
+                    return HttpResponse(
+                        json.dumps({'error': 'Access from this IP address is not allowed'}),
+                        status=403, content_type='application/json',
+                    )
+                return HttpResponseForbidden('Access from this IP address is not allowed')
+        return self.get_response(request)
+
+    def is_restricted(self, request):
+        path = request.path
+        if path.startswith('/admin/'):
+            return True
+        return (path.startswith('/api/')
+                and request.method not in ('GET', 'HEAD', 'OPTIONS')
+                and 'HTTP_AUTHORIZATION' in request.META)
+
+
+class ActivityBatchMiddleware:
+    """
+    Collect the Activity rows logged while handling a request and write them
+    with one INSERT once the response is ready (see core.activity).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with activity_batch():
+            return self.get_response(request)
+
+
 class SecurityLoggingMiddleware:
     """
     Middleware to log security-relevant requests for auditing purposes.
@@ -45,10 +152,8 @@ class SecurityLoggingMiddleware:
         path = request.path
         status_code = response.status_code
         
-        # Get IP address (consider X-Forwarded-For for proxied requests)
-        ip_address = request.META.get('HTTP_X_FORWARDED_FOR', request.META.get('REMOTE_ADDR', ''))
-        if ',' in ip_address:  # X-Forwarded-For can contain multiple IPs
-            ip_address = ip_address.split(',')[0].strip()
+        # Get IP address (X-Forwarded-For as far as TRUSTED_PROXY_COUNT allows)
+        ip_address = client_ip(request)
             
         # Get user agent
         user_agent = request.META.get('HTTP_USER_AGENT', '')
@@ -66,26 +171,21 @@ class SecurityLoggingMiddleware:
             'duration': f"{duration:.4f}s",
         }
         
-        # Add request body for POST/PUT/PATCH requests (excluding login/password endpoints)
+        # Add request body for POST/PUT/PATCH requests (excluding login/password endpoints).
+        # Only JSON that DRF already parsed for the view is logged; the body is
+        # never decoded a second time. Serialization happens off the request
+        # thread (see core.audit).
         if method in ('POST', 'PUT', 'PATCH') and not any(sensitive in path for sensitive in ['/login', '/password', '/token']):
-            try:
-                # Don't log file uploads or form data
-                if request.content_type == 'application/json':
-                    body = json.loads(request.body) if request.body else {}
-                    # Redact sensitive fields
-                    for field in ['password', 'token', 'key', 'secret', 'credential']:
-                        if field in body:
-                            body[field] = '[REDACTED]'
-                    log_data['body'] = body
-            except Exception:
-                pass
-                
+            body = parsed_body(response)
+            if body is not None:
+                log_data['body'] = redact_body(body)
+
         # Log based on status code
         if 400 <= status_code < 500:
-            security_logger.warning(json.dumps(log_data))
+            security_logger.warning(AuditEvent(log_data))
         elif status_code >= 500:
-            security_logger.error(json.dumps(log_data))
+            security_logger.error(AuditEvent(log_data))
         elif path.startswith('/admin') or path.startswith('/api/auth'):
-            security_logger.info(json.dumps(log_data))
+            security_logger.info(AuditEvent(log_data))
         elif method in ('POST', 'PUT', 'DELETE', 'PATCH'):
-            security_logger.info(json.dumps(log_data))
+            security_logger.info(AuditEvent(log_data))
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-16 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0035_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediafile',
+            name='ref_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='mediarendition',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
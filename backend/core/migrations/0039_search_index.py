@@ -0,0 +1,123 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:03
+
+from django.db import migrations, models
+
+
+SQLITE_FORWARD = [
+    # External-content FTS5 index over core_searchdocument, kept in sync by triggers
+    """CREATE VIRTUAL TABLE core_searchdocument_fts USING fts5(
+        title, body, content='core_searchdocument', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER core_searchdocument_ai AFTER INSERT ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    """CREATE TRIGGER core_searchdocument_ad AFTER DELETE ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(core_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    """CREATE TRIGGER core_searchdocument_au AFTER UPDATE ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(core_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO core_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS core_searchdocument_au',
+    'DROP TRIGGER IF EXISTS core_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS core_searchdocument_ai',
+    'DROP TABLE IF EXISTS core_searchdocument_fts',
+]
+
+POSTGRES_FORWARD = [
+    # Title terms weigh more than body terms in ts_rank_cd()
+    """ALTER TABLE core_searchdocument ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED""",
+    'CREATE INDEX core_searchdocument_vector_idx ON core_searchdocument USING GIN (search_vector)',
+]
+
+POSTGRES_BACKWARD = [
+    'DROP INDEX IF EXISTS core_searchdocument_vector_idx',
+    'ALTER TABLE core_searchdocument DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        vendor_statements = statements.get(schema_editor.connection.vendor, [])
+        for statement in vendor_statements:
+            schema_editor.execute(statement)
+    return run
+
+
+def create_full_text_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pragma_module_list WHERE name = 'fts5'")
+            if cursor.fetchone() is None:
+                # core.search falls back to its in-memory engine (core.search_engine)
+                return
+    run_vendor_sql({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD})(apps, schema_editor)
+
+
+# kind -> (model, title field, body fields), as in core.search.INDEXED
+INDEXED = {
+    'product': ('Product', 'name', ('description', 'items')),
+    'solution': ('Solution', 'title', ('description', 'features')),
+    'news': ('NewsArticle', 'title', ('excerpt', 'content')),
+}
+
+
+def flatten(value):
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in flatten(item)]
+    if isinstance(value, (list, tuple)):
+        return [text for item in value for text in flatten(item)]
+    return [str(value)]
+
+
+def index_existing_rows(apps, schema_editor):
+    SearchDocument = apps.get_model('core', 'SearchDocument')
+    documents = []
+    for kind, (model_name, title_field, body_fields) in INDEXED.items():
+        for instance in apps.get_model('core', model_name).objects.all().iterator():
+            body = '\n'.join(text for field in body_fields for text in flatten(getattr(instance, field)))
+            documents.append(SearchDocument(
+                kind=kind, object_id=instance.pk, title=str(getattr(instance, title_field) or ''), body=body
+            ))
+    SearchDocument.objects.bulk_create(documents, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0038_activity_indexes_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.TextField()),
+                ('body', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(
+            create_full_text_index,
+            run_vendor_sql({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+        migrations.RunPython(index_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0039_search_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='uploadsession',
+            name='status',
+            field=models.CharField(choices=[('open', 'Open'), ('writing', 'Writing a chunk'), ('complete', 'Complete')], default='open', max_length=10),
+        ),
+    ]
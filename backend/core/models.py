@@ -1,5 +1,8 @@
+import uuid
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 class UserRole(models.Model):
     ROLE_CHOICES = (
@@ -65,6 +68,12 @@ class NewsArticle(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination over (published_at, id)
+            models.Index(fields=['-published_at', '-id'], name='core_news_published_id_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -82,6 +91,10 @@ class ContactMessage(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = "Contact Messages"
+        indexes = [
+            # Keyset pagination over (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='core_contact_created_id_idx'),
+        ]
 
 class ContactInfo(models.Model):
     icon = models.CharField(max_length=50)
@@ -130,6 +143,7 @@ class HeroSection(models.Model):
     button_text = models.CharField(max_length=50)
     button_link = models.CharField(max_length=200)
     background_image = models.ImageField(upload_to='hero/')
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Hero Section"
@@ -141,6 +155,7 @@ class Feature(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     icon = models.CharField(max_length=50)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
@@ -149,6 +164,7 @@ class TargetMarket(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     image = models.ImageField(upload_to='markets/')
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
@@ -157,6 +173,7 @@ class WhyChooseUs(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     icon = models.CharField(max_length=50)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Why Choose Us"
@@ -168,6 +185,7 @@ class AboutHero(models.Model):
     title = models.CharField(max_length=255, blank=True, null=True)
     description = models.TextField(blank=True, null=True)
     background_image = models.ImageField(upload_to='about/hero/', blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "About Hero Section"
@@ -181,6 +199,7 @@ class CompanyOverview(models.Model):
     quote = models.TextField()
     quote_author = models.CharField(max_length=255)
     quote_position = models.CharField(max_length=255)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Company Overview"
@@ -194,6 +213,7 @@ class MissionVision(models.Model):
     mission = models.TextField()
     visionTitle = models.CharField(max_length=255)
     vision = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Mission & Vision"
@@ -205,6 +225,7 @@ class TeamMember(models.Model):
     name = models.CharField(max_length=255)
     position = models.CharField(max_length=255)
     image = models.ImageField(upload_to='team/')
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Team Members"
@@ -215,6 +236,7 @@ class TeamMember(models.Model):
 class Partner(models.Model):
     name = models.CharField(max_length=255)
     logo = models.ImageField(upload_to='partners/', null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Partners"
@@ -356,11 +378,176 @@ class Activity(models.Model):
     content_type = models.CharField(max_length=100, blank=True, null=True)  # e.g., 'product', 'solution'
     object_id = models.CharField(max_length=100, blank=True, null=True)  # ID of the affected object
     details = models.TextField(blank=True, null=True)  # Additional details about the activity
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the action happens, not when the buffered row is written (core.activity)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         verbose_name_plural = "Activities"
         ordering = ['-timestamp']
+        indexes = [
+            # Keyset pagination over (timestamp, id); also serves time range
+            # scans (archive_activity, rollups) as a plain timestamp index would
+            models.Index(fields=['-timestamp', '-id'], name='core_activity_ts_id_idx'),
+            # A user's history, newest first
+            models.Index(fields=['user', '-timestamp'], name='core_activity_user_ts_idx'),
+            # History of one object
+            models.Index(fields=['content_type', 'object_id'], name='core_activity_object_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} {self.get_action_display()} {self.content_type or ''} at {self.timestamp}"
+
+
+class ActivityRollup(models.Model):
+    """
+    Number of actions per day, user, content type and action, precomputed
+    from Activity (see core.activity) so dashboard charts never scan raw
+    rows, and kept after archive_activity removes the rows themselves.
+    """
+    day = models.DateField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_rollups')
+    content_type = models.CharField(max_length=100, blank=True, default='')
+    action = models.CharField(max_length=50, choices=Activity.ACTION_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-day']
+        unique_together = ('day', 'user', 'content_type', 'action')
+        indexes = [
+            models.Index(fields=['day'], name='core_activityrollup_day_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.user_id} {self.action} {self.content_type}: {self.count}"
+
+
+class MediaFile(models.Model):
+    """
+    Integrity metadata of an uploaded media file, captured once at upload time
+    (see core.media) and re-checked by the verify_media command, so serializers
+    never have to touch the storage backend to describe a file.
+    """
+    name = models.CharField(max_length=255, unique=True)  # Storage name, as stored in the ImageField
+    size = models.PositiveBigIntegerField(null=True, blank=True)  # In bytes
+    sha256 = models.CharField(max_length=64, blank=True)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    exists = models.BooleanField(default=True)
+    ref_count = models.PositiveIntegerField(default=0)  # Image fields using this file; 0 = eligible for media_gc
+    checked_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class MediaRendition(models.Model):
+    """A resized, re-encoded derivative of a MediaFile (see core.renditions)."""
+    media = models.ForeignKey(MediaFile, on_delete=models.CASCADE, related_name='renditions')
+    name = models.CharField(max_length=255, db_index=True)  # Storage name; identical derivatives share a blob
+    format = models.CharField(max_length=10)  # webp, avif or jpeg
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    size = models.PositiveBigIntegerField()  # In bytes
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['format', 'width']
+        unique_together = ('media', 'format', 'width')
+
+    def __str__(self):
+        return self.name
+
+
+class MediaJob(models.Model):
+    """
+    A unit of background media processing, drained by run_media_worker.
+
+    The table is the queue: workers claim pending jobs with a conditional
+    UPDATE, so no external broker is needed.
+    """
+    KIND_CHOICES = (
+        ('renditions', 'Generate renditions'),
+    )
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+
+    media = models.ForeignKey(MediaFile, on_delete=models.CASCADE, related_name='jobs')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='renditions')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    progress = models.PositiveSmallIntegerField(default=0)  # Percent
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    error = models.TextField(blank=True)
+    available_at = models.DateTimeField()  # Not picked up before this time (retry backoff)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # Workers look for the oldest available pending jobs
+            models.Index(fields=['status', 'available_at'], name='core_mediajob_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} for {self.media.name} ({self.status})"
+
+
+class UploadSession(models.Model):
+    """
+    A resumable upload: chunks are appended to a temporary file on the server
+    until `received` reaches `size`, then the file is attached to an image
+    field (see core.uploads).
+    """
+    STATUS_CHOICES = (
+        ('open', 'Open'),
+        ('writing', 'Writing a chunk'),
+        ('complete', 'Complete'),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions')
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveBigIntegerField()  # Announced total size in bytes
+    received = models.PositiveBigIntegerField(default=0)  # Bytes stored so far, i.e. the next offset
+    sha256 = models.CharField(max_length=64, blank=True)  # Expected digest, if the client sent one
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='open')
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.filename} ({self.received}/{self.size} bytes)"
+
+
+class SearchDocument(models.Model):
+    """
+    Searchable text of a product, solution or news article (see core.search).
+    The database's full-text index (FTS5 or a tsvector column, created by
+    migration) is built over this table.
+    """
+    kind = models.CharField(max_length=20)  # product, solution or news
+    object_id = models.PositiveBigIntegerField()
+    title = models.TextField()
+    body = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('kind', 'object_id')
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}: {self.title}"
@@ -1,30 +1,30 @@
 from rest_framework import permissions
 
+from .tokens import request_claims
+
+
+def request_role(request):
+    """The role of the user making a request, from its token claims (see core.tokens)."""
+    claims = request_claims(request)
+    return claims['role'] if claims and claims['is_active'] else None
+
+
 class IsAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
-        return bool(request.user and request.user.is_authenticated and
-                   hasattr(request.user, 'role') and request.user.role.role == 'admin')
+        return request_role(request) == 'admin'
 
 class IsEditorOrAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        if not hasattr(request.user, 'role'):
-            return False
-        return request.user.role.role in ['admin', 'editor']
+        return request_role(request) in ['admin', 'editor']
 
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user.role.role in ['admin', 'editor']
+        return request_role(request) in ['admin', 'editor']
 
 class IsViewerOrHigher(permissions.BasePermission):
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        if not hasattr(request.user, 'role'):
-            return False
-        return request.user.role.role in ['admin', 'editor', 'viewer']
+        return request_role(request) in ['admin', 'editor', 'viewer']
 
 
 class HasResourcePermission(permissions.BasePermission):
@@ -47,21 +47,18 @@ class HasResourcePermission(permissions.BasePermission):
             return True
 
         # Check if the user has the required role for this action
-        return self.has_role_permission(request.user, resource_type, request.method)
+        return self.has_role_permission(request_claims(request), resource_type, request.method)
 
-    def has_role_permission(self, user, resource_type, method):
+    def has_role_permission(self, claims, resource_type, method):
         # If not authenticated, deny access
-        if not user or not user.is_authenticated:
+        if not claims or not claims['is_active']:
             return False
 
         # Get the user's role
-        try:
-            role = user.role.role if hasattr(user, 'role') and user.role else 'viewer'
-        except:
-            role = 'viewer'
+        role = claims['role'] or 'viewer'
 
         # Admin users have full access
-        if role == 'admin' or user.is_staff or user.is_superuser:
+        if role == 'admin' or claims['is_staff'] or claims['is_superuser']:
             return True
 
         # Editor users can create and update but not delete
@@ -73,4 +70,4 @@ class HasResourcePermission(permissions.BasePermission):
             return method in ['GET', 'HEAD', 'OPTIONS']
 
         # Default: deny access
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,136 @@
+"""
+Responsive image derivatives.
+
+Every recorded image gets re-encoded copies at MEDIA_RENDITION_WIDTHS in
+WebP and in AVIF (or JPEG when this Pillow build cannot write AVIF), saved
+through the default storage (as renditions/..., or as content-addressed
+blobs with core.storage) and recorded in MediaRendition. Serializers expose them
+as {format: {width: url}} maps that translate directly into a srcset.
+"""
+
+import io
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from PIL import Image, ImageOps, features
+
+from .logging import get_logger
+from .models import MediaRendition
+
+logger = get_logger(__name__)
+
+DEFAULT_WIDTHS = (320, 640, 960, 1280, 1920)
+
+# format -> (Pillow encoder, file extension, save options)
+ENCODERS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'avif': ('AVIF', 'avif', {'quality': 60}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def rendition_widths():
+    return sorted(set(getattr(settings, 'MEDIA_RENDITION_WIDTHS', DEFAULT_WIDTHS)))
+
+
+def rendition_formats():
+    """WebP plus AVIF, or JPEG when this Pillow build has no AVIF encoder."""
+    return ['webp', 'avif' if features.check('avif') else 'jpeg']
+
+
+def target_widths(original_width):
+    """
+    Widths to generate for an image: every configured width below the
+    original (never upscale), or the original width alone for small images
+    so they still get a re-encoded copy.
+    """
+    widths = [width for width in rendition_widths() if width < original_width]
+    return widths or [original_width]
+
+
+def rendition_name(source_name, width, extension):
+    stem = os.path.splitext(source_name)[0]
+    return f'renditions/{stem}-{width}w.{extension}'
+
+
+def encode(image, format, width):
+    """Resize an image to the given width and return (bytes, height)."""
+    encoder, _, options = ENCODERS[format]
+    height = max(1, round(image.height * width / image.width))
+    resized = image.resize((width, height), Image.Resampling.LANCZOS) if width != image.width else image
+
+    if format == 'jpeg' and resized.mode != 'RGB':
+        # JPEG has no alpha channel; flatten onto white
+        background = Image.new('RGB', resized.size, (255, 255, 255))
+        if 'A' in resized.getbands():
+            background.paste(resized, mask=resized.getchannel('A'))
+        else:
+            background.paste(resized.convert('RGB'))
+        resized = background
+    elif resized.mode not in ('RGB', 'RGBA'):
+        resized = resized.convert('RGBA' if 'A' in resized.getbands() or 'transparency' in resized.info else 'RGB')
+
+    buffer = io.BytesIO()
+    resized.save(buffer, encoder, **options)
+    return buffer.getvalue(), height
+
+
+def delete_renditions(media):
+    """Delete the stored derivatives of a MediaFile and their rows."""
+    for rendition in media.renditions.all():
+        default_storage.delete(rendition.name)
+    media.renditions.all().delete()
+
+
+def generate_renditions(media, progress=None, fail_silently=True):
+    """
+    (Re)generate every derivative of a MediaFile.
+
+    Returns the number of renditions written. progress, if given, is called
+    with (done, total) after each rendition. Files that are missing or cannot
+    be decoded are logged and skipped, or re-raised with fail_silently=False
+    so a background job can be retried.
+    """
+    if not media.exists or not media.width:
+        return 0
+
+    written = []
+    try:
+        with default_storage.open(media.name, 'rb') as file:
+            with Image.open(file) as source:
+                source = ImageOps.exif_transpose(source)
+                source.load()
+
+        formats = rendition_formats()
+        widths = target_widths(source.width)
+        total = len(widths) * len(formats)
+        rows = []
+        for width in widths:
+            for format in formats:
+                content, height = encode(source, format, width)
+                name = default_storage.save(
+                    rendition_name(media.name, width, ENCODERS[format][1]), ContentFile(content)
+                )
+                written.append(name)
+                rows.append(MediaRendition(
+                    media=media, name=name, format=format, width=width, height=height, size=len(content)
+                ))
+                if progress:
+                    progress(len(rows), total)
+
+        with transaction.atomic():
+            delete_renditions(media)
+            MediaRendition.objects.bulk_create(rows)
+    except Exception:
+        for name in written:
+            default_storage.delete(name)
+        if not fail_silently:
+            raise
+        logger.exception('Error generating renditions', name=media.name)
+        return 0
+
+    logger.debug('Generated renditions', name=media.name, count=len(rows))
+    return len(rows)
@@ -0,0 +1,352 @@
+"""
+Full-text search over products, solutions and news.
+
+Each searchable row is mirrored into SearchDocument (a title and a body
+assembled from the fields in INDEXED) when it is saved, and removed when it
+is deleted. The database then maintains its own inverted index over that
+table, created by migration 0039:
+
+    SQLite      an FTS5 external-content table, kept in sync by triggers;
+                ranked with bm25(), highlighted with highlight()/snippet()
+    PostgreSQL  a generated, weighted tsvector column with a GIN index;
+                ranked with ts_rank_cd(), highlighted with ts_headline()
+
+Other databases (or SQLite builds without FTS5), and SEARCH_BACKEND =
+'memory', use an in-memory BM25 index of the same documents instead (see
+core.search_engine). Each process builds it from SearchDocument on first
+use, patches it from the SearchDocument signals of its own writes and
+picks up other processes' writes at most SEARCH_ENGINE_SYNC_SECONDS later.
+Typeahead suggestions (suggest()) always come from that index.
+
+`manage.py rebuild_search_index` re-creates every document, e.g. after rows
+were changed with queryset.update().
+"""
+
+import re
+import threading
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils.html import escape
+
+from .cache import bump_model_version, get_model_version, register_versioned_models
+from .logging import get_logger
+from .models import SearchDocument
+from .search_engine import SearchEngine
+
+# The engine resyncs when the SearchDocument version moves
+register_versioned_models(SearchDocument)
+
+logger = get_logger(__name__)
+
+# kind -> (model, title field, body fields)
+INDEXED = {
+    'product': ('core.Product', 'name', ('description', 'items')),
+    'solution': ('core.Solution', 'title', ('description', 'features')),
+    'news': ('core.NewsArticle', 'title', ('excerpt', 'content')),
+}
+
+FTS_TABLE = 'core_searchdocument_fts'
+SEARCH_CONFIG = 'english'
+
+# Highlight markers; replaced with <mark> after the text is HTML-escaped
+START_MARK, END_MARK = '\x02', '\x03'
+
+# Search terms beyond this are ignored
+MAX_TERMS = 16
+
+_fts5_available = None
+
+# Documents changed up to this long before the newest one the engine has
+# seen are re-read on sync, for transactions that committed out of order
+SYNC_OVERLAP = timedelta(minutes=1)
+
+_engine = None
+_engine_lock = threading.Lock()
+_engine_state = {'version': None, 'updated_at': None, 'synced': 0.0}
+
+
+def indexed_kind(model):
+    """The search kind of a model, or None if it is not indexed."""
+    label = model._meta.label
+    for kind, (model_label, _, _) in INDEXED.items():
+        if model_label == label:
+            return kind
+    return None
+
+
+def indexed_models():
+    return [apps.get_model(model_label) for model_label, _, _ in INDEXED.values()]
+
+
+def flatten(value):
+    """Text of a field value; JSON lists and objects contribute their strings."""
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in flatten(item)]
+    if isinstance(value, (list, tuple)):
+        return [text for item in value for text in flatten(item)]
+    return [str(value)]
+
+
+def document_fields(instance):
+    """(kind, title, body) of a searchable instance."""
+    kind = indexed_kind(type(instance))
+    _, title_field, body_fields = INDEXED[kind]
+    body = '\n'.join(text for field in body_fields for text in flatten(getattr(instance, field)))
+    return kind, str(getattr(instance, title_field) or ''), body
+
+
+def index_instance(instance):
+    """Create or refresh the search document of a saved instance."""
+    kind, title, body = document_fields(instance)
+    SearchDocument.objects.update_or_create(
+        kind=kind, object_id=instance.pk, defaults={'title': title, 'body': body}
+    )
+
+
+def remove_instance(instance):
+    """Drop the search document of a deleted instance."""
+    SearchDocument.objects.filter(kind=indexed_kind(type(instance)), object_id=instance.pk).delete()
+
+
+def rebuild_index():
+    """Re-create every search document from the indexed models. Returns the count."""
+    documents = []
+    for model in indexed_models():
+        for instance in model.objects.all().iterator():
+            kind, title, body = document_fields(instance)
+            documents.append(SearchDocument(kind=kind, object_id=instance.pk, title=title, body=body))
+    SearchDocument.objects.all().delete()
+    SearchDocument.objects.bulk_create(documents, batch_size=500)
+    # bulk_create sends no signals: let every process resync its engine
+    bump_model_version(SearchDocument)
+    return len(documents)
+
+
+def get_engine():
+    """This process's in-memory search engine, built or resynced as needed."""
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            engine = SearchEngine()
+            with engine.bulk():
+                _load_documents(engine, SearchDocument.objects.all())
+            _engine = engine
+            logger.info('Search engine built', documents=len(engine))
+        elif time.monotonic() - _engine_state['synced'] > getattr(settings, 'SEARCH_ENGINE_SYNC_SECONDS', 30):
+            _sync_engine(_engine)
+        return _engine
+
+
+def _load_documents(engine, queryset):
+    _engine_state['version'] = get_model_version(SearchDocument)
+    _engine_state['synced'] = time.monotonic()
+    rows = queryset.values_list('kind', 'object_id', 'title', 'body', 'updated_at')
+    for kind, object_id, title, body, updated_at in rows.iterator(chunk_size=2000):
+        engine.add((kind, object_id), title, body)
+        if _engine_state['updated_at'] is None or updated_at > _engine_state['updated_at']:
+            _engine_state['updated_at'] = updated_at
+
+
+def _sync_engine(engine):
+    """Apply documents written or deleted by other processes since the last sync."""
+    if get_model_version(SearchDocument) == _engine_state['version']:
+        _engine_state['synced'] = time.monotonic()
+        return
+    since = _engine_state['updated_at']
+    changed = SearchDocument.objects.all()
+    if since is not None:
+        changed = changed.filter(updated_at__gte=since - SYNC_OVERLAP)
+    _load_documents(engine, changed)
+    live = set(SearchDocument.objects.values_list('kind', 'object_id').iterator(chunk_size=2000))
+    for key in [key for key in engine.numbers if key not in live]:
+        engine.remove(key)
+
+
+def engine_document_saved(document):
+    """Patch the engine, if this process has one, with a saved SearchDocument."""
+    if _engine is not None:
+        _engine.add((document.kind, document.object_id), document.title, document.body)
+
+
+def engine_document_deleted(document):
+    """Drop a deleted SearchDocument from the engine, if this process has one."""
+    if _engine is not None:
+        _engine.remove((document.kind, document.object_id))
+
+
+def search_backend():
+    """'fts5', 'postgres' or 'memory', depending on the database and SEARCH_BACKEND."""
+    global _fts5_available
+
+    if getattr(settings, 'SEARCH_BACKEND', 'auto') == 'memory':
+        return 'memory'
+    if connection.vendor == 'postgresql':
+        return 'postgres'
+    if connection.vendor == 'sqlite':
+        if _fts5_available is None:
+            _fts5_available = FTS_TABLE in connection.introspection.table_names()
+        if _fts5_available:
+            return 'fts5'
+    return 'memory'
+
+
+def parse_terms(query):
+    """Lower-cased word terms of a query; punctuation and operators are dropped."""
+    return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+
+def mark(text):
+    """HTML-escape highlighted text and turn the markers into <mark> tags."""
+    return escape(text or '').replace(START_MARK, '<mark>').replace(END_MARK, '</mark>')
+
+
+def search(query, kinds=None, limit=20, offset=0):
+    """
+    Return (total, results) for a query, best match first. Results are dicts
+    with type, id, title and snippet (HTML with <mark> around matches) and
+    score (higher is better). All terms must match; the last one also
+    matches as a prefix, for search-as-you-type.
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return 0, []
+    kinds = [kind for kind in (kinds or INDEXED) if kind in INDEXED]
+    if not kinds:
+        return 0, []
+
+    backend = search_backend()
+    if backend == 'fts5':
+        return _search_fts5(terms, kinds, limit, offset)
+    if backend == 'postgres':
+        return _search_postgres(terms, kinds, limit, offset)
+    return _search_memory(terms, kinds, limit, offset)
+
+
+def suggest(query, limit=10):
+    """
+    Completions of the last word of a query, most frequent terms first,
+    each prefixed with the words before it ('smart ca' -> 'smart card').
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return []
+    lead = ' '.join(terms[:-1])
+    return [f'{lead} {term}'.lstrip() for term in get_engine().suggest(terms[-1], limit)]
+
+
+def _kind_clause(kinds):
+    placeholders = ', '.join(['%s'] * len(kinds))
+    return f'd.kind IN ({placeholders})', list(kinds)
+
+
+def _search_fts5(terms, kinds, limit, offset):
+    match = ' '.join(f'"{term}"' for term in terms[:-1])
+    match = f'{match} "{terms[-1]}"*'.strip()
+    kind_sql, kind_params = _kind_clause(kinds)
+    where = f'{FTS_TABLE} MATCH %s AND {kind_sql}'
+    params = [match, *kind_params]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT COUNT(*) FROM {FTS_TABLE} JOIN core_searchdocument d ON d.id = {FTS_TABLE}.rowid '
+            f'WHERE {where}', params
+        )
+        total = cursor.fetchone()[0]
+        if not total:
+            return 0, []
+        cursor.execute(
+            f"SELECT d.kind, d.object_id, "
+            f"highlight({FTS_TABLE}, 0, %s, %s), "
+            f"snippet({FTS_TABLE}, 1, %s, %s, '…', 24), "
+            # Title matches weigh ten times body matches
+            f"bm25({FTS_TABLE}, 10.0, 1.0) AS rank "
+            f"FROM {FTS_TABLE} JOIN core_searchdocument d ON d.id = {FTS_TABLE}.rowid "
+            f"WHERE {where} ORDER BY rank LIMIT %s OFFSET %s",
+            [START_MARK, END_MARK, START_MARK, END_MARK, *params, limit, offset]
+        )
+        rows = cursor.fetchall()
+
+    # bm25() is lower for better matches
+    return total, [_result(kind, object_id, title, snippet, -rank) for kind, object_id, title, snippet, rank in rows]
+
+
+def _search_postgres(terms, kinds, limit, offset):
+    tsquery = ' & '.join([*terms[:-1], f'{terms[-1]}:*'])
+    kind_sql, kind_params = _kind_clause(kinds)
+    where = f'd.search_vector @@ q AND {kind_sql}'
+    source = f"core_searchdocument d, to_tsquery('{SEARCH_CONFIG}', %s) q"
+    params = [tsquery, *kind_params]
+    options = f'StartSel={START_MARK}, StopSel={END_MARK}'
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM {source} WHERE {where}', params)
+        total = cursor.fetchone()[0]
+        if not total:
+            return 0, []
+        cursor.execute(
+            f"SELECT d.kind, d.object_id, "
+            f"ts_headline('{SEARCH_CONFIG}', d.title, q, %s), "
+            f"ts_headline('{SEARCH_CONFIG}', d.body, q, %s), "
+            f"ts_rank_cd(d.search_vector, q) AS rank "
+            f"FROM {source} WHERE {where} ORDER BY rank DESC, d.id LIMIT %s OFFSET %s",
+            [f'{options}, HighlightAll=true', f'{options}, MaxWords=35, MinWords=15', *params, limit, offset]
+        )
+        rows = cursor.fetchall()
+
+    return total, [_result(kind, object_id, title, snippet, rank) for kind, object_id, title, snippet, rank in rows]
+
+
+def _search_memory(terms, kinds, limit, offset):
+    """Rank with the in-memory engine; highlight the page of hits from their documents."""
+    accept = None if set(kinds) == set(INDEXED) else (lambda key: key[0] in kinds)
+    hits, total = get_engine().search(terms, accept=accept, limit=limit, offset=offset)
+    if not hits:
+        return total, []
+
+    keys = Q()
+    for kind, object_id in (key for key, _ in hits):
+        keys |= Q(kind=kind, object_id=object_id)
+    documents = {(document.kind, document.object_id): document for document in SearchDocument.objects.filter(keys)}
+
+    results = []
+    for key, score in hits:
+        document = documents.get(key)
+        if document is None:
+            # Deleted by another process since the engine last synced
+            continue
+        results.append(_result(
+            document.kind, document.object_id, _highlight(document.title, terms),
+            _highlight(_excerpt(document.body, terms), terms), score,
+        ))
+    return total, results
+
+
+def _excerpt(text, terms, width=160):
+    lower = text.lower()
+    positions = [lower.find(term) for term in terms if term in lower]
+    start = max(0, min(positions) - width // 4) if positions else 0
+    excerpt = text[start:start + width]
+    return ('…' if start else '') + excerpt + ('…' if start + width < len(text) else '')
+
+
+def _highlight(text, terms):
+    pattern = re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    return pattern.sub(lambda match: f'{START_MARK}{match.group(0)}{END_MARK}', text)
+
+
+def _result(kind, object_id, title, snippet, score):
+    return {
+        'type': kind,
+        'id': object_id,
+        'title': mark(title),
+        'snippet': mark(snippet),
+        'score': round(float(score), 6),
+    }
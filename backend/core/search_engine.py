@@ -0,0 +1,360 @@
+"""
+In-memory inverted index with BM25 ranking and prefix suggestions.
+
+Used by core.search when the database offers no full-text search (or when
+SEARCH_BACKEND = 'memory'). It has no Django dependencies:
+
+    engine = SearchEngine()
+    engine.add(('product', 1), 'Smart Card Printer', 'Prints cards fast')
+    engine.search(['smart', 'print'])     # [(('product', 1), score)], total
+    engine.suggest('pri')                 # ['printer', 'prints']
+
+Postings are kept compact: per term, one array of document numbers and one
+of term frequencies (4 bytes per entry each) instead of per-posting Python
+objects. Documents are numbered in insertion order, so postings stay sorted
+and can be probed with bisect. Removed documents are tombstoned and purged
+from the postings once they make up a quarter of the index.
+
+Suggestions come from a character trie of the vocabulary. Every node keeps
+its max_expansions most frequent completions, so a suggestion is a walk to
+the prefix and a sort of at most that many terms. The lists are maintained
+as postings are added: a term remembers the shallowest node listing it and
+the document frequency it must exceed to enter that node's parent, so most
+postings cost one comparison. Compaction, which lowers frequencies and
+drops terms, rebuilds the lists bottom-up from the children's in one pass
+over the trie, and so does the end of a bulk() load.
+"""
+
+import heapq
+import math
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+class TrieNode:
+    __slots__ = ('children', 'term', 'top', 'floor', 'weakest')
+
+    def __init__(self):
+        self.children = {}
+        self.term = None  # the term ending here, if any
+        self.top = []  # the most frequent completions, unordered
+        # A full top is entered by beating `floor`, a lower bound of its
+        # least frequency; `weakest` had that frequency when it was set
+        self.floor = 0
+        self.weakest = None
+
+
+class SearchEngine:
+    def __init__(self, k1=1.2, b=0.75, title_weight=3, max_expansions=50):
+        self.k1 = k1
+        self.b = b
+        # A title token counts as this many body tokens
+        self.title_weight = title_weight
+        # Prefix terms expand to at most this many (most frequent) terms
+        self.max_expansions = max_expansions
+
+        self.postings = {}  # term -> (array of doc numbers, array of frequencies)
+        self.keys = []  # doc number -> key, or None once removed
+        self.lengths = array('I')  # doc number -> weighted token count
+        self.numbers = {}  # key -> doc number
+        self.total_length = 0
+        self.removed = 0
+        self.trie = TrieNode()
+        # term -> [depth of the shallowest node listing it, frequency it must
+        # exceed to climb, the node above that one]
+        self.ranks = {}
+        self.lock = threading.RLock()
+        self._bulk = False
+
+    def __len__(self):
+        return len(self.numbers)
+
+    # Indexing
+
+    def add(self, key, title, body):
+        """Index a document under a hashable key, replacing any previous version."""
+        counts = Counter(tokenize(body))
+        for token in tokenize(title):
+            counts[token] += self.title_weight
+
+        with self.lock:
+            self.remove(key)
+            number = len(self.keys)
+            self.keys.append(key)
+            self.numbers[key] = number
+            length = sum(counts.values())
+            self.lengths.append(length)
+            self.total_length += length
+
+            postings, ranks = self.postings, self.ranks
+            promote = not self._bulk
+            for term, frequency in counts.items():
+                entry = postings.get(term)
+                if entry is None:
+                    entry = postings[term] = (array('I'), array('I'))
+                    self._insert_term(term)
+                entry[0].append(number)
+                entry[1].append(frequency)
+                if promote and len(entry[0]) > ranks[term][1]:
+                    self._promote(term)
+
+    @contextmanager
+    def bulk(self):
+        """Add many documents without keeping the completion lists up to date; they are rebuilt once at the end."""
+        with self.lock:
+            self._bulk = True
+            try:
+                yield self
+            finally:
+                self._bulk = False
+                self._rebuild_tops()
+
+    def remove(self, key):
+        """Drop a document; a no-op for unknown keys."""
+        with self.lock:
+            number = self.numbers.pop(key, None)
+            if number is None:
+                return
+            self.keys[number] = None
+            self.total_length -= self.lengths[number]
+            self.removed += 1
+            if self.removed > max(1000, len(self.numbers) // 4):
+                self.compact()
+
+    def compact(self):
+        """Purge removed documents from the postings and drop empty terms."""
+        with self.lock:
+            keys = self.keys
+            for term in list(self.postings):
+                documents, frequencies = self.postings[term]
+                kept = [(number, frequency) for number, frequency in zip(documents, frequencies) if keys[number] is not None]
+                if not kept:
+                    del self.postings[term]
+                    self._delete_term(term)
+                elif len(kept) != len(documents):
+                    self.postings[term] = (array('I', [n for n, _ in kept]), array('I', [f for _, f in kept]))
+            self.removed = 0
+            self._rebuild_tops()
+
+    # Trie
+
+    def _frequency(self, term):
+        return len(self.postings[term][0])
+
+    def _path(self, term, depth):
+        """The trie nodes from the root down to `depth` characters of term."""
+        path = [self.trie]
+        for char in term[:depth]:
+            path.append(path[-1].children[char])
+        return path
+
+    def _insert_term(self, term):
+        node = self.trie
+        for char in term:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = TrieNode()
+            node = child
+        node.term = term
+        # Not listed yet; its first posting promotes it
+        self.ranks[term] = [len(term) + 1, 0, node]
+
+    def _promote(self, term):
+        """List term in the tops above the shallowest one listing it, as far up as its frequency earns."""
+        postings = self.postings
+
+        def frequency_of(other):
+            return len(postings[other][0])
+
+        rank = self.ranks[term]
+        frequency = frequency_of(term)
+        node = rank[2]
+        if node is not None and len(node.top) >= self.max_expansions and frequency <= node.floor:
+            # Others raised the floor since the last attempt
+            rank[1] = node.floor
+            return
+        depth = rank[0]
+        path = self._path(term, depth - 1)
+        while depth > 0:
+            node = path[depth - 1]
+            if len(node.top) >= self.max_expansions:
+                if frequency <= node.floor:
+                    break
+                weakest = node.weakest
+                if weakest is None or frequency_of(weakest) != node.floor:
+                    # Members grew since the floor was set; find the least frequent again
+                    weakest = node.weakest = min(node.top, key=frequency_of)
+                    node.floor = frequency_of(weakest)
+                    if frequency <= node.floor:
+                        break
+                # Take its place here and in the tops above listing it too,
+                # where it is beaten as well; it stays in the ones below
+                listed_from = self.ranks[weakest][0]
+                for above in path[listed_from:depth]:
+                    above.top[above.top.index(weakest)] = term
+                    # Their floors stay lower bounds; the next contender rescans
+                    if above.weakest == weakest:
+                        above.weakest = None
+                self.ranks[weakest] = [depth, node.floor, node]
+                depth = listed_from
+                continue
+            node.top.append(term)
+            if len(node.top) == self.max_expansions:
+                node.weakest = min(node.top, key=frequency_of)
+                node.floor = frequency_of(node.weakest)
+            depth -= 1
+        rank[:] = [depth, path[depth - 1].floor, path[depth - 1]] if depth else [0, math.inf, None]
+
+    def _delete_term(self, term):
+        """Unlink a term from the trie; compact() rebuilds the tops afterwards."""
+        del self.ranks[term]
+        path = self._path(term, len(term))
+        path[-1].term = None
+        # Prune nodes left without terms below them
+        for depth in range(len(term), 0, -1):
+            if path[depth].children or path[depth].term is not None:
+                break
+            del path[depth - 1].children[term[depth - 1]]
+
+    def _rebuild_tops(self):
+        """Recompute every top from the children's, deepest nodes first, and the ranks with them."""
+        nodes = []
+        stack = [(self.trie, 0)]
+        while stack:
+            node, depth = stack.pop()
+            nodes.append((node, depth))
+            stack.extend((child, depth + 1) for child in node.children.values())
+
+        frequency_of = {term: len(entry[0]) for term, entry in self.postings.items()}.__getitem__
+        ranks = self.ranks
+        for node, depth in reversed(nodes):
+            candidates = [child_term for child in node.children.values() for child_term in child.top]
+            if node.term is not None:
+                candidates.append(node.term)
+            if len(candidates) > self.max_expansions:
+                node.top = heapq.nlargest(self.max_expansions, candidates, key=frequency_of)
+                node.weakest = node.top[-1]
+                node.floor = frequency_of(node.weakest)
+                listed = set(node.top)
+                for candidate in candidates:
+                    if candidate in listed:
+                        ranks[candidate][0] = depth
+                    else:
+                        ranks[candidate] = [depth + 1, node.floor, node]
+                continue
+            node.top = candidates
+            if len(candidates) == self.max_expansions:
+                node.weakest = min(candidates, key=frequency_of)
+                node.floor = frequency_of(node.weakest)
+            else:
+                node.weakest, node.floor = None, 0
+            for candidate in candidates:
+                ranks[candidate][0] = depth
+        for term in self.trie.top:
+            ranks[term][1:] = [math.inf, None]
+
+    def top_completions(self, prefix):
+        """The max_expansions most frequent terms starting with prefix, most frequent first."""
+        node = self.trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return sorted(node.top, key=self._frequency, reverse=True)
+
+    def suggest(self, prefix, limit=10):
+        """The `limit` most frequent indexed terms starting with prefix."""
+        prefix = prefix.lower()
+        if not prefix:
+            return []
+        with self.lock:
+            return self.top_completions(prefix)[:limit]
+
+    # Search
+
+    def _idf(self, document_frequency):
+        documents = max(len(self.numbers), 1)
+        # Postings still count removed documents until compaction; past the
+        # live count the idf would turn negative and drop every match
+        document_frequency = min(document_frequency, documents)
+        return math.log(1 + (documents - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def search(self, terms, prefix=True, accept=None, limit=20, offset=0):
+        """
+        Rank the documents containing every term; with prefix=True the last
+        term also matches longer terms. accept(key) may filter documents.
+        Returns ([(key, score)], total matches).
+        """
+        with self.lock:
+            if not terms or not self.numbers:
+                return [], 0
+
+            # Each query term becomes a list of (idf, documents, frequencies)
+            # for the index terms it matches
+            groups = []
+            for position, term in enumerate(terms):
+                if prefix and position == len(terms) - 1:
+                    matched = self.top_completions(term)
+                else:
+                    matched = [term] if term in self.postings else []
+                if not matched:
+                    return [], 0
+                groups.append([
+                    (self._idf(len(self.postings[t][0])), *self.postings[t]) for t in matched
+                ])
+
+            # Start from the query term with the fewest postings
+            groups.sort(key=lambda group: sum(len(documents) for _, documents, _ in group))
+            average_length = self.total_length / max(len(self.numbers), 1)
+            scores = {}
+            for idf, documents, frequencies in groups[0]:
+                for number, frequency in zip(documents, frequencies):
+                    key = self.keys[number]
+                    if key is None or (accept is not None and not accept(key)):
+                        continue
+                    score = self._score(idf, frequency, number, average_length)
+                    if scores.get(number, 0) < score:
+                        scores[number] = score
+
+            for group in groups[1:]:
+                if not scores:
+                    break
+                best = {}
+                for idf, documents, frequencies in group:
+                    if len(documents) <= len(scores) * 16:
+                        # Short postings: a scan beats a binary search per candidate
+                        matches = ((n, f) for n, f in zip(documents, frequencies) if n in scores)
+                    else:
+                        matches = self._probe(documents, frequencies, scores)
+                    for number, frequency in matches:
+                        score = self._score(idf, frequency, number, average_length)
+                        if best.get(number, 0) < score:
+                            best[number] = score
+                scores = {number: scores[number] + score for number, score in best.items()}
+
+            top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: item[1])[offset:]
+            return [(self.keys[number], score) for number, score in top], len(scores)
+
+    @staticmethod
+    def _probe(documents, frequencies, candidates):
+        """(doc number, frequency) of the candidates found in sorted postings."""
+        size = len(documents)
+        for number in candidates:
+            index = bisect_left(documents, number)
+            if index < size and documents[index] == number:
+                yield number, frequencies[index]
+
+    def _score(self, idf, frequency, number, average_length):
+        k1, b = self.k1, self.b
+        norm = k1 * (1 - b + b * self.lengths[number] / average_length)
+        return idf * frequency * (k1 + 1) / (frequency + norm)
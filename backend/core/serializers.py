@@ -1,13 +1,20 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.conf import settings
 from django.db import IntegrityError
 from .models import (
     Product, Solution, NewsArticle, ContactMessage, ContactInfo, ContactDescription,
     NavigationItem, HeroSection, Feature, TargetMarket,
     WhyChooseUs, AboutHero, CompanyOverview, MissionVision,
     TeamMember, Partner, PartnersDescription, TeamDescription,
-    UserRole, SiteSettings, Activity, ProductDescription, SolutionDescription, NewsDescription
+    UserRole, SiteSettings, Activity, ProductDescription, SolutionDescription, NewsDescription,
+    MediaJob, UploadSession
 )
+from .fields import MediaRenditionsField, MediaURLField
+from .logging import get_logger, redact
+from .media import get_media_metadata, media_metadata_dict
+
+logger = get_logger(__name__)
 
 class UserRoleSerializer(serializers.ModelSerializer):
     class Meta:
@@ -73,11 +80,11 @@ class UserSerializer(serializers.ModelSerializer):
             if password:
                 # Validate password against site settings
                 from .utils import validate_password_strength
-                from .models import SiteSettings
+                from .site_settings import get_site_settings
 
                 try:
                     # Get site settings
-                    settings = SiteSettings.objects.first()
+                    settings = get_site_settings()
                     # Validate password
                     validate_password_strength(password, settings)
                     # Set password if valid
@@ -107,11 +114,11 @@ class UserSerializer(serializers.ModelSerializer):
         if password:
             # Validate password against site settings
             from .utils import validate_password_strength
-            from .models import SiteSettings
+            from .site_settings import get_site_settings
 
             try:
                 # Get site settings
-                settings = SiteSettings.objects.first()
+                settings = get_site_settings()
                 # Validate password
                 validate_password_strength(password, settings)
                 # Set password if valid
@@ -134,22 +141,13 @@ class UserSerializer(serializers.ModelSerializer):
         return instance
 
 class ProductSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
+    image_renditions = MediaRenditionsField(source='image')
     image_file = serializers.ImageField(write_only=True, required=False)
 
     class Meta:
         model = Product
-        fields = ['id', 'name', 'description', 'items', 'image', 'image_file', 'created_at', 'updated_at']
-
-    def get_image(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the image
-                return request.build_absolute_uri(obj.image.url)
-            # Return the relative URL if no request context
-            return obj.image.url
-        return None
+        fields = ['id', 'name', 'description', 'items', 'image', 'image_renditions', 'image_file', 'created_at', 'updated_at']
 
     def create(self, validated_data):
         # Handle image file upload
@@ -177,15 +175,32 @@ class ProductSerializer(serializers.ModelSerializer):
         return instance
 
 class SolutionSerializer(serializers.ModelSerializer):
+    image_renditions = MediaRenditionsField(source='image')
+
     class Meta:
         model = Solution
         fields = '__all__'
 
 class NewsArticleSerializer(serializers.ModelSerializer):
+    image_renditions = MediaRenditionsField(source='image')
+
     class Meta:
         model = NewsArticle
         fields = '__all__'
 
+class NewsArticleListSerializer(serializers.ModelSerializer):
+    """News index entry: no article body. Expects the author to be select_related."""
+    image_renditions = MediaRenditionsField(source='image')
+    author_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = NewsArticle
+        fields = ['id', 'title', 'slug', 'excerpt', 'image', 'image_renditions', 'author', 'author_name', 'published_at']
+        read_only_fields = fields
+
+    def get_author_name(self, obj):
+        return obj.author.get_full_name() or obj.author.username
+
 class ContactMessageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ContactMessage
@@ -201,24 +216,15 @@ class ContactInfoSerializer(serializers.ModelSerializer):
         read_only_fields = ('created_at', 'updated_at')
 
 class ContactDescriptionSerializer(serializers.ModelSerializer):
-    background_image = serializers.SerializerMethodField()
+    background_image = MediaURLField()
+    background_image_renditions = MediaRenditionsField(source='background_image')
     background_image_file = serializers.ImageField(write_only=True, required=False)
 
     class Meta:
         model = ContactDescription
-        fields = ['id', 'title', 'description', 'background_image', 'background_image_file', 'created_at', 'updated_at']
+        fields = ['id', 'title', 'description', 'background_image', 'background_image_renditions', 'background_image_file', 'created_at', 'updated_at']
         read_only_fields = ('created_at', 'updated_at')
 
-    def get_background_image(self, obj):
-        if obj.background_image:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the image
-                return request.build_absolute_uri(obj.background_image.url)
-            # Return the relative URL if no request context
-            return obj.background_image.url
-        return None
-
     def create(self, validated_data):
         # Handle image file upload
         background_image_file = validated_data.pop('background_image_file', None)
@@ -247,8 +253,8 @@ class ContactDescriptionSerializer(serializers.ModelSerializer):
             if instance.background_image:
                 try:
                     instance.background_image.delete(save=False)
-                except Exception as e:
-                    print(f"Error deleting old image: {str(e)}")
+                except Exception:
+                    logger.exception('Error deleting old image')
 
             # Set the new image
             instance.background_image = background_image_file
@@ -262,38 +268,25 @@ class NavigationItemSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class HeroSectionSerializer(serializers.ModelSerializer):
-    background_image = serializers.SerializerMethodField()
+    background_image = MediaURLField()
+    background_image_renditions = MediaRenditionsField(source='background_image')
     background_image_file = serializers.ImageField(write_only=True, required=False)
 
     class Meta:
         model = HeroSection
-        fields = ['id', 'title', 'description', 'button_text', 'button_link', 'background_image', 'background_image_file']
-
-    def get_background_image(self, obj):
-        if obj.background_image:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the image
-                return request.build_absolute_uri(obj.background_image.url)
-            # Return the relative URL if no request context
-            return obj.background_image.url
-        return None
+        fields = ['id', 'title', 'description', 'button_text', 'button_link', 'background_image', 'background_image_renditions', 'background_image_file']
 
     def create(self, validated_data):
         # Handle image file upload
         background_image_file = validated_data.pop('background_image_file', None)
 
-        # Debug log
-        print(f"Creating new hero section")
-        print(f"Validated data: {validated_data}")
-        print(f"Background image file: {background_image_file}")
+        logger.debug('Creating hero section', data=redact(validated_data), image=redact(background_image_file))
 
         # Create the hero section
         hero_section = HeroSection.objects.create(**validated_data)
 
         # Handle image file if provided
         if background_image_file:
-            print(f"Setting background_image to {background_image_file}")
             hero_section.background_image = background_image_file
             hero_section.save()
 
@@ -303,10 +296,7 @@ class HeroSectionSerializer(serializers.ModelSerializer):
         # Handle image file upload
         background_image_file = validated_data.pop('background_image_file', None)
 
-        # Debug log
-        print(f"Updating hero section {instance.id}")
-        print(f"Validated data: {validated_data}")
-        print(f"Background image file: {background_image_file}")
+        logger.debug('Updating hero section', instance=instance.id, data=redact(validated_data), image=redact(background_image_file))
 
         # Update fields
         for attr, value in validated_data.items():
@@ -317,10 +307,9 @@ class HeroSectionSerializer(serializers.ModelSerializer):
             # If there's an existing image, delete it to avoid orphaned files
             if instance.background_image:
                 try:
-                    print(f"Deleting old image: {instance.background_image.path}")
                     instance.background_image.delete(save=False)
-                except Exception as e:
-                    print(f"Error deleting old image: {str(e)}")
+                except Exception:
+                    logger.exception('Error deleting old image')
 
             # Set the new image
             instance.background_image = background_image_file
@@ -334,21 +323,12 @@ class FeatureSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class TargetMarketSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
+    image_renditions = MediaRenditionsField(source='image')
 
     class Meta:
         model = TargetMarket
-        fields = ['id', 'title', 'description', 'image']
-
-    def get_image(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the image
-                return request.build_absolute_uri(obj.image.url)
-            # Return the relative URL if no request context
-            return obj.image.url
-        return None
+        fields = ['id', 'title', 'description', 'image', 'image_renditions']
 
 class WhyChooseUsSerializer(serializers.ModelSerializer):
     class Meta:
@@ -356,40 +336,27 @@ class WhyChooseUsSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class AboutHeroSerializer(serializers.ModelSerializer):
-    background_image = serializers.SerializerMethodField()
+    background_image = MediaURLField()
+    background_image_renditions = MediaRenditionsField(source='background_image')
     background_image_file = serializers.ImageField(write_only=True, required=False)
     title = serializers.CharField(required=False, allow_blank=True)
     description = serializers.CharField(required=False, allow_blank=True)
 
     class Meta:
         model = AboutHero
-        fields = ['id', 'title', 'description', 'background_image', 'background_image_file']
-
-    def get_background_image(self, obj):
-        if obj.background_image:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the image
-                return request.build_absolute_uri(obj.background_image.url)
-            # Return the relative URL if no request context
-            return obj.background_image.url
-        return None
+        fields = ['id', 'title', 'description', 'background_image', 'background_image_renditions', 'background_image_file']
 
     def create(self, validated_data):
         # Handle image file upload
         background_image_file = validated_data.pop('background_image_file', None)
 
-        # Debug log
-        print(f"Creating new about hero section")
-        print(f"Validated data: {validated_data}")
-        print(f"Background image file: {background_image_file}")
+        logger.debug('Creating about hero section', data=redact(validated_data), image=redact(background_image_file))
 
         # Process validated data to handle empty strings
         processed_data = {}
         for attr, value in validated_data.items():
             # Check if title or description are explicitly set to empty strings
             if attr in ['title', 'description'] and value == '':
-                print(f"Setting {attr} to None for create")
                 processed_data[attr] = None
             else:
                 processed_data[attr] = value
@@ -399,7 +366,6 @@ class AboutHeroSerializer(serializers.ModelSerializer):
 
         # Handle image file if provided
         if background_image_file:
-            print(f"Setting background_image to {background_image_file}")
             about_hero.background_image = background_image_file
             about_hero.save()
 
@@ -409,16 +375,12 @@ class AboutHeroSerializer(serializers.ModelSerializer):
         # Handle image file upload
         background_image_file = validated_data.pop('background_image_file', None)
 
-        # Debug log
-        print(f"Updating about hero section {instance.id}")
-        print(f"Validated data: {validated_data}")
-        print(f"Background image file: {background_image_file}")
+        logger.debug('Updating about hero section', instance=instance.id, data=redact(validated_data), image=redact(background_image_file))
 
         # Update fields
         for attr, value in validated_data.items():
             # Check if title or description are explicitly set to empty strings
             if attr in ['title', 'description'] and value == '':
-                print(f"Setting {attr} to None")
                 setattr(instance, attr, None)
             else:
                 setattr(instance, attr, value)
@@ -428,10 +390,9 @@ class AboutHeroSerializer(serializers.ModelSerializer):
             # If there's an existing image, delete it to avoid orphaned files
             if instance.background_image:
                 try:
-                    print(f"Deleting old image: {instance.background_image.path}")
                     instance.background_image.delete(save=False)
-                except Exception as e:
-                    print(f"Error deleting old image: {str(e)}")
+                except Exception:
+                    logger.exception('Error deleting old image')
 
             # Set the new image
             instance.background_image = background_image_file
@@ -450,31 +411,21 @@ class MissionVisionSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class TeamMemberSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
+    image_renditions = MediaRenditionsField(source='image')
     image_file = serializers.ImageField(write_only=True, required=False)
 
     class Meta:
         model = TeamMember
-        fields = ['id', 'name', 'position', 'image', 'image_file']
-
-    def get_image(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the image
-                return request.build_absolute_uri(obj.image.url)
-            # Return the relative URL if no request context
-            return obj.image.url
-        return None
+        fields = ['id', 'name', 'position', 'image', 'image_renditions', 'image_file']
 
     def update(self, instance, validated_data):
         # Handle image update separately
         image_file = self.context['request'].FILES.get('image')
         if image_file:
-            print(f"Updating image for team member {instance.id} with file: {image_file.name}")
+            logger.debug('Updating team member image', instance=instance.id, image=image_file.name)
             # If there's an existing image, delete it to avoid orphaned files
             if instance.image:
-                print(f"Deleting old image: {instance.image.path}")
                 instance.image.delete(save=False)
             # Set the new image
             instance.image = image_file
@@ -489,28 +440,19 @@ class TeamMemberSerializer(serializers.ModelSerializer):
         # Handle image creation separately
         image_file = self.context['request'].FILES.get('image')
         if image_file:
-            print(f"Creating team member with image file: {image_file.name}")
+            logger.debug('Creating team member with image', image=image_file.name)
             validated_data['image'] = image_file
 
         return super().create(validated_data)
 
 class PartnerSerializer(serializers.ModelSerializer):
-    logo = serializers.SerializerMethodField()
+    logo = MediaURLField()
+    logo_renditions = MediaRenditionsField(source='logo')
     logo_file = serializers.ImageField(write_only=True, required=False)
 
     class Meta:
         model = Partner
-        fields = ['id', 'name', 'logo', 'logo_file']
-
-    def get_logo(self, obj):
-        if obj.logo:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the logo
-                return request.build_absolute_uri(obj.logo.url)
-            # Return the relative URL if no request context
-            return obj.logo.url
-        return None
+        fields = ['id', 'name', 'logo', 'logo_renditions', 'logo_file']
 
     def create(self, validated_data):
         # Handle logo file upload
@@ -592,11 +534,10 @@ class SiteSettingsSerializer(serializers.ModelSerializer):
         footer_links = self.initial_data.get('footerLinks', [])
         social_links = self.initial_data.get('socialLinks', [])
 
-        # Log what we're updating
-        print(f"Updating SiteSettings with ID {instance.id}")
-        print(f"Password policy: {password_policy}")
-        print(f"Footer links: {footer_links}")
-        print(f"Social links: {social_links}")
+        logger.debug(
+            'Updating site settings', instance=instance.id, password_policy=redact(password_policy),
+            footer_links=footer_links, social_links=social_links,
+        )
 
         # Update password policy fields if they exist
         if password_policy:
@@ -640,111 +581,39 @@ class ActivitySerializer(serializers.ModelSerializer):
 
 
 class ProductDescriptionSerializer(serializers.ModelSerializer):
-    hero_image = serializers.SerializerMethodField()
+    hero_image = MediaURLField()
+    hero_image_renditions = MediaRenditionsField(source='hero_image')
+    hero_image_meta = serializers.SerializerMethodField()
     hero_image_file = serializers.ImageField(write_only=True, required=False)
     title = serializers.CharField(required=False, allow_blank=True)
     description = serializers.CharField(required=False, allow_blank=True)
 
     class Meta:
         model = ProductDescription
-        fields = ['id', 'title', 'description', 'hero_image', 'hero_image_file', 'created_at', 'updated_at']
-
-    def get_hero_image(self, obj):
-        if not obj:
-            print("WARNING: Object is None in get_hero_image")
-            return None
+        fields = ['id', 'title', 'description', 'hero_image', 'hero_image_renditions', 'hero_image_meta', 'hero_image_file', 'created_at', 'updated_at']
 
-        if not hasattr(obj, 'hero_image'):
-            print(f"WARNING: Object {obj} has no hero_image attribute")
-            return None
-
-        if not obj.hero_image:
-            print(f"No hero image for product description {obj.id}")
-            return None
-
-        if not obj.hero_image.name:
-            print(f"Hero image has no name for product description {obj.id}")
-            return None
-
-        try:
-            # Debug log
-            print(f"Hero image for product description {obj.id}: {obj.hero_image}")
-            print(f"Hero image name: {obj.hero_image.name}")
-
-            try:
-                print(f"Hero image URL: {obj.hero_image.url}")
-            except Exception as url_error:
-                print(f"Error getting hero image URL: {str(url_error)}")
-                return None
-
-            # Check if the file exists
-            import os
-            from django.conf import settings
-
-            try:
-                file_path = os.path.join(settings.MEDIA_ROOT, obj.hero_image.name)
-                if not os.path.exists(file_path):
-                    print(f"WARNING: Hero image file does not exist at {file_path}")
-                else:
-                    file_size = os.path.getsize(file_path)
-                    print(f"Hero image file size: {file_size} bytes")
-                    if file_size == 0:
-                        print(f"WARNING: Hero image file is empty (0 bytes)")
-            except Exception as file_error:
-                print(f"Error checking file: {str(file_error)}")
-
-            # Always return the absolute URL with the correct domain
-            # This ensures the frontend can access the image
-            request = self.context.get('request')
-            if request:
-                try:
-                    # Build absolute URI for the image
-                    full_url = request.build_absolute_uri(obj.hero_image.url)
-                    print(f"Full hero image URL: {full_url}")
-                    return full_url
-                except Exception as request_error:
-                    print(f"Error building absolute URI: {str(request_error)}")
-
-            # If no request context, construct a URL that will work
-            # This is a fallback that should rarely be used
-            try:
-                base_url = "http://localhost:8000"  # Adjust based on your environment
-                full_url = f"{base_url}{obj.hero_image.url}"
-                print(f"Fallback full URL: {full_url}")
-                return full_url
-            except Exception as fallback_error:
-                print(f"Error creating fallback URL: {str(fallback_error)}")
-                return None
-
-        except Exception as e:
-            print(f"Error getting hero image URL: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return None
+    def get_hero_image_meta(self, obj):
+        # Recorded at upload time (core.media); never touches the storage
+        return media_metadata_dict(get_media_metadata(self, obj.hero_image))
 
     def create(self, validated_data):
         # Handle image file upload
         hero_image_file = validated_data.pop('hero_image_file', None)
 
-        # Debug log
-        print(f"Creating new product description")
-        print(f"Validated data: {validated_data}")
-        print(f"Hero image file: {hero_image_file}")
+        logger.debug('Creating product description', data=redact(validated_data), image=redact(hero_image_file))
 
         # Create the product description
         product_description = ProductDescription.objects.create(**validated_data)
 
         # Handle image file if provided
         if hero_image_file:
-            print(f"Setting hero_image to {hero_image_file}")
             product_description.hero_image = hero_image_file
 
             # Save the instance
             try:
                 product_description.save()
-                print(f"Product description saved successfully with image")
-            except Exception as e:
-                print(f"Error saving product description with image: {str(e)}")
+            except Exception:
+                logger.exception('Error saving product description with image')
                 raise
 
         return product_description
@@ -753,19 +622,14 @@ class ProductDescriptionSerializer(serializers.ModelSerializer):
         # Handle image file upload
         hero_image_file = validated_data.pop('hero_image_file', None)
 
-        # Debug log
-        print(f"Updating product description {instance.id}")
-        print(f"Validated data: {validated_data}")
-        print(f"Hero image file: {hero_image_file}")
+        logger.debug('Updating product description', instance=instance.id, data=redact(validated_data), image=redact(hero_image_file))
 
         # Check if title or description are explicitly set to empty strings
         # This is different from them not being present in validated_data
         if 'title' in validated_data and validated_data['title'] == '':
-            print("Setting title to None")
             validated_data['title'] = None
 
         if 'description' in validated_data and validated_data['description'] == '':
-            print("Setting description to None")
             validated_data['description'] = None
 
         # Create a copy of the instance to avoid modifying it directly
@@ -777,34 +641,29 @@ class ProductDescriptionSerializer(serializers.ModelSerializer):
         for attr, value in validated_data.items():
             # Skip empty strings for optional fields if the current value is not empty
             if attr in ['title', 'description'] and value == "" and getattr(instance_copy, attr, None):
-                print(f"Skipping empty {attr} as current value exists")
                 continue
 
             try:
                 setattr(instance_copy, attr, value)
-                print(f"Set {attr} to {value}")
-            except Exception as attr_error:
-                print(f"Error setting {attr}: {str(attr_error)}")
+            except Exception:
+                logger.exception('Error setting attribute', attr=attr)
                 # Continue with other attributes
 
         # Handle image file if provided
         if hero_image_file:
-            print(f"Setting hero_image to {hero_image_file}")
             try:
                 # If there's an existing image, delete it to avoid orphaned files
                 if instance_copy.hero_image:
                     try:
-                        print(f"Deleting old image: {instance_copy.hero_image.path}")
                         instance_copy.hero_image.delete(save=False)
-                    except Exception as e:
-                        print(f"Error deleting old image: {str(e)}")
+                    except Exception:
+                        logger.exception('Error deleting old image')
                         # Continue even if delete fails
 
                 # Set the new image
                 instance_copy.hero_image = hero_image_file
-                print(f"New hero_image set: {instance_copy.hero_image}")
-            except Exception as e:
-                print(f"Error setting hero image: {str(e)}")
+            except Exception:
+                logger.exception('Error setting hero image', instance=instance.id)
                 # Continue without setting the image
 
         # Save the instance
@@ -816,136 +675,48 @@ class ProductDescriptionSerializer(serializers.ModelSerializer):
                     try:
                         value = getattr(instance_copy, field_name)
                         setattr(instance, field_name, value)
-                    except Exception as field_error:
-                        print(f"Error copying field {field_name}: {str(field_error)}")
+                    except Exception:
+                        logger.exception('Error copying field', field=field_name)
 
             # Save the instance
             instance.save()
-            print(f"Product description saved successfully")
             return instance
-        except Exception as e:
-            print(f"Error saving product description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception('Error saving product description', instance=instance.id)
             # Return the original instance instead of raising an exception
             # This prevents the 500 error
             return instance
 
 
 class SolutionDescriptionSerializer(serializers.ModelSerializer):
-    hero_image = serializers.SerializerMethodField()
+    hero_image = MediaURLField()
+    hero_image_renditions = MediaRenditionsField(source='hero_image')
     hero_image_file = serializers.ImageField(write_only=True, required=False)
     title = serializers.CharField(required=False, allow_blank=True)
     description = serializers.CharField(required=False, allow_blank=True)
 
     class Meta:
         model = SolutionDescription
-        fields = ['id', 'title', 'description', 'hero_image', 'hero_image_file', 'created_at', 'updated_at']
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        print(f"SolutionDescriptionSerializer.__init__: instance={getattr(self, 'instance', None)}")
-        # Only try to access hero_image if instance is a single object, not a QuerySet
-        if hasattr(self, 'instance') and self.instance and not hasattr(self.instance, '__iter__'):
-            try:
-                print(f"SolutionDescriptionSerializer.__init__: instance.hero_image={self.instance.hero_image}")
-                if self.instance.hero_image:
-                    print(f"SolutionDescriptionSerializer.__init__: instance.hero_image.url={self.instance.hero_image.url}")
-                    print(f"SolutionDescriptionSerializer.__init__: instance.hero_image.name={self.instance.hero_image.name}")
-                    print(f"SolutionDescriptionSerializer.__init__: instance.hero_image.path={self.instance.hero_image.path}")
-            except Exception as e:
-                print(f"Error accessing hero_image in __init__: {str(e)}")
-        print(f"SolutionDescriptionSerializer.__init__: context={getattr(self, 'context', None)}")
-
-    def get_hero_image(self, obj):
-        try:
-            if not obj:
-                print("WARNING: Object is None in get_hero_image")
-                # Return null and let the frontend handle it
-                return None
-
-            if not hasattr(obj, 'hero_image'):
-                print(f"WARNING: Object {obj} has no hero_image attribute")
-                # Return null and let the frontend handle it
-                return None
-
-            if not obj.hero_image:
-                print(f"No hero image for solution description {obj.id}")
-                # Return null and let the frontend handle it
-                return None
-
-            if not obj.hero_image.name:
-                print(f"Hero image has no name for solution description {obj.id}")
-                # Return null and let the frontend handle it
-                return None
-
-            # Debug log
-            print(f"Hero image for solution description {obj.id}: {obj.hero_image}")
-            print(f"Hero image name: {obj.hero_image.name}")
-
-            try:
-                hero_image_url = obj.hero_image.url
-                print(f"Hero image URL: {hero_image_url}")
-            except Exception as url_error:
-                print(f"Error getting hero image URL: {str(url_error)}")
-                # Return null and let the frontend handle it
-                return None
-
-            # Always return the absolute URL with the correct domain
-            request = self.context.get('request')
-            if request:
-                try:
-                    # Get the base URL from the request
-                    base_url = request.build_absolute_uri('/').rstrip('/')
-
-                    # Simple approach: just return the URL as is if it's absolute,
-                    # or prepend the base URL if it's relative
-                    if hero_image_url.startswith(('http://', 'https://')):
-                        return hero_image_url
-                    elif hero_image_url.startswith('/'):
-                        return f"{base_url}{hero_image_url}"
-                    else:
-                        return f"{base_url}/{hero_image_url}"
-                except Exception as request_error:
-                    print(f"Error building absolute URI: {str(request_error)}")
-                    # Return the original URL
-                    return hero_image_url
-
-            # If no request context, return the relative URL
-            return hero_image_url
-
-        except Exception as e:
-            print(f"Error in get_hero_image: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            # Return null and let the frontend handle it
-            return None
+        fields = ['id', 'title', 'description', 'hero_image', 'hero_image_renditions', 'hero_image_file', 'created_at', 'updated_at']
 
     def create(self, validated_data):
         # Handle image file upload
         hero_image_file = validated_data.pop('hero_image_file', None)
 
-        # Debug log
-        print(f"Creating new solution description")
-        print(f"Validated data: {validated_data}")
-        print(f"Hero image file: {hero_image_file}")
+        logger.debug('Creating solution description', data=redact(validated_data), image=redact(hero_image_file))
 
         # Create the solution description
         solution_description = SolutionDescription.objects.create(**validated_data)
 
         # Handle image file if provided
         if hero_image_file:
-            print(f"Setting hero_image to {hero_image_file}")
             solution_description.hero_image = hero_image_file
 
             # Save the instance
             try:
                 solution_description.save()
-                print(f"Solution description saved successfully with image")
-            except Exception as e:
-                print(f"Error saving solution description with image: {str(e)}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception('Error saving solution description with image')
                 raise
 
         return solution_description
@@ -954,89 +725,66 @@ class SolutionDescriptionSerializer(serializers.ModelSerializer):
         # Handle image file upload
         hero_image_file = validated_data.pop('hero_image_file', None)
 
-        # Debug log
-        print(f"Updating solution description {instance.id}")
-        print(f"Validated data: {validated_data}")
-        print(f"Hero image file: {hero_image_file}")
+        logger.debug('Updating solution description', instance=instance.id, data=redact(validated_data), image=redact(hero_image_file))
 
         # Update fields
         for attr, value in validated_data.items():
             try:
                 setattr(instance, attr, value)
-                print(f"Set {attr} to {value}")
-            except Exception as attr_error:
-                print(f"Error setting {attr}: {str(attr_error)}")
+            except Exception:
+                logger.exception('Error setting attribute', attr=attr)
                 # Continue with other attributes
 
         # Handle image file if provided
         if hero_image_file:
-            print(f"Setting hero_image to {hero_image_file}")
             try:
                 # If there's an existing image, delete it to avoid orphaned files
                 if instance.hero_image:
                     try:
-                        print(f"Deleting old image: {instance.hero_image.path}")
                         instance.hero_image.delete(save=False)
-                    except Exception as e:
-                        print(f"Error deleting old image: {str(e)}")
+                    except Exception:
+                        logger.exception('Error deleting old image')
                         # Continue even if delete fails
 
                 # Set the new image
                 instance.hero_image = hero_image_file
-                print(f"New hero_image set: {instance.hero_image}")
-            except Exception as e:
-                print(f"Error setting hero image: {str(e)}")
+            except Exception:
+                logger.exception('Error setting hero image', instance=instance.id)
                 # Continue without setting the image
 
         # Save the instance
         try:
             instance.save()
-            print(f"Solution description saved successfully")
             return instance
-        except Exception as e:
-            print(f"Error saving solution description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception('Error saving solution description', instance=instance.id)
             # Return the instance anyway to prevent 500 error
             return instance
 
 
 class NewsDescriptionSerializer(serializers.ModelSerializer):
-    hero_image = serializers.SerializerMethodField()
+    hero_image = MediaURLField()
+    hero_image_renditions = MediaRenditionsField(source='hero_image')
     hero_image_file = serializers.ImageField(write_only=True, required=False)
     title = serializers.CharField(required=False, allow_blank=True, allow_null=True)
     description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
 
     class Meta:
         model = NewsDescription
-        fields = ['id', 'title', 'description', 'hero_image', 'hero_image_file', 'created_at', 'updated_at']
+        fields = ['id', 'title', 'description', 'hero_image', 'hero_image_renditions', 'hero_image_file', 'created_at', 'updated_at']
         read_only_fields = ('created_at', 'updated_at')
 
-    def get_hero_image(self, obj):
-        if obj.hero_image:
-            request = self.context.get('request')
-            if request:
-                # Build absolute URI for the image
-                return request.build_absolute_uri(obj.hero_image.url)
-            # Return the relative URL if no request context
-            return obj.hero_image.url
-        return None
-
     def create(self, validated_data):
         # Handle image file upload
         hero_image_file = validated_data.pop('hero_image_file', None)
 
-        # Debug log
-        print(f"Creating new news description")
-        print(f"Validated data: {validated_data}")
-        print(f"Hero image file: {hero_image_file}")
+        logger.debug('Creating news description', data=redact(validated_data), image=redact(hero_image_file))
 
         # Process validated data to handle empty strings
         processed_data = {}
         for attr, value in validated_data.items():
             # Check if title or description are explicitly set to empty strings
             if attr in ['title', 'description'] and value == '':
-                print(f"Setting {attr} to None for create")
                 processed_data[attr] = None
             else:
                 processed_data[attr] = value
@@ -1046,7 +794,6 @@ class NewsDescriptionSerializer(serializers.ModelSerializer):
 
         # Handle image file if provided
         if hero_image_file:
-            print(f"Setting hero_image to {hero_image_file}")
             news_description.hero_image = hero_image_file
             news_description.save()
 
@@ -1056,16 +803,12 @@ class NewsDescriptionSerializer(serializers.ModelSerializer):
         # Handle image file upload
         hero_image_file = validated_data.pop('hero_image_file', None)
 
-        # Debug log
-        print(f"Updating news description {instance.id}")
-        print(f"Validated data: {validated_data}")
-        print(f"Hero image file: {hero_image_file}")
+        logger.debug('Updating news description', instance=instance.id, data=redact(validated_data), image=redact(hero_image_file))
 
         # Update fields
         for attr, value in validated_data.items():
             # Check if title or description are explicitly set to empty strings
             if attr in ['title', 'description'] and value == '':
-                print(f"Setting {attr} to None")
                 setattr(instance, attr, None)
             else:
                 setattr(instance, attr, value)
@@ -1075,10 +818,9 @@ class NewsDescriptionSerializer(serializers.ModelSerializer):
             # If there's an existing image, delete it to avoid orphaned files
             if instance.hero_image:
                 try:
-                    print(f"Deleting old image: {instance.hero_image.path}")
                     instance.hero_image.delete(save=False)
-                except Exception as e:
-                    print(f"Error deleting old image: {str(e)}")
+                except Exception:
+                    logger.exception('Error deleting old image')
 
             # Set the new image
             instance.hero_image = hero_image_file
@@ -1097,3 +839,41 @@ class PartnerDescriptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = PartnersDescription
         fields = '__all__'
+
+
+class MediaJobSerializer(serializers.ModelSerializer):
+    media = serializers.CharField(source='media.name', read_only=True)
+
+    class Meta:
+        model = MediaJob
+        fields = ['id', 'media', 'kind', 'status', 'progress', 'attempts', 'max_attempts', 'error',
+                  'available_at', 'started_at', 'finished_at', 'created_at', 'updated_at']
+        read_only_fields = fields
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadSession
+        fields = ['id', 'filename', 'content_type', 'size', 'received', 'sha256', 'status', 'expires_at', 'created_at']
+        read_only_fields = ['id', 'received', 'status', 'expires_at', 'created_at']
+
+    def validate_size(self, value):
+        max_size = getattr(settings, 'UPLOAD_SESSION_MAX_SIZE', 200 * 1024 * 1024)
+        if value <= 0:
+            raise serializers.ValidationError("Size must be positive.")
+        if value > max_size:
+            raise serializers.ValidationError(f"Uploads are limited to {max_size} bytes.")
+        return value
+
+    def validate_sha256(self, value):
+        value = value.lower()
+        if value and (len(value) != 64 or any(c not in '0123456789abcdef' for c in value)):
+            raise serializers.ValidationError("Expected a hex-encoded SHA-256 digest.")
+        return value
+
+
+class UploadFinalizeSerializer(serializers.Serializer):
+    model = serializers.CharField()  # Model name, e.g. "product" or "herosection"
+    field = serializers.CharField()  # Image field, e.g. "image" or "background_image"
+    object_id = serializers.CharField()
+    sha256 = serializers.CharField(required=False, allow_blank=True, default='')
@@ -1,6 +1,11 @@
 from django.contrib.auth.models import User
 from django.db import transaction
-from .models import UserRole
+from .models import NewsArticle, UserRole
+from .cache import bump_model_version
+from .media import record_instance_media, release_instance_media, snapshot_media_names
+from .search import engine_document_deleted, engine_document_saved, index_instance, remove_instance
+from .site_settings import invalidate_site_settings
+from .tokens import invalidate_role_claims
 import logging
 
 logger = logging.getLogger(__name__)
@@ -38,3 +43,118 @@ def create_default_admin(sender, **kwargs):
                 logger.warning("No admin users found. You may want to create one using the create_superadmin management command.")
     except Exception as e:
         logger.error(f"Error creating default admin user: {str(e)}")
+
+
+def bump_cached_model_version(sender, **kwargs):
+    """
+    Invalidate cached API responses and page bundles built from the sender model,
+    once the write commits: bumped earlier, a concurrent read could cache the
+    old rows under the new version.
+    This function is connected to post_save and post_delete in the CoreConfig.ready method.
+    """
+    transaction.on_commit(lambda: bump_model_version(sender))
+
+
+# The User fields news articles show as their author's name (see
+# NewsArticleListSerializer.get_author_name)
+AUTHOR_NAME_FIELDS = ('first_name', 'last_name', 'username')
+
+
+def remember_author_name(sender, instance, update_fields=None, **kwargs):
+    """
+    Read the stored name of a user about to be saved, to compare after the
+    save. Saves that cannot touch it (e.g. last_login on every login) are
+    skipped without a query.
+    This function is connected to pre_save in the CoreConfig.ready method.
+    """
+    instance._saved_author_name = None
+    if instance.pk is None or (update_fields is not None and not set(update_fields) & set(AUTHOR_NAME_FIELDS)):
+        return
+    instance._saved_author_name = User.objects.filter(pk=instance.pk).values_list(*AUTHOR_NAME_FIELDS).first()
+
+
+def bump_news_on_author_rename(sender, instance, **kwargs):
+    """
+    Invalidate cached news responses when a user's name changed, since the
+    articles show it; any other User save leaves them cached.
+    This function is connected to post_save in the CoreConfig.ready method.
+    """
+    saved = getattr(instance, '_saved_author_name', None)
+    if saved is not None and saved != tuple(getattr(instance, field) for field in AUTHOR_NAME_FIELDS):
+        transaction.on_commit(lambda: bump_model_version(NewsArticle))
+
+
+def record_uploaded_media(sender, instance, **kwargs):
+    """
+    Capture integrity metadata (size, hash, dimensions) of newly stored images.
+    This function is connected to post_save in the CoreConfig.ready method.
+    """
+    record_instance_media(instance)
+
+
+def remember_media_names(sender, instance, **kwargs):
+    """
+    Read the image names stored for an instance, to diff them after the save.
+    This function is connected to pre_save in the CoreConfig.ready method.
+    """
+    snapshot_media_names(instance)
+
+
+def release_deleted_media(sender, instance, **kwargs):
+    """
+    Drop the media references of a deleted row; media_gc reclaims the files.
+    This function is connected to post_delete in the CoreConfig.ready method.
+    """
+    release_instance_media(instance)
+
+
+def update_search_index(sender, instance, **kwargs):
+    """
+    Refresh the search document of a saved product, solution or article.
+    This function is connected to post_save in the CoreConfig.ready method.
+    """
+    index_instance(instance)
+
+
+def remove_from_search_index(sender, instance, **kwargs):
+    """
+    Drop the search document of a deleted product, solution or article.
+    This function is connected to post_delete in the CoreConfig.ready method.
+    """
+    remove_instance(instance)
+
+
+def patch_search_engine(sender, instance, **kwargs):
+    """
+    Add a saved search document to this process's in-memory search engine.
+    This function is connected to post_save in the CoreConfig.ready method.
+    """
+    engine_document_saved(instance)
+
+
+def unpatch_search_engine(sender, instance, **kwargs):
+    """
+    Remove a deleted search document from this process's in-memory search engine.
+    This function is connected to post_delete in the CoreConfig.ready method.
+    """
+    engine_document_deleted(instance)
+
+
+def reload_site_settings(sender, instance, **kwargs):
+    """
+    Drop this process's cached site settings so the next read sees the change.
+    This function is connected to post_save and post_delete in the CoreConfig.ready method.
+    """
+    invalidate_site_settings()
+
+
+def refresh_role_claims(sender, instance, **kwargs):
+    """
+    Drop the cached role claims of the user whose User or UserRole row changed,
+    so tokens issued before the change are evaluated with the new ones.
+    This function is connected to post_save and post_delete in the CoreConfig.ready method.
+    """
+    user_id = instance.pk if sender is User else instance.user_id
+    invalidate_role_claims(user_id)
+    # Again once committed, in case a request cached the old row meanwhile
+    transaction.on_commit(lambda: invalidate_role_claims(user_id))
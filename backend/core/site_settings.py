@@ -0,0 +1,63 @@
+"""
+Process-local copy of the SiteSettings row.
+
+get_site_settings() keeps the row in memory and revalidates it against the
+SiteSettings version counter (core.cache, bumped on every save) at most
+every SITE_SETTINGS_REVALIDATE_MS milliseconds:
+
+    between checks   no query, no cache lookup
+    check            one cache read of the version counter
+    reload           one query, only after the row changed
+
+Saves in this process drop the copy at once (see core.signals); other
+workers pick the change up at their next check, provided they share the
+cache backend (see core.cache).
+
+The returned instance is shared between threads and requests: read it,
+never modify or save it.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+from .cache import get_model_version
+
+# (SiteSettings, version it was loaded at, monotonic time of the last check)
+_snapshot = None
+_load_lock = threading.Lock()
+
+
+def get_site_settings():
+    """The site settings, created with their defaults if there are none yet."""
+    global _snapshot
+
+    from .models import SiteSettings
+
+    snapshot = _snapshot
+    now = time.monotonic()
+    interval = getattr(settings, 'SITE_SETTINGS_REVALIDATE_MS', 1000) / 1000
+    if snapshot is not None and now - snapshot[2] < interval:
+        return snapshot[0]
+
+    # Read the version before the row: a save landing in between bumps it
+    # again, so the next check reloads
+    version = get_model_version(SiteSettings)
+    if snapshot is not None and snapshot[1] == version:
+        _snapshot = (snapshot[0], version, now)
+        return snapshot[0]
+
+    with _load_lock:
+        snapshot = _snapshot
+        if snapshot is not None and snapshot[1] == version:
+            return snapshot[0]
+        instance, _ = SiteSettings.objects.get_or_create(pk=1)
+        _snapshot = (instance, version, now)
+    return instance
+
+
+def invalidate_site_settings():
+    """Drop this process's copy; the next read reloads it."""
+    global _snapshot
+    _snapshot = None
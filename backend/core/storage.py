@@ -0,0 +1,100 @@
+"""
+Content-addressed media storage.
+
+Every saved file is stored once, under the SHA-256 of its content:
+
+    blobs/ab/cd/abcd1234...ef.png
+
+Uploading the same image twice (or to several rows) reuses the existing
+blob, and because a blob name can never point at different bytes its URL
+is immutable and can be cached for a year (see core.media_views).
+
+Blobs are shared, so delete() does not remove them: MediaFile.ref_count
+tracks how many image fields use each one (see core.media), and the
+media_gc command reclaims blobs that nothing references any more.
+"""
+
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+BLOB_PREFIX = 'blobs/'
+
+
+def is_blob_name(name):
+    """True for names written by ContentAddressedStorage, whose content never changes."""
+    return name.startswith(BLOB_PREFIX)
+
+
+def blob_name(digest, extension=''):
+    return f'{BLOB_PREFIX}{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}'
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage that names files after the hash of their content.
+
+    The requested name (upload_to path) only contributes its extension, so
+    the file is still served with the right content type.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is derived from the content in _save(); an equal
+        # name means equal bytes, so there is never anything to avoid
+        return name
+
+    def _save(self, name, content):
+        # Spool to a temporary file in the blob tree while hashing, then move
+        # it into place atomically. A concurrent save of the same content
+        # simply replaces the blob with identical bytes.
+        digest = hashlib.sha256()
+        temp_dir = self.path(BLOB_PREFIX)
+        os.makedirs(temp_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    file.write(chunk)
+
+            final_name = blob_name(digest.hexdigest(), os.path.splitext(name)[1])
+            full_path = self.path(final_name)
+            try:
+                # Touching the blob marks it as new again, so a media_gc run
+                # that found it unreferenced leaves it alone until the row
+                # using it is saved
+                os.utime(full_path)
+            except FileNotFoundError:
+                pass
+            else:
+                logger.debug('Reusing stored blob', name=final_name, requested=name)
+                return final_name
+
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            os.chmod(temp_path, self.file_permissions_mode or 0o644)
+            os.replace(temp_path, full_path)
+            return final_name
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def delete(self, name):
+        """
+        Blobs may be shared by several rows, so they are only removed by
+        media_gc once unreferenced. Other (legacy) names are deleted as usual.
+        """
+        if name and is_blob_name(name):
+            return
+        super().delete(name)
+
+    def purge(self, name):
+        """Remove a file unconditionally; used by media_gc."""
+        super().delete(name)
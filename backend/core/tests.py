@@ -1,3 +1,56 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from .models import NewsArticle
+
+
+class NewsArticleListTests(TestCase):
+    def setUp(self):
+        # Anonymous reads are served from the response cache after the first
+        cache.clear()
+        self.authors = [
+            User.objects.create_user(username='ada', first_name='Ada', last_name='Lovelace'),
+            User.objects.create_user(username='grace'),
+        ]
+
+    def create_articles(self, count):
+        start = NewsArticle.objects.count()
+        for i in range(start, start + count):
+            NewsArticle.objects.create(
+                title=f'Article {i}', slug=f'article-{i}', excerpt='Excerpt', content='Body ' * 200,
+                author=self.authors[i % 2], published_at=timezone.now(),
+            )
+
+    def get_list(self):
+        cache.clear()
+        response = self.client.get('/api/news/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_query_count_is_constant_in_the_number_of_articles(self):
+        # Validators (COUNT/MAX) and the page itself, authors joined in
+        self.create_articles(2)
+        with self.assertNumQueries(2):
+            self.assertEqual(len(self.get_list()), 2)
+
+        self.create_articles(10)
+        with self.assertNumQueries(2):
+            self.assertEqual(len(self.get_list()), 12)
+
+    def test_list_omits_content_and_names_the_author(self):
+        self.create_articles(2)
+        results = self.get_list()
+
+        self.assertNotIn('content', results[0])
+        self.assertEqual({result['author_name'] for result in results}, {'Ada Lovelace', 'grace'})
+
+    def test_detail_includes_content(self):
+        self.create_articles(1)
+        article = NewsArticle.objects.get()
+
+        response = self.client.get(f'/api/news/{article.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['content'], article.content)
@@ -0,0 +1,153 @@
+"""
+Role claims in JWTs.
+
+Tokens issued by LoginView and by the refresh endpoint carry the user's
+role, the is_active, is_staff and is_superuser flags and a role_version
+fingerprint of them (see role_claims). Permission checks read the role from
+the token instead of loading UserRole, and on safe requests
+ClaimsJWTAuthentication does not load the User row at all: request.user is
+a ClaimsUser that answers id, username and the flags from the token, and
+loads the row only if something asks for another attribute.
+
+The claims of every user are also kept in the cache and dropped whenever
+their User or UserRole row is saved (see core.signals). A token whose
+role_version no longer matches, because the role changed or the account
+was deactivated or demoted since it was issued, is evaluated with the
+current claims instead of its own:
+
+    current token    one cache read
+    stale token      one cache read, plus one query after a change
+"""
+
+import zlib
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+
+ROLE_CLAIMS = ('role', 'is_active', 'is_staff', 'is_superuser', 'role_version')
+
+# Bounds how long another worker can miss an invalidation with a
+# per-process cache backend
+CLAIMS_CACHE_TIMEOUT = 300
+
+
+def _claims_key(user_id):
+    return f'user-claims:{user_id}'
+
+
+def role_claims(user_id):
+    """The current role claims of a user; missing users count as inactive."""
+    key = _claims_key(user_id)
+    claims = cache.get(key)
+    if claims is None:
+        row = (
+            User.objects.filter(pk=user_id)
+            .values_list('role__role', 'role__updated_at', 'is_active', 'is_staff', 'is_superuser')
+            .first()
+        )
+        role, updated_at, is_active, is_staff, is_superuser = row or (None, None, False, False, False)
+        claims = {
+            'role': role,
+            'is_active': is_active,
+            'is_staff': is_staff,
+            'is_superuser': is_superuser,
+            # Changes with any of the above, and with every save of the role
+            'role_version': zlib.crc32(
+                f'{role}|{updated_at}|{is_active}|{is_staff}|{is_superuser}'.encode('utf-8')
+            ),
+        }
+        cache.set(key, claims, CLAIMS_CACHE_TIMEOUT)
+    return claims
+
+
+def invalidate_role_claims(user_id):
+    cache.delete(_claims_key(user_id))
+
+
+def token_claims(token):
+    """The role claims a token grants: its own while current, the user's current ones otherwise."""
+    current = role_claims(token[jwt_settings.USER_ID_CLAIM])
+    if token.get('role_version') == current['role_version']:
+        return {claim: token.get(claim) for claim in ROLE_CLAIMS}
+    return current
+
+
+def request_claims(request):
+    """The role claims of the user making a request; None if anonymous."""
+    if not request.user or not request.user.is_authenticated:
+        return None
+    if isinstance(request.auth, Token):
+        return token_claims(request.auth)
+    return role_claims(request.user.pk)
+
+
+class RoleRefreshToken(RefreshToken):
+    """Refresh token whose access tokens carry the user's current role claims."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token.payload['username'] = user.get_username()
+        token.payload.update(role_claims(user.pk))
+        return token
+
+    @property
+    def access_token(self):
+        # Refreshing picks up role changes made since the login
+        self.payload.update(role_claims(self[jwt_settings.USER_ID_CLAIM]))
+        return super().access_token
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RoleRefreshToken
+
+
+class ClaimsUser(TokenUser):
+    """
+    request.user backed by the token's claims; any attribute the token does
+    not answer loads the User row once.
+    """
+
+    @cached_property
+    def user(self):
+        try:
+            return User.objects.get(pk=self.id)
+        except User.DoesNotExist:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name in ('token', 'user'):
+            raise AttributeError(name)
+        return getattr(self.user, name)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that skips loading the User for safe requests made
+    with role-bearing tokens. Unsafe requests get the real User, since
+    writes store it in foreign keys.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if request.method in SAFE_METHODS and 'role_version' in validated_token:
+            if not token_claims(validated_token)['is_active']:
+                raise AuthenticationFailed('User not found or inactive', code='user_inactive')
+            return ClaimsUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
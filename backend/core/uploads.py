@@ -0,0 +1,238 @@
+"""
+Resumable, chunked uploads.
+
+    POST   /api/uploads/                    {filename, size, content_type, sha256?}
+    PUT    /api/uploads/<id>/               raw bytes, Content-Range: bytes <start>-<end>/<size>
+    GET    /api/uploads/<id>/               current offset in `received`
+    POST   /api/uploads/<id>/finalize/      {model, field, object_id, sha256?}
+    DELETE /api/uploads/<id>/               abort
+
+Chunks are streamed from the request straight into a temporary file in
+fixed-size reads, so memory use does not depend on the chunk or file size.
+A SHA-256 of the data is kept up to date as chunks arrive. If the next
+chunk lands on another process (or after a restart), the file is hashed
+again once, at finalize time.
+"""
+
+import hashlib
+import os
+import threading
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image
+
+from .logging import get_logger
+from .media import image_field_names
+from .models import UploadSession
+
+logger = get_logger(__name__)
+
+# Bytes read from the request (or temporary file) at a time
+READ_SIZE = 64 * 1024
+
+# Running digests of the sessions this process has received chunks for:
+# {session id: (offset the digest covers, hashlib object)}
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+class UploadError(Exception):
+    """An upload request that cannot be applied, with the HTTP status to answer."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def session_dir():
+    return getattr(settings, 'UPLOAD_SESSION_DIR', os.path.join(settings.BASE_DIR, 'upload_sessions'))
+
+
+def temp_path(session):
+    return os.path.join(session_dir(), f'{session.pk}.part')
+
+
+def session_expiry():
+    hours = getattr(settings, 'UPLOAD_SESSION_TTL_HOURS', 24)
+    return timezone.now() + timedelta(hours=hours)
+
+
+def parse_content_range(header, size):
+    """
+    Parse 'bytes <start>-<end>/<total>' into (start, length).
+
+    The total must be the session size (or '*').
+    """
+    try:
+        unit, _, spec = header.partition(' ')
+        byte_range, _, total = spec.partition('/')
+        start, _, end = byte_range.partition('-')
+        start, end = int(start), int(end)
+        if unit != 'bytes' or start < 0 or end < start:
+            raise ValueError(header)
+        if total != '*' and int(total) != size:
+            raise ValueError(header)
+    except ValueError:
+        raise UploadError('Invalid Content-Range header, expected "bytes <start>-<end>/<size>"')
+    return start, end - start + 1
+
+
+def write_chunk(session, stream, start, length):
+    """
+    Append `length` bytes read from `stream` at offset `start`.
+
+    The offset must equal the bytes already received; clients resume after
+    a failure by reading `received` from the session. Whatever part of the
+    chunk arrived is kept even if the connection drops mid-chunk.
+
+    The session is claimed (status 'writing') with a conditional UPDATE on
+    its offset before anything is written, so of two requests for the same
+    offset only one gets to append.
+    """
+    if start + length > session.size:
+        raise UploadError('Chunk extends past the announced size')
+
+    now = timezone.now()
+    stale = now - timedelta(seconds=getattr(settings, 'UPLOAD_CHUNK_TIMEOUT_SECONDS', 600))
+    claimed = UploadSession.objects.filter(
+        Q(status='open') | Q(status='writing', updated_at__lt=stale),
+        pk=session.pk, received=start,
+    ).update(status='writing', updated_at=now)
+    if not claimed:
+        session.refresh_from_db(fields=['status', 'received'])
+        if session.status == 'complete':
+            raise UploadError('Upload session is not open', 409)
+        if session.status == 'writing':
+            raise UploadError('Another chunk is being written to this session', 409)
+        raise UploadError(f'Chunk must start at offset {session.received}', 409)
+
+    with _digests_lock:
+        offset, digest = _digests.get(session.pk, (0, None))
+    if start == 0:
+        digest = hashlib.sha256()
+    elif offset != start:
+        # Earlier chunks went to another process; hash the file at finalize
+        digest = None
+
+    os.makedirs(session_dir(), exist_ok=True)
+    path = temp_path(session)
+    written = 0
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o600)
+    with os.fdopen(fd, 'wb') as file:
+        try:
+            file.seek(start)
+            while written < length:
+                data = stream.read(min(READ_SIZE, length - written))
+                if not data:
+                    break
+                file.write(data)
+                if digest is not None:
+                    digest.update(data)
+                written += len(data)
+        finally:
+            # Drop anything past what is acknowledged, e.g. from an earlier
+            # attempt of this chunk, and record the progress that was made
+            file.truncate(start + written)
+            session.received = start + written
+            session.status = 'open'
+            UploadSession.objects.filter(pk=session.pk, status='writing', received=start).update(
+                status='open', received=session.received, updated_at=timezone.now()
+            )
+            with _digests_lock:
+                if digest is not None:
+                    _digests[session.pk] = (session.received, digest)
+                else:
+                    _digests.pop(session.pk, None)
+
+    if written < length:
+        raise UploadError(f'Chunk ended early; resume from offset {session.received}')
+    return session.received
+
+
+def file_digest(session):
+    """Return the SHA-256 of the received data, rehashing the file if needed."""
+    with _digests_lock:
+        offset, digest = _digests.get(session.pk, (0, None))
+    if digest is not None and offset == session.size:
+        return digest.hexdigest()
+
+    digest = hashlib.sha256()
+    with open(temp_path(session), 'rb') as file:
+        for data in iter(lambda: file.read(READ_SIZE), b''):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def get_upload_target(model_name, field_name, object_id):
+    """Return the instance an upload may be attached to, or raise UploadError."""
+    try:
+        model = apps.get_model('core', model_name)
+    except LookupError:
+        raise UploadError(f'Unknown model: {model_name}')
+    if field_name not in image_field_names(model):
+        raise UploadError(f'{model_name} has no image field {field_name}')
+    try:
+        return model.objects.get(pk=object_id)
+    except (model.DoesNotExist, ValueError):
+        raise UploadError(f'{model_name} {object_id} not found', 404)
+
+
+def finalize(session, model_name, field_name, object_id, sha256=''):
+    """
+    Check the completed upload and store it in the target image field.
+
+    The temporary file is copied into the media storage through the field,
+    so the usual post_save processing (metadata, renditions) applies.
+    """
+    if session.status != 'open':
+        raise UploadError('Upload session is not open', 409)
+    if session.received != session.size:
+        raise UploadError(f'Upload incomplete: {session.received} of {session.size} bytes received', 409)
+
+    instance = get_upload_target(model_name, field_name, object_id)
+
+    expected = (sha256 or session.sha256).lower()
+    actual = file_digest(session)
+    if expected and expected != actual:
+        raise UploadError('SHA-256 mismatch; the upload has to be restarted')
+
+    path = temp_path(session)
+    try:
+        with Image.open(path) as image:
+            image.verify()
+    except Exception:
+        raise UploadError('Uploaded file is not a valid image')
+
+    with open(path, 'rb') as file:
+        getattr(instance, field_name).save(session.filename, File(file), save=True)
+
+    session.status = 'complete'
+    session.sha256 = actual
+    session.save(update_fields=['status', 'sha256', 'updated_at'])
+    discard(session)
+    logger.info('Upload attached', session=session.pk, target=f'{model_name}.{field_name}', object_id=object_id)
+    return instance
+
+
+def discard(session):
+    """Remove the temporary file and running digest of a session."""
+    with _digests_lock:
+        _digests.pop(session.pk, None)
+    try:
+        os.remove(temp_path(session))
+    except FileNotFoundError:
+        pass
+
+
+def purge_expired_sessions():
+    """Delete sessions (and their temporary files) past their expiry time."""
+    expired = list(UploadSession.objects.filter(expires_at__lt=timezone.now()))
+    for session in expired:
+        discard(session)
+    UploadSession.objects.filter(pk__in=[session.pk for session in expired]).delete()
+    return len(expired)
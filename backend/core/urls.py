@@ -25,7 +25,9 @@ from .views import (
     ActivityViewSet,
     ProductDescriptionViewSet,
     SolutionDescriptionViewSet,
-    NewsDescriptionViewSet
+    NewsDescriptionViewSet,
+    MediaJobViewSet,
+    UploadSessionViewSet
 )
 from .auth import LoginView, UserProfileView, PasswordResetRequestView, PasswordResetConfirmView
 
@@ -33,7 +35,7 @@ router = DefaultRouter()
 
 # User Management
 router.register(r'users', UserViewSet)
-router.register(r'authors', AuthorViewSet)  # Public endpoint for author information
+router.register(r'authors', AuthorViewSet, basename='author')  # Public endpoint for author information
 
 # Products and Solutions
 router.register(r'products', ProductViewSet)
@@ -80,6 +82,10 @@ router.register(r'solution-descriptions', SolutionDescriptionViewSet)
 # News Descriptions
 router.register(r'news-descriptions', NewsDescriptionViewSet)
 
+# Background media processing
+router.register(r'media-jobs', MediaJobViewSet)
+router.register(r'uploads', UploadSessionViewSet)
+
 urlpatterns = [
     path('', include(router.urls)),
     path('login/', LoginView.as_view(), name='login'),
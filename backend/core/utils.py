@@ -36,12 +36,12 @@ def validate_password_strength(password, settings=None):
     Validate password strength based on site settings.
     If settings is None, use default password policy.
     """
-    from .models import SiteSettings
+    from .site_settings import get_site_settings
 
     # Get site settings if not provided
     if settings is None:
         try:
-            settings = SiteSettings.objects.first()
+            settings = get_site_settings()
         except Exception:
             # If settings can't be retrieved, use default policy
             settings = None
@@ -79,18 +79,17 @@ def validate_password_strength(password, settings=None):
 def log_action(user, action_type, resource_type, resource_id=None, details=None):
     """
     Log user actions for audit purposes.
+
+    The Activity row is buffered and written together with the other actions
+    of the request once its transaction commits (see core.activity).
     """
-    from .models import Activity
-
-    try:
-        # Map the parameters to the correct field names in the Activity model
-        Activity.objects.create(
-            user=user,
-            action=action_type,  # action_type -> action
-            content_type=resource_type,  # resource_type -> content_type
-            object_id=str(resource_id) if resource_id else None,  # resource_id -> object_id
-            details=details
-        )
-    except Exception as e:
-        print(f"Error logging action: {str(e)}")
-        # Don't raise the exception - we don't want to break the main functionality
+    from .activity import record
+
+    # Map the parameters to the correct field names in the Activity model
+    record(
+        user,
+        action=action_type,  # action_type -> action
+        content_type=resource_type,  # resource_type -> content_type
+        object_id=str(resource_id) if resource_id else None,  # resource_id -> object_id
+        details=details,
+    )
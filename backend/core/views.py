@@ -1,14 +1,19 @@
-from rest_framework import viewsets, status, permissions, serializers
+from rest_framework import viewsets, mixins, status, permissions, serializers
 from rest_framework.decorators import action
+from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.permissions import (
     IsAuthenticatedOrReadOnly,
     AllowAny,
     IsAuthenticated
 )
+from datetime import date, timedelta
+
 from django.contrib.auth.models import User
 from django.db import IntegrityError
+from django.utils import timezone
 from .models import (
     UserRole,
     Product,
@@ -33,13 +38,16 @@ from .models import (
     Activity,
     ProductDescription,
     SolutionDescription,
-    NewsDescription
+    NewsDescription,
+    MediaJob,
+    UploadSession
 )
 from .serializers import (
     UserSerializer,
     ProductSerializer,
     SolutionSerializer,
     NewsArticleSerializer,
+    NewsArticleListSerializer,
     ContactMessageSerializer,
     ContactInfoSerializer,
     ContactDescriptionSerializer,
@@ -59,10 +67,40 @@ from .serializers import (
     ActivitySerializer,
     ProductDescriptionSerializer,
     SolutionDescriptionSerializer,
-    NewsDescriptionSerializer
+    NewsDescriptionSerializer,
+    MediaJobSerializer,
+    UploadSessionSerializer,
+    UploadFinalizeSerializer
 )
-from .permissions import IsAdmin, IsEditorOrAdmin, IsViewerOrHigher, HasResourcePermission
+from .permissions import IsAdmin, IsEditorOrAdmin, IsViewerOrHigher, HasResourcePermission, request_role
 from .utils import log_action, sanitize_input
+from .activity import BUCKETS, activity_stats
+from .search import search, suggest
+from .site_settings import get_site_settings
+from .login_limiter import unlock as unlock_login
+from .bundles import PAGE_BUNDLES, get_bundle
+from .logging import get_logger, redact
+from .cache import CachedReadMixin
+from .conditional import ConditionalGetMixin
+from .filters import ContentQueryMixin
+from .fields import build_media_url, rendition_urls
+from .media import load_media_index
+from .uploads import (
+    UploadError,
+    discard,
+    finalize,
+    parse_content_range,
+    purge_expired_sessions,
+    session_expiry,
+    write_chunk
+)
+from .pagination import (
+    NewsCursorPagination,
+    ContactMessageCursorPagination,
+    ActivityCursorPagination
+)
+
+logger = get_logger(__name__)
 
 # User related viewsets
 class UserViewSet(viewsets.ModelViewSet):
@@ -70,18 +108,60 @@ class UserViewSet(viewsets.ModelViewSet):
     serializer_class = UserSerializer
     permission_classes = [IsAdmin]
 
+    @action(detail=True, methods=['patch'])
+    def update_role(self, request, pk=None):
+        user = self.get_object()
+        role = request.data.get('role')
+
+        if not role:
+            return Response(
+                {'error': 'Role is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if role not in [choice[0] for choice in UserRole.ROLE_CHOICES]:
+            return Response(
+                {'error': 'Invalid role'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        user_role, _ = UserRole.objects.get_or_create(user=user)
+        user_role.role = role
+        # Saving changes the user's role_version, so tokens issued before now
+        # are evaluated with the new role (core.tokens)
+        user_role.save()
+
+        serializer = self.get_serializer(user)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['post'])
+    def unlock_login(self, request, pk=None):
+        """Lift a brute-force lock on the user's logins."""
+        user = self.get_object()
+        unlock_login(username=user.username)
+
+        log_action(
+            user=request.user,
+            action_type='update',
+            resource_type='user',
+            resource_id=user.id,
+            details='Unlocked logins'
+        )
+        return Response({'message': f'Logins for {user.username} unlocked'})
+
 # Public author information for news articles
-class AuthorViewSet(viewsets.ReadOnlyModelViewSet):
+class AuthorViewSet(ConditionalGetMixin, CachedReadMixin, viewsets.ReadOnlyModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [AllowAny]  # Allow public access
+    last_modified_field = None  # User rows carry no modification timestamp
 
     def get_queryset(self):
         # Only return minimal user information needed for displaying authors
         return User.objects.all().only('id', 'username', 'first_name', 'last_name')
 
     def create(self, request, *args, **kwargs):
-        print("Received create data:", request.data)  # Debug log
+        logger.debug('Creating author', data=redact(request.data))
         try:
             # Extract role from request data
             role_data = request.data.get('role', 'viewer')
@@ -108,7 +188,7 @@ class AuthorViewSet(viewsets.ReadOnlyModelViewSet):
             )
 
     def update(self, request, *args, **kwargs):
-        print("Received update data:", request.data)  # Debug log
+        logger.debug('Updating author', data=redact(request.data))
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
 
@@ -128,30 +208,6 @@ class AuthorViewSet(viewsets.ReadOnlyModelViewSet):
     def perform_update(self, serializer):
         serializer.save()
 
-    @action(detail=True, methods=['patch'])
-    def update_role(self, request, pk=None):
-        user = self.get_object()
-        role = request.data.get('role')
-
-        if not role:
-            return Response(
-                {'error': 'Role is required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        if role not in [choice[0] for choice in UserRole.ROLE_CHOICES]:
-            return Response(
-                {'error': 'Invalid role'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        user_role, _ = UserRole.objects.get_or_create(user=user)
-        user_role.role = role
-        user_role.save()
-
-        serializer = self.get_serializer(user)
-        return Response(serializer.data)
-
     def destroy(self, request, *args, **kwargs):
         user = self.get_object()
 
@@ -187,7 +243,7 @@ class AuthorViewSet(viewsets.ReadOnlyModelViewSet):
         })
 
 # Product and Solution viewsets
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -199,63 +255,53 @@ class ProductViewSet(viewsets.ModelViewSet):
         return context
 
     def create(self, request, *args, **kwargs):
-        print("Creating product with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
-
-        # Check if image_file is in the request
-        if 'image_file' in request.FILES:
-            print(f"Image file found: {request.FILES['image_file']}")
-            print(f"Image file name: {request.FILES['image_file'].name}")
-            print(f"Image file size: {request.FILES['image_file'].size}")
-            print(f"Image file content type: {request.FILES['image_file'].content_type}")
-        else:
-            print("No image_file found in request.FILES")
-
-            # Check if 'image' is in the request instead
-            if 'image' in request.FILES:
-                print(f"Found 'image' instead of 'image_file': {request.FILES['image']}")
-
-        response = super().create(request, *args, **kwargs)
-        print(f"Create response: {response.data}")
-        return response
+        logger.debug('Creating product', data=redact(request.data), files=redact(request.FILES))
+
+        # The serializer only reads 'image_file'; flag clients sending 'image'
+        if 'image_file' not in request.FILES and 'image' in request.FILES:
+            logger.warning("Product upload sent 'image' instead of 'image_file'; the file is ignored")
+
+        return super().create(request, *args, **kwargs)
 
     def update(self, request, *args, **kwargs):
-        print("Updating product with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
-
-        # Check if image_file is in the request
-        if 'image_file' in request.FILES:
-            print(f"Image file found: {request.FILES['image_file']}")
-            print(f"Image file name: {request.FILES['image_file'].name}")
-            print(f"Image file size: {request.FILES['image_file'].size}")
-            print(f"Image file content type: {request.FILES['image_file'].content_type}")
-        else:
-            print("No image_file found in request.FILES")
-
-            # Check if 'image' is in the request instead
-            if 'image' in request.FILES:
-                print(f"Found 'image' instead of 'image_file': {request.FILES['image']}")
-
-        response = super().update(request, *args, **kwargs)
-        print(f"Update response: {response.data}")
-        return response
-
-class SolutionViewSet(viewsets.ModelViewSet):
+        logger.debug('Updating product', data=redact(request.data), files=redact(request.FILES))
+
+        # The serializer only reads 'image_file'; flag clients sending 'image'
+        if 'image_file' not in request.FILES and 'image' in request.FILES:
+            logger.warning("Product upload sent 'image' instead of 'image_file'; the file is ignored")
+
+        return super().update(request, *args, **kwargs)
+
+class SolutionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = Solution.objects.all()
     serializer_class = SolutionSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
 # News related viewset
-class NewsArticleViewSet(viewsets.ModelViewSet):
+class NewsArticleViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = NewsArticle.objects.all()
     serializer_class = NewsArticleSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = NewsCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # The index shows the author's name but never the article body
+            queryset = queryset.select_related('author').defer('content')
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return NewsArticleListSerializer
+        return super().get_serializer_class()
 
 # Contact related viewsets
 class ContactMessageViewSet(viewsets.ModelViewSet):
     queryset = ContactMessage.objects.all()
     serializer_class = ContactMessageSerializer
     permission_classes = [AllowAny]
+    pagination_class = ContactMessageCursorPagination
 
     @action(detail=True, methods=['patch'])
     def mark_as_read(self, request, pk=None):
@@ -271,12 +317,12 @@ class ContactMessageViewSet(viewsets.ModelViewSet):
         message.save()
         return Response({'status': 'marked as unread'})
 
-class ContactInfoViewSet(viewsets.ModelViewSet):
+class ContactInfoViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = ContactInfo.objects.all()
     serializer_class = ContactInfoSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class ContactDescriptionViewSet(viewsets.ModelViewSet):
+class ContactDescriptionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = ContactDescription.objects.all()
     serializer_class = ContactDescriptionSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -287,7 +333,7 @@ class NavigationItemViewSet(viewsets.ModelViewSet):
     serializer_class = NavigationItemSerializer
     permission_classes = [IsAuthenticated]
 
-class HeroSectionViewSet(viewsets.ModelViewSet):
+class HeroSectionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = HeroSection.objects.all()
     serializer_class = HeroSectionSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -300,61 +346,35 @@ class HeroSectionViewSet(viewsets.ModelViewSet):
         return context
 
     def create(self, request, *args, **kwargs):
-        print("Creating hero section with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
-
-        # Check if background_image_file is in the request
-        if 'background_image_file' in request.FILES:
-            print(f"Background image file found: {request.FILES['background_image_file']}")
-            print(f"Background image file name: {request.FILES['background_image_file'].name}")
-            print(f"Background image file size: {request.FILES['background_image_file'].size}")
-            print(f"Background image file content type: {request.FILES['background_image_file'].content_type}")
-        else:
-            print("No background_image_file found in request.FILES")
-
-            # Check if 'background_image' is in the request instead
-            if 'background_image' in request.FILES:
-                print(f"Found 'background_image' instead of 'background_image_file': {request.FILES['background_image']}")
-                # Rename the field to match what the serializer expects
-                request.FILES['background_image_file'] = request.FILES['background_image']
-
-        response = super().create(request, *args, **kwargs)
-        print(f"Create response: {response.data}")
-        return response
+        logger.debug('Creating hero section', data=redact(request.data), files=redact(request.FILES))
+
+        # Accept 'background_image' as an alias for 'background_image_file'
+        if 'background_image_file' not in request.FILES and 'background_image' in request.FILES:
+            # Rename the field to match what the serializer expects
+            request.FILES['background_image_file'] = request.FILES['background_image']
+
+        return super().create(request, *args, **kwargs)
 
     def update(self, request, *args, **kwargs):
-        print("Updating hero section with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
-
-        # Check if background_image_file is in the request
-        if 'background_image_file' in request.FILES:
-            print(f"Background image file found: {request.FILES['background_image_file']}")
-            print(f"Background image file name: {request.FILES['background_image_file'].name}")
-            print(f"Background image file size: {request.FILES['background_image_file'].size}")
-            print(f"Background image file content type: {request.FILES['background_image_file'].content_type}")
-        else:
-            print("No background_image_file found in request.FILES")
-
-            # Check if 'background_image' is in the request instead
-            if 'background_image' in request.FILES:
-                print(f"Found 'background_image' instead of 'background_image_file': {request.FILES['background_image']}")
-                # Rename the field to match what the serializer expects
-                request.FILES['background_image_file'] = request.FILES['background_image']
+        logger.debug('Updating hero section', data=redact(request.data), files=redact(request.FILES))
+
+        # Accept 'background_image' as an alias for 'background_image_file'
+        if 'background_image_file' not in request.FILES and 'background_image' in request.FILES:
+            # Rename the field to match what the serializer expects
+            request.FILES['background_image_file'] = request.FILES['background_image']
 
         # Always use partial update to allow optional fields
         kwargs['partial'] = True
 
-        response = super().update(request, *args, **kwargs)
-        print(f"Update response: {response.data}")
-        return response
+        return super().update(request, *args, **kwargs)
 
 # Feature and Target Market viewsets
-class FeatureViewSet(viewsets.ModelViewSet):
+class FeatureViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = Feature.objects.all()
     serializer_class = FeatureSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class TargetMarketViewSet(viewsets.ModelViewSet):
+class TargetMarketViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = TargetMarket.objects.all()
     serializer_class = TargetMarketSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -366,28 +386,28 @@ class TargetMarketViewSet(viewsets.ModelViewSet):
         return context
 
 # Company Information viewsets
-class WhyChooseUsViewSet(viewsets.ModelViewSet):
+class WhyChooseUsViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = WhyChooseUs.objects.all()
     serializer_class = WhyChooseUsSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class AboutHeroViewSet(viewsets.ModelViewSet):
+class AboutHeroViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = AboutHero.objects.all()
     serializer_class = AboutHeroSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class CompanyOverviewViewSet(viewsets.ModelViewSet):
+class CompanyOverviewViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = CompanyOverview.objects.all()
     serializer_class = CompanyOverviewSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class MissionVisionViewSet(viewsets.ModelViewSet):
+class MissionVisionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = MissionVision.objects.all()
     serializer_class = MissionVisionSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
 # Team related viewsets
-class TeamMemberViewSet(viewsets.ModelViewSet):
+class TeamMemberViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = TeamMember.objects.all()
     serializer_class = TeamMemberSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -398,44 +418,210 @@ class TeamMemberViewSet(viewsets.ModelViewSet):
         context['request'] = self.request
         return context
 
-class TeamDescriptionViewSet(viewsets.ModelViewSet):
+class TeamDescriptionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = TeamDescription.objects.all()
     serializer_class = TeamDescriptionSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class PartnerDescriptionViewSet(viewsets.ModelViewSet):
+class PartnerDescriptionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = PartnersDescription.objects.all()
     serializer_class = PartnersDescriptionSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
 
 # Site Settings viewset
-class SiteSettingsViewSet(viewsets.ModelViewSet):
+class SiteSettingsViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = SiteSettings.objects.all()
     serializer_class = SiteSettingsSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    last_modified_field = 'lastUpdated'
 
     def get_object(self):
-        # Always return the first settings object or create one if none exists
+        # Reads use the process-local copy; writes get a row of their own,
+        # since the copy is shared and must never be modified
+        if self.request.method in permissions.SAFE_METHODS:
+            return get_site_settings()
         settings, created = SiteSettings.objects.get_or_create(pk=1)
         return settings
 
 
+# Longest range /api/activity/stats/ accepts, in days
+MAX_STATS_DAYS = 3660
+
+
 # Activity viewset
 class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Activity log, newest first. Filter with ?user=<id> or
+    ?content_type=<type>&object_id=<id>; both are served by an index.
+    """
     queryset = Activity.objects.all().select_related('user')
     serializer_class = ActivitySerializer
     permission_classes = [IsAuthenticated]
+    # Newest first, 20 per page; older entries are reached through the cursor
+    pagination_class = ActivityCursorPagination
+
+    def id_param(self, name):
+        """An id query parameter as an int, or None if absent."""
+        raw = self.request.query_params.get(name)
+        if not raw:
+            return None
+        try:
+            return int(raw)
+        except ValueError:
+            raise ParseError({'error': f'{name} must be an integer'})
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        user = self.id_param('user')
+        if user is not None:
+            queryset = queryset.filter(user_id=user)
+        content_type = self.request.query_params.get('content_type')
+        if content_type:
+            queryset = queryset.filter(content_type=content_type)
+        object_id = self.id_param('object_id')
+        if object_id is not None:
+            # Stored as text
+            queryset = queryset.filter(object_id=str(object_id))
+        return queryset
+
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        """
+        Activity counts by action, content type, user and time bucket, from
+        the daily rollups.
+
+            ?start=YYYY-MM-DD&end=YYYY-MM-DD   inclusive, default the last 30 days
+            ?bucket=day|week|month             default day
+            ?user=<id>&content_type=<type>&action=<action>
+        """
+        params = request.query_params
+        end = timezone.localdate()
+        start = end - timedelta(days=29)
+        try:
+            if params.get('end'):
+                end = date.fromisoformat(params['end'])
+            if params.get('start'):
+                start = date.fromisoformat(params['start'])
+        except ValueError:
+            return Response(
+                {'error': 'start and end must be dates in YYYY-MM-DD format'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if start > end:
+            return Response({'error': 'start must not be after end'}, status=status.HTTP_400_BAD_REQUEST)
+        if (end - start).days > MAX_STATS_DAYS:
+            return Response(
+                {'error': f'The range may span at most {MAX_STATS_DAYS} days'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        bucket = params.get('bucket', 'day')
+        if bucket not in BUCKETS:
+            return Response(
+                {'error': f"bucket must be one of: {', '.join(BUCKETS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(activity_stats(
+            start, end, bucket,
+            user=self.id_param('user'), content_type=params.get('content_type'), action=params.get('action'),
+        ))
+
+
+class MediaJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Status and progress of background media processing.
+
+    Filter with ?status=pending|running|done|failed and ?media=<storage name>
+    (the path part of an image URL after MEDIA_URL) to poll a single upload.
+    """
+    queryset = MediaJob.objects.all().select_related('media')
+    serializer_class = MediaJobSerializer
+    permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        # Limit to the most recent 20 activities
-        return Activity.objects.all().select_related('user').order_by('-timestamp')[:20]
+        queryset = super().get_queryset()
+        status_filter = self.request.query_params.get('status')
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        media = self.request.query_params.get('media')
+        if media:
+            queryset = queryset.filter(media__name=media)
+        return queryset
+
+
+class UploadSessionViewSet(mixins.CreateModelMixin,
+                           mixins.RetrieveModelMixin,
+                           mixins.DestroyModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    Resumable chunked uploads for large media; see core.uploads for the
+    protocol. Sessions are private to the user who created them.
+    """
+    queryset = UploadSession.objects.all()
+    serializer_class = UploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return super().get_queryset().filter(user_id=self.request.user.pk)
+
+    def perform_create(self, serializer):
+        purge_expired_sessions()
+        serializer.save(user=self.request.user, expires_at=session_expiry())
+
+    def update(self, request, *args, **kwargs):
+        # PUT <id>/ carries one raw chunk; the body is read as a stream and
+        # never parsed or buffered
+        session = self.get_object()
+        try:
+            start, length = parse_content_range(request.headers.get('Content-Range', ''), session.size)
+            try:
+                content_length = int(request.headers.get('Content-Length') or 0)
+            except ValueError:
+                raise UploadError('Invalid Content-Length header')
+            if content_length != length:
+                raise UploadError('Content-Length does not match Content-Range')
+            write_chunk(session, request.stream, start, length)
+        except UploadError as e:
+            return Response({"error": str(e), "received": session.received}, status=e.status)
+        return Response(self.get_serializer(session).data)
+
+    def perform_destroy(self, instance):
+        discard(instance)
+        instance.delete()
+
+    @action(detail=True, methods=['post'])
+    def finalize(self, request, pk=None):
+        session = self.get_object()
+        params = UploadFinalizeSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        target = params.validated_data
+
+        try:
+            instance = finalize(session, target['model'].lower(), target['field'], target['object_id'], target['sha256'])
+        except UploadError as e:
+            return Response({"error": str(e)}, status=e.status)
+
+        log_action(
+            user=request.user,
+            action_type='update',
+            resource_type=instance._meta.model_name,
+            resource_id=instance.pk,
+            details=f"Uploaded {session.filename} to {target['field']}"
+        )
+        return Response({
+            'session': self.get_serializer(session).data,
+            'url': build_media_url(request, getattr(instance, target['field'])),
+        })
 
 
 # Product Description viewset
-class ProductDescriptionViewSet(viewsets.ModelViewSet):
+class ProductDescriptionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = ProductDescription.objects.all()
     serializer_class = ProductDescriptionSerializer
+    # Read by the custom list() and retrieve() whatever ?fields= selects
+    required_fields = ('title', 'description', 'hero_image', 'created_at', 'updated_at')
     permission_classes = [AllowAny]  # Allow public access for reading
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
@@ -449,10 +635,11 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
         return context
 
     def list(self, request, *args, **kwargs):
+        # Outside the try: bad query parameters are a 400, not a 500
+        queryset = self.filter_queryset(self.get_queryset())
+        self.selected_field_names()
         try:
-            print("ProductDescriptionViewSet.list: Listing all product descriptions")
-            queryset = self.get_queryset()
-            print(f"ProductDescriptionViewSet.list: Found {queryset.count()} product descriptions")
+            media_index = load_media_index(product.hero_image.name for product in queryset)
 
             # Create a simple response without using the serializer
             result = []
@@ -467,48 +654,35 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
                     }
 
                     # Handle hero_image separately
-                    if product.hero_image:
-                        try:
-                            # Get the base URL from the request
-                            base_url = request.build_absolute_uri('/').rstrip('/')
-                            # Construct the full URL
-                            if product.hero_image.url.startswith(('http://', 'https://')):
-                                item['hero_image'] = product.hero_image.url
-                            else:
-                                if product.hero_image.url.startswith('/'):
-                                    item['hero_image'] = f"{base_url}{product.hero_image.url}"
-                                else:
-                                    item['hero_image'] = f"{base_url}/{product.hero_image.url}"
-                            print(f"Hero image URL for product {product.id}: {item['hero_image']}")
-                        except Exception as img_error:
-                            print(f"Error handling hero_image for product {product.id}: {str(img_error)}")
-                            item['hero_image'] = None
-                    else:
+                    try:
+                        item['hero_image'] = build_media_url(request, product.hero_image)
+                        item['hero_image_renditions'] = rendition_urls(request, media_index.get(product.hero_image.name))
+                    except Exception:
+                        logger.exception('Error building hero image URL', product_description=product.id)
                         item['hero_image'] = None
-                        print(f"No hero image for product {product.id}")
+                        item['hero_image_renditions'] = None
 
                     result.append(item)
-                    print(f"Added product {product.id} to result")
-                except Exception as product_error:
-                    print(f"Error processing product description {getattr(product, 'id', 'unknown')}: {str(product_error)}")
+                except Exception:
+                    logger.exception('Error processing product description', product_description=getattr(product, 'id', 'unknown'))
 
-            print(f"Returning {len(result)} product descriptions")
-            return Response(result)
+            logger.debug('Listed product descriptions', count=len(result))
+            return Response(self.select_fields(result))
 
-        except Exception as e:
-            print(f"Error in ProductDescriptionViewSet.list: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception('Error listing product descriptions')
             return Response(
                 {"error": "An error occurred while fetching product descriptions."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
     def retrieve(self, request, *args, **kwargs):
+        # Outside the try: a missing object or bad query parameter is a
+        # 404/400, not a 500
+        instance = self.get_object()
+        self.selected_field_names()
         try:
-            print(f"ProductDescriptionViewSet.retrieve: Retrieving product description with pk: {kwargs.get('pk')}")
-            instance = self.get_object()
-            print(f"ProductDescriptionViewSet.retrieve: Found product description: {instance.id}")
+            media_index = load_media_index([instance.hero_image.name])
 
             # Create a response manually
             result = {
@@ -520,33 +694,19 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
             }
 
             # Handle hero_image separately
-            if instance.hero_image:
-                try:
-                    # Get the base URL from the request
-                    base_url = request.build_absolute_uri('/').rstrip('/')
-                    # Construct the full URL
-                    if instance.hero_image.url.startswith(('http://', 'https://')):
-                        result['hero_image'] = instance.hero_image.url
-                    else:
-                        if instance.hero_image.url.startswith('/'):
-                            result['hero_image'] = f"{base_url}{instance.hero_image.url}"
-                        else:
-                            result['hero_image'] = f"{base_url}/{instance.hero_image.url}"
-                    print(f"Hero image URL for product {instance.id}: {result['hero_image']}")
-                except Exception as img_error:
-                    print(f"Error handling hero_image for product {instance.id}: {str(img_error)}")
-                    result['hero_image'] = None
-            else:
+            try:
+                result['hero_image'] = build_media_url(request, instance.hero_image)
+                result['hero_image_renditions'] = rendition_urls(request, media_index.get(instance.hero_image.name))
+            except Exception:
+                logger.exception('Error building hero image URL', product_description=instance.id)
                 result['hero_image'] = None
-                print(f"No hero image for product {instance.id}")
+                result['hero_image_renditions'] = None
 
-            print(f"ProductDescriptionViewSet.retrieve: Returning result: {result}")
-            return Response(result)
+            logger.debug('Retrieved product description', product_description=instance.id)
+            return Response(self.select_fields(result))
 
         except Exception as e:
-            print(f"Error in ProductDescriptionViewSet.retrieve: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error retrieving product description', pk=kwargs.get('pk'))
             return Response(
                 {"error": f"An error occurred while retrieving product description: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -560,40 +720,26 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        print("Creating product description with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
+        logger.debug('Creating product description', data=redact(request.data), files=redact(request.FILES))
 
         # Check if title and description are empty strings and convert them to None
         mutable_data = request.data.copy() if hasattr(request.data, 'copy') else dict(request.data)
 
         # Handle title field
         if 'title' in mutable_data and mutable_data['title'] == '':
-            print("Converting empty title to None")
             mutable_data['title'] = None
 
         # Handle description field
         if 'description' in mutable_data and mutable_data['description'] == '':
-            print("Converting empty description to None")
             mutable_data['description'] = None
 
         # Replace the request data with our modified version
         request._full_data = mutable_data
 
-        # Check if hero_image_file is in the request
-        if 'hero_image_file' in request.FILES:
-            print(f"Hero image file: {request.FILES['hero_image_file']}")
-            print(f"Hero image file name: {request.FILES['hero_image_file'].name}")
-            print(f"Hero image file size: {request.FILES['hero_image_file'].size}")
-            print(f"Hero image file content type: {request.FILES['hero_image_file'].content_type}")
-
         try:
-            response = super().create(request, *args, **kwargs)
-            print(f"Create response: {response.data}")
-            return response
+            return super().create(request, *args, **kwargs)
         except Exception as e:
-            print(f"Error creating product description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error creating product description')
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -607,38 +753,27 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        print("Updating product description with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
+        logger.debug('Updating product description', data=redact(request.data), files=redact(request.FILES))
 
         # Check if title and description are empty strings and convert them to None
         mutable_data = request.data.copy() if hasattr(request.data, 'copy') else dict(request.data)
 
         # Handle title field
         if 'title' in mutable_data and mutable_data['title'] == '':
-            print("Converting empty title to None")
             mutable_data['title'] = None
 
         # Handle description field
         if 'description' in mutable_data and mutable_data['description'] == '':
-            print("Converting empty description to None")
             mutable_data['description'] = None
 
         # Replace the request data with our modified version
         request._full_data = mutable_data
 
-        # Check if hero_image_file is in the request
-        if 'hero_image_file' in request.FILES:
-            print(f"Hero image file: {request.FILES['hero_image_file']}")
-            print(f"Hero image file name: {request.FILES['hero_image_file'].name}")
-            print(f"Hero image file size: {request.FILES['hero_image_file'].size}")
-            print(f"Hero image file content type: {request.FILES['hero_image_file'].content_type}")
-
         # Always use partial update to allow optional fields
         kwargs['partial'] = True
 
         # Get the instance
         instance = self.get_object()
-        print(f"Found instance: {instance.id}")
 
         # Get the serializer
         serializer = self.get_serializer(instance, data=request.data, partial=True)
@@ -647,7 +782,7 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
             # Validate the data
             serializer.is_valid(raise_exception=False)
             if not serializer.is_valid():
-                print(f"Validation errors: {serializer.errors}")
+                logger.info('Rejected product description update', product_description=instance.id, errors=serializer.errors)
                 return Response(
                     serializer.errors,
                     status=status.HTTP_400_BAD_REQUEST
@@ -659,9 +794,7 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
             # Return the updated instance
             return Response(serializer.data)
         except Exception as e:
-            print(f"Error updating product description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error updating product description', product_description=instance.id)
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -669,8 +802,7 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         instance = serializer.save()
-        print(f"Created product description: {instance.id}")
-        print(f"Hero image: {instance.hero_image}")
+        logger.debug('Created product description', product_description=instance.id, hero_image=instance.hero_image)
 
         # Log the action for audit purposes
         log_action(
@@ -682,8 +814,7 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         instance = serializer.save()
-        print(f"Updated product description: {instance.id}")
-        print(f"Hero image: {instance.hero_image}")
+        logger.debug('Updated product description', product_description=instance.id, hero_image=instance.hero_image)
 
         # Log the action for audit purposes
         log_action(
@@ -703,23 +834,20 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
 
         try:
             instance = self.get_object()
-            print(f"Deleting product description: {instance.id}")
+            logger.debug('Deleting product description', product_description=instance.id)
 
             # Delete the hero image if it exists
             if instance.hero_image:
                 try:
-                    print(f"Deleting hero image: {instance.hero_image.path}")
                     instance.hero_image.delete(save=False)
-                except Exception as e:
-                    print(f"Error deleting hero image: {str(e)}")
+                except Exception:
+                    logger.exception('Error deleting hero image', product_description=instance.id)
 
             # Delete the instance
             self.perform_destroy(instance)
             return Response(status=status.HTTP_204_NO_CONTENT)
         except Exception as e:
-            print(f"Error deleting product description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error deleting product description')
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -737,9 +865,11 @@ class ProductDescriptionViewSet(viewsets.ModelViewSet):
 
 
 # Solution Description viewset
-class SolutionDescriptionViewSet(viewsets.ModelViewSet):
+class SolutionDescriptionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = SolutionDescription.objects.all()
     serializer_class = SolutionDescriptionSerializer
+    # Read by the custom list() whatever ?fields= selects
+    required_fields = ('title', 'description', 'hero_image', 'created_at', 'updated_at')
     permission_classes = [IsAuthenticatedOrReadOnly]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
@@ -747,14 +877,14 @@ class SolutionDescriptionViewSet(viewsets.ModelViewSet):
         context = super().get_serializer_context()
         # Ensure request is included in the context
         context['request'] = self.request
-        print(f"SolutionDescriptionViewSet.get_serializer_context: request={self.request}")
         return context
 
     def list(self, request, *args, **kwargs):
+        # Outside the try: bad query parameters are a 400, not a 500
+        queryset = self.filter_queryset(self.get_queryset())
+        self.selected_field_names()
         try:
-            print("SolutionDescriptionViewSet.list: Listing all solution descriptions")
-            queryset = self.get_queryset()
-            print(f"SolutionDescriptionViewSet.list: Found {queryset.count()} solution descriptions")
+            media_index = load_media_index(solution.hero_image.name for solution in queryset)
 
             # Create a simple response without using the serializer
             result = []
@@ -769,87 +899,50 @@ class SolutionDescriptionViewSet(viewsets.ModelViewSet):
                     }
 
                     # Handle hero_image separately
-                    if solution.hero_image:
-                        try:
-                            # Get the base URL from the request
-                            base_url = request.build_absolute_uri('/').rstrip('/')
-                            # Construct the full URL
-                            if solution.hero_image.url.startswith(('http://', 'https://')):
-                                item['hero_image'] = solution.hero_image.url
-                            else:
-                                if solution.hero_image.url.startswith('/'):
-                                    item['hero_image'] = f"{base_url}{solution.hero_image.url}"
-                                else:
-                                    item['hero_image'] = f"{base_url}/{solution.hero_image.url}"
-                        except Exception as img_error:
-                            print(f"Error handling hero_image for solution {solution.id}: {str(img_error)}")
-                            item['hero_image'] = None
-                    else:
+                    try:
+                        item['hero_image'] = build_media_url(request, solution.hero_image)
+                        item['hero_image_renditions'] = rendition_urls(request, media_index.get(solution.hero_image.name))
+                    except Exception:
+                        logger.exception('Error building hero image URL', solution_description=solution.id)
                         item['hero_image'] = None
+                        item['hero_image_renditions'] = None
 
                     result.append(item)
-                    print(f"Added solution {solution.id} to result")
-                except Exception as sol_error:
-                    print(f"Error processing solution description {getattr(solution, 'id', 'unknown')}: {str(sol_error)}")
+                except Exception:
+                    logger.exception('Error processing solution description', solution_description=getattr(solution, 'id', 'unknown'))
 
-            print(f"Returning {len(result)} solution descriptions")
-            return Response(result)
+            logger.debug('Listed solution descriptions', count=len(result))
+            return Response(self.select_fields(result))
 
-        except Exception as e:
-            print(f"Error in SolutionDescriptionViewSet.list: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception('Error listing solution descriptions')
             return Response(
                 {"error": "An error occurred while fetching solution descriptions."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
     def create(self, request, *args, **kwargs):
-        print("Creating solution description with data:", request.data)
-        print("Files:", request.FILES)
-
-        # Check if hero_image_file is in the request
-        if 'hero_image_file' in request.FILES:
-            print(f"Hero image file: {request.FILES['hero_image_file']}")
-            print(f"Hero image file name: {request.FILES['hero_image_file'].name}")
-            print(f"Hero image file size: {request.FILES['hero_image_file'].size}")
-            print(f"Hero image file content type: {request.FILES['hero_image_file'].content_type}")
+        logger.debug('Creating solution description', data=redact(request.data), files=redact(request.FILES))
 
         try:
-            response = super().create(request, *args, **kwargs)
-            print(f"Create response: {response.data}")
-            return response
+            return super().create(request, *args, **kwargs)
         except Exception as e:
-            print(f"Error creating solution description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error creating solution description')
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
     def update(self, request, *args, **kwargs):
-        print("Updating solution description with data:", request.data)
-        print("Files:", request.FILES)
-
-        # Check if hero_image_file is in the request
-        if 'hero_image_file' in request.FILES:
-            print(f"Hero image file: {request.FILES['hero_image_file']}")
-            print(f"Hero image file name: {request.FILES['hero_image_file'].name}")
-            print(f"Hero image file size: {request.FILES['hero_image_file'].size}")
-            print(f"Hero image file content type: {request.FILES['hero_image_file'].content_type}")
+        logger.debug('Updating solution description', data=redact(request.data), files=redact(request.FILES))
 
         # Always use partial update to allow optional fields
         kwargs['partial'] = True
 
         try:
-            response = super().update(request, *args, **kwargs)
-            print(f"Update response: {response.data}")
-            return response
+            return super().update(request, *args, **kwargs)
         except Exception as e:
-            print(f"Error updating solution description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error updating solution description', pk=kwargs.get('pk'))
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -857,19 +950,19 @@ class SolutionDescriptionViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         instance = serializer.save()
-        print(f"Created solution description: {instance.id}")
-        print(f"Hero image: {instance.hero_image}")
+        logger.debug('Created solution description', solution_description=instance.id, hero_image=instance.hero_image)
 
     def perform_update(self, serializer):
         instance = serializer.save()
-        print(f"Updated solution description: {instance.id}")
-        print(f"Hero image: {instance.hero_image}")
+        logger.debug('Updated solution description', solution_description=instance.id, hero_image=instance.hero_image)
 
 
 # News Description viewset
-class NewsDescriptionViewSet(viewsets.ModelViewSet):
+class NewsDescriptionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = NewsDescription.objects.all()
     serializer_class = NewsDescriptionSerializer
+    # Read by the custom list() and retrieve() whatever ?fields= selects
+    required_fields = ('title', 'description', 'hero_image', 'created_at', 'updated_at')
     permission_classes = [AllowAny]  # Allow public access for reading
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
@@ -880,10 +973,11 @@ class NewsDescriptionViewSet(viewsets.ModelViewSet):
         return context
 
     def list(self, request, *args, **kwargs):
+        # Outside the try: bad query parameters are a 400, not a 500
+        queryset = self.filter_queryset(self.get_queryset())
+        self.selected_field_names()
         try:
-            print("NewsDescriptionViewSet.list: Listing all news descriptions")
-            queryset = self.get_queryset()
-            print(f"NewsDescriptionViewSet.list: Found {queryset.count()} news descriptions")
+            media_index = load_media_index(news.hero_image.name for news in queryset)
 
             # Create a simple response without using the serializer
             result = []
@@ -898,48 +992,35 @@ class NewsDescriptionViewSet(viewsets.ModelViewSet):
                     }
 
                     # Handle hero_image separately
-                    if news.hero_image:
-                        try:
-                            # Get the base URL from the request
-                            base_url = request.build_absolute_uri('/').rstrip('/')
-                            # Construct the full URL
-                            if news.hero_image.url.startswith(('http://', 'https://')):
-                                item['hero_image'] = news.hero_image.url
-                            else:
-                                if news.hero_image.url.startswith('/'):
-                                    item['hero_image'] = f"{base_url}{news.hero_image.url}"
-                                else:
-                                    item['hero_image'] = f"{base_url}/{news.hero_image.url}"
-                            print(f"Hero image URL for news {news.id}: {item['hero_image']}")
-                        except Exception as img_error:
-                            print(f"Error handling hero_image for news {news.id}: {str(img_error)}")
-                            item['hero_image'] = None
-                    else:
+                    try:
+                        item['hero_image'] = build_media_url(request, news.hero_image)
+                        item['hero_image_renditions'] = rendition_urls(request, media_index.get(news.hero_image.name))
+                    except Exception:
+                        logger.exception('Error building hero image URL', news_description=news.id)
                         item['hero_image'] = None
-                        print(f"No hero image for news {news.id}")
+                        item['hero_image_renditions'] = None
 
                     result.append(item)
-                    print(f"Added news {news.id} to result")
-                except Exception as news_error:
-                    print(f"Error processing news description {getattr(news, 'id', 'unknown')}: {str(news_error)}")
+                except Exception:
+                    logger.exception('Error processing news description', news_description=getattr(news, 'id', 'unknown'))
 
-            print(f"Returning {len(result)} news descriptions")
-            return Response(result)
+            logger.debug('Listed news descriptions', count=len(result))
+            return Response(self.select_fields(result))
 
-        except Exception as e:
-            print(f"Error in NewsDescriptionViewSet.list: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception('Error listing news descriptions')
             return Response(
                 {"error": "An error occurred while fetching news descriptions."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
     def retrieve(self, request, *args, **kwargs):
+        # Outside the try: a missing object or bad query parameter is a
+        # 404/400, not a 500
+        instance = self.get_object()
+        self.selected_field_names()
         try:
-            print(f"NewsDescriptionViewSet.retrieve: Retrieving news description with pk: {kwargs.get('pk')}")
-            instance = self.get_object()
-            print(f"NewsDescriptionViewSet.retrieve: Found news description: {instance.id}")
+            media_index = load_media_index([instance.hero_image.name])
 
             # Create a response manually
             result = {
@@ -951,33 +1032,19 @@ class NewsDescriptionViewSet(viewsets.ModelViewSet):
             }
 
             # Handle hero_image separately
-            if instance.hero_image:
-                try:
-                    # Get the base URL from the request
-                    base_url = request.build_absolute_uri('/').rstrip('/')
-                    # Construct the full URL
-                    if instance.hero_image.url.startswith(('http://', 'https://')):
-                        result['hero_image'] = instance.hero_image.url
-                    else:
-                        if instance.hero_image.url.startswith('/'):
-                            result['hero_image'] = f"{base_url}{instance.hero_image.url}"
-                        else:
-                            result['hero_image'] = f"{base_url}/{instance.hero_image.url}"
-                    print(f"Hero image URL for news {instance.id}: {result['hero_image']}")
-                except Exception as img_error:
-                    print(f"Error handling hero_image for news {instance.id}: {str(img_error)}")
-                    result['hero_image'] = None
-            else:
+            try:
+                result['hero_image'] = build_media_url(request, instance.hero_image)
+                result['hero_image_renditions'] = rendition_urls(request, media_index.get(instance.hero_image.name))
+            except Exception:
+                logger.exception('Error building hero image URL', news_description=instance.id)
                 result['hero_image'] = None
-                print(f"No hero image for news {instance.id}")
+                result['hero_image_renditions'] = None
 
-            print(f"NewsDescriptionViewSet.retrieve: Returning result: {result}")
-            return Response(result)
+            logger.debug('Retrieved news description', news_description=instance.id)
+            return Response(self.select_fields(result))
 
         except Exception as e:
-            print(f"Error in NewsDescriptionViewSet.retrieve: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error retrieving news description', pk=kwargs.get('pk'))
             return Response(
                 {"error": f"An error occurred while retrieving news description: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -991,40 +1058,26 @@ class NewsDescriptionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        print("Creating news description with data:", request.data)
-        print("Files:", request.FILES)
+        logger.debug('Creating news description', data=redact(request.data), files=redact(request.FILES))
 
         # Check if title and description are empty strings and convert them to None
         mutable_data = request.data.copy() if hasattr(request.data, 'copy') else dict(request.data)
 
         # Handle title field
         if 'title' in mutable_data and mutable_data['title'] == '':
-            print("Converting empty title to None")
             mutable_data['title'] = None
 
         # Handle description field
         if 'description' in mutable_data and mutable_data['description'] == '':
-            print("Converting empty description to None")
             mutable_data['description'] = None
 
         # Replace the request data with our modified version
         request._full_data = mutable_data
 
-        # Check if hero_image_file is in the request
-        if 'hero_image_file' in request.FILES:
-            print(f"Hero image file: {request.FILES['hero_image_file']}")
-            print(f"Hero image file name: {request.FILES['hero_image_file'].name}")
-            print(f"Hero image file size: {request.FILES['hero_image_file'].size}")
-            print(f"Hero image file content type: {request.FILES['hero_image_file'].content_type}")
-
         try:
-            response = super().create(request, *args, **kwargs)
-            print(f"Create response: {response.data}")
-            return response
+            return super().create(request, *args, **kwargs)
         except Exception as e:
-            print(f"Error creating news description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error creating news description')
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1038,43 +1091,29 @@ class NewsDescriptionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        print("Updating news description with data:", request.data)
-        print("Files:", request.FILES)
+        logger.debug('Updating news description', data=redact(request.data), files=redact(request.FILES))
 
         # Check if title and description are empty strings and convert them to None
         mutable_data = request.data.copy() if hasattr(request.data, 'copy') else dict(request.data)
 
         # Handle title field
         if 'title' in mutable_data and mutable_data['title'] == '':
-            print("Converting empty title to None")
             mutable_data['title'] = None
 
         # Handle description field
         if 'description' in mutable_data and mutable_data['description'] == '':
-            print("Converting empty description to None")
             mutable_data['description'] = None
 
         # Replace the request data with our modified version
         request._full_data = mutable_data
 
-        # Check if hero_image_file is in the request
-        if 'hero_image_file' in request.FILES:
-            print(f"Hero image file: {request.FILES['hero_image_file']}")
-            print(f"Hero image file name: {request.FILES['hero_image_file'].name}")
-            print(f"Hero image file size: {request.FILES['hero_image_file'].size}")
-            print(f"Hero image file content type: {request.FILES['hero_image_file'].content_type}")
-
         # Always use partial update to allow optional fields
         kwargs['partial'] = True
 
         try:
-            response = super().update(request, *args, **kwargs)
-            print(f"Update response: {response.data}")
-            return response
+            return super().update(request, *args, **kwargs)
         except Exception as e:
-            print(f"Error updating news description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error updating news description', pk=kwargs.get('pk'))
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1082,17 +1121,11 @@ class NewsDescriptionViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         instance = serializer.save()
-        print(f"Created news description: {instance.id}")
-        print(f"Hero image: {instance.hero_image}")
+        logger.debug('Created news description', news_description=instance.id, hero_image=instance.hero_image)
 
     def perform_update(self, serializer):
         instance = serializer.save()
-        print(f"Updated news description: {instance.id}")
-        print(f"Hero image: {instance.hero_image}")
-        if instance.hero_image:
-            print(f"Hero image URL: {instance.hero_image.url}")
-        else:
-            print("No hero image set")
+        logger.debug('Updated news description', news_description=instance.id, hero_image=instance.hero_image)
 
     def destroy(self, request, *args, **kwargs):
         # Check if user is authenticated
@@ -1104,30 +1137,27 @@ class NewsDescriptionViewSet(viewsets.ModelViewSet):
 
         try:
             instance = self.get_object()
-            print(f"Deleting news description: {instance.id}")
+            logger.debug('Deleting news description', news_description=instance.id)
 
             # Delete the hero image if it exists
             if instance.hero_image:
                 try:
-                    print(f"Deleting hero image: {instance.hero_image.path}")
                     instance.hero_image.delete(save=False)
-                except Exception as e:
-                    print(f"Error deleting hero image: {str(e)}")
+                except Exception:
+                    logger.exception('Error deleting hero image', news_description=instance.id)
 
             # Delete the instance
             self.perform_destroy(instance)
             return Response(status=status.HTTP_204_NO_CONTENT)
         except Exception as e:
-            print(f"Error deleting news description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error deleting news description')
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
 # Partner related viewsets
-class PartnerViewSet(viewsets.ModelViewSet):
+class PartnerViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = Partner.objects.all()
     serializer_class = PartnerSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -1139,16 +1169,111 @@ class PartnerViewSet(viewsets.ModelViewSet):
         return context
 
     def create(self, request, *args, **kwargs):
-        print("Creating partner with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
+        logger.debug('Creating partner', data=redact(request.data), files=redact(request.FILES))
         return super().create(request, *args, **kwargs)
 
     def update(self, request, *args, **kwargs):
-        print("Updating partner with data:", request.data)  # Debug log
-        print("Files:", request.FILES)  # Debug log
+        logger.debug('Updating partner', data=redact(request.data), files=redact(request.FILES))
         return super().update(request, *args, **kwargs)
 
-class PartnersDescriptionViewSet(viewsets.ModelViewSet):
+class PartnersDescriptionViewSet(ConditionalGetMixin, CachedReadMixin, ContentQueryMixin, viewsets.ModelViewSet):
     queryset = PartnersDescription.objects.all()
     serializer_class = PartnersDescriptionSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+
+
+# Page bundle view
+class PageBundleView(APIView):
+    """
+    Return every section a public page needs in a single response.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, page):
+        if page not in PAGE_BUNDLES:
+            return Response(
+                {'error': f'Unknown page: {page}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response(get_bundle(page, request))
+
+
+# Search view
+class SearchView(APIView):
+    """
+    Ranked full-text search over products, solutions and news.
+
+        GET /api/search/?q=smart card&type=product,news&page=1&page_size=20
+
+    Titles and snippets are HTML with matches wrapped in <mark>.
+    """
+    permission_classes = [AllowAny]
+    max_page_size = 50
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'error': 'q parameter is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+        kinds = [kind for kind in request.query_params.get('type', '').split(',') if kind] or None
+        try:
+            page = max(1, int(request.query_params.get('page', 1)))
+            page_size = min(self.max_page_size, max(1, int(request.query_params.get('page_size', 20))))
+        except ValueError:
+            return Response(
+                {'error': 'page and page_size must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        total, results = search(query, kinds, limit=page_size, offset=(page - 1) * page_size)
+        return Response({
+            'query': query,
+            'count': total,
+            'page': page,
+            'page_size': page_size,
+            'results': results,
+        })
+
+
+class SearchSuggestView(APIView):
+    """
+    Typeahead completions of the last word of a query.
+
+        GET /api/search/suggest/?q=smart ca&limit=10
+    """
+    permission_classes = [AllowAny]
+    max_limit = 20
+
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        try:
+            limit = min(self.max_limit, max(1, int(request.query_params.get('limit', 10))))
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'query': query, 'suggestions': suggest(query, limit)})
+
+
+# Dashboard view
+class DashboardStatsView(APIView):
+    """
+    Row counts for the admin dashboard, one COUNT query each, so the
+    dashboard need not page through the lists to count them.
+
+        GET /api/dashboard/stats/
+
+    The user count is only included for admins.
+    """
+    permission_classes = [IsViewerOrHigher]
+
+    def get(self, request):
+        stats = {
+            'products': Product.objects.count(),
+            'solutions': Solution.objects.count(),
+            'news': NewsArticle.objects.count(),
+            'contacts': ContactMessage.objects.count(),
+        }
+        if request_role(request) == 'admin':
+            stats['users'] = User.objects.count()
+        return Response(stats)
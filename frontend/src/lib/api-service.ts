@@ -79,7 +79,25 @@ import {
   SolutionDescription,
   NewsDescription
 } from './types';
-import { AxiosError } from 'axios';
+import { AxiosError, AxiosInstance } from 'axios';
+
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+// Cursor-paginated endpoints (news, contact messages, activity) return
+// { next, previous, results }; fetch one page and pass `next` back in to get
+// the following one. Never walk every page: counts come from
+// /dashboard/stats/.
+export const fetchPage = async <T>(client: AxiosInstance, url: string): Promise<CursorPage<T>> => {
+  const response = await client.get(url);
+  if (Array.isArray(response.data)) {
+    return { next: null, previous: null, results: response.data };
+  }
+  return response.data;
+};
 
 const createService = <T>(endpoint: string, hasFileUploads = false) => ({
   getAll: async (): Promise<T[]> => {
@@ -339,10 +357,11 @@ const createService = <T>(endpoint: string, hasFileUploads = false) => ({
 
 // Services declarations moved to the end of the file
 export const newsService = {
-  getAll: async () => {
+  // One page of articles, newest first; pass the previous page's `next` to
+  // continue (see News.tsx and NewsAdmin.tsx)
+  getPage: async (url = '/news/'): Promise<CursorPage<NewsArticle>> => {
     try {
-      const response = await publicApiClient.get('/news/');
-      return response.data;
+      return await fetchPage<NewsArticle>(publicApiClient, url);
     } catch (error) {
       console.error('Error fetching news:', error);
       throw error;
@@ -552,50 +571,14 @@ export const userService = {
 export const dashboardService = {
   getStats: async () => {
     try {
-      // Get user info for role check
-      const userInfo = JSON.parse(localStorage.getItem('user_info') || '{}');
-
-      // Base endpoints that all roles can access
-      const endpoints = {
-        products: '/products/',
-        solutions: '/solutions/',
-        news: '/news/',
-        contact: '/contact/',
-      };
-
-      // Create an array of promises for parallel fetching
-      const promises = Object.entries(endpoints).map(([key, endpoint]) =>
-        publicApiClient.get(endpoint)
-          .then(response => ({ [key]: response.data.length }))
-          .catch(error => {
-            console.error(`Error fetching ${key}:`, error);
-            return { [key]: 0 };
-          })
-      );
-
-      // Only add users endpoint if user has admin role
-      let usersCount = 0;
-      if (userInfo.role === 'admin') {
-        try {
-          const usersResponse = await apiClient.get('/users/');
-          usersCount = usersResponse.data.length;
-        } catch (error) {
-          console.error('Error fetching users:', error);
-        }
-      }
-
-      // Wait for all promises to resolve
-      const results = await Promise.all(promises);
-
-      // Combine all results into a single object
-      const stats = results.reduce((acc, curr) => ({ ...acc, ...curr }), {});
-
+      // One COUNT per list on the server; users are only counted for admins
+      const response = await apiClient.get('/dashboard/stats/');
       return {
-        products: stats.products || 0,
-        solutions: stats.solutions || 0,
-        news: stats.news || 0,
-        contacts: stats.contact || 0,
-        users: usersCount
+        products: response.data.products || 0,
+        solutions: response.data.solutions || 0,
+        news: response.data.news || 0,
+        contacts: response.data.contacts || 0,
+        users: response.data.users || 0
       };
     } catch (error) {
       console.error('Error fetching dashboard stats:', error);
@@ -612,8 +595,9 @@ export const dashboardService = {
 
   getActivity: async () => {
     try {
+      // Latest page of the activity log
       const response = await apiClient.get('/activity/');
-      return response.data;
+      return response.data.results;
     } catch (error) {
       console.error('Error fetching activity:', error);
       return [];
@@ -6,7 +6,7 @@ import { Link } from "react-router-dom";
 import { ChevronRight, Calendar, User } from "lucide-react";
 import { newsService, userService, newsDescriptionService } from "@/lib/api-service";
 import { NewsArticle, User as UserType, NewsDescription } from "@/lib/types";
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery, useQuery } from "@tanstack/react-query";
 import { Skeleton } from "@/components/ui/skeleton";
 
 const News = () => {
@@ -125,12 +125,23 @@ const News = () => {
     }
   }, [newsDescription?.id, newsDescription?.hero_image]);
 
-  const { data: newsArticles = [], isLoading, error } = useQuery<NewsArticle[]>({
+  // One cursor page at a time; "Load more" follows the `next` link
+  const {
+    data: newsPages,
+    isLoading,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage
+  } = useInfiniteQuery({
     queryKey: ["news"],
-    queryFn: () => newsService.getAll(),
+    queryFn: ({ pageParam }) => newsService.getPage(pageParam),
+    initialPageParam: '/news/',
+    getNextPageParam: (lastPage) => lastPage.next ?? undefined,
     retry: 1,
     staleTime: 5 * 60 * 1000
   });
+  const newsArticles: NewsArticle[] = newsPages?.pages.flatMap((page) => page.results) ?? [];
 
   // Add helper function to get author name
   const getAuthorName = (authorId: string | number | undefined): string => {
@@ -352,6 +363,18 @@ const News = () => {
                 ))}
               </div>
             )}
+            {hasNextPage && (
+              <div className="text-center mt-8">
+                <Button
+                  variant="outline"
+                  className="text-navy border-navy hover:bg-navy hover:text-white"
+                  onClick={() => fetchNextPage()}
+                  disabled={isFetchingNextPage}
+                >
+                  {isFetchingNextPage ? "Loading..." : "Load more"}
+                </Button>
+              </div>
+            )}
           </div>
         </section>
 
@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { useInfiniteQuery, useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import AdminLayout from "@/components/admin/AdminLayout";
 import { newsService, userService, newsDescriptionService } from "@/lib/api-service";
 import { NewsArticle, User, NewsDescription } from "@/lib/types";
@@ -55,16 +55,21 @@ const NewsAdmin = () => {
     }
   };
 
-  // Fetch articles with author details
-  const { data: articles = [], isLoading: articlesLoading, error: articlesError } = useQuery({
+  // Fetch articles with author details, one cursor page at a time
+  const {
+    data: articlePages,
+    isLoading: articlesLoading,
+    error: articlesError,
+    fetchNextPage: fetchMoreArticles,
+    hasNextPage: hasMoreArticles,
+    isFetchingNextPage: isFetchingMoreArticles
+  } = useInfiniteQuery({
     queryKey: ["news"],
-    queryFn: async () => {
-      const articles = await newsService.getAll();
-      // Log the response to debug
-      console.log('Fetched articles:', articles);
-      return articles;
-    },
+    queryFn: ({ pageParam }) => newsService.getPage(pageParam),
+    initialPageParam: '/news/',
+    getNextPageParam: (lastPage) => lastPage.next ?? undefined,
   });
+  const articles: NewsArticle[] = articlePages?.pages.flatMap((page) => page.results) ?? [];
 
   // Fetch news descriptions
   const { data: descriptions = [], isLoading: descriptionsLoading, error: descriptionsError } = useQuery({
@@ -363,21 +368,26 @@ const NewsAdmin = () => {
     }
   };
 
-  const handleEditArticle = (article: NewsArticle) => {
-    // Add detailed logging to verify all fields
-    console.log("Editing article with full details:", {
-      id: article.id,
-      title: article.title,
-      slug: article.slug,
-      excerpt: article.excerpt,
-      content: article.content,
-      image: article.image,
-      author: article.author,
-      publishedAt: article.published_at
-    });
-
-    setSelectedArticle(article);
-    setIsFormOpen(true);
+  const handleEditArticle = async (article: NewsArticle) => {
+    try {
+      // List rows leave out the article body; the form needs all of it
+      const fullArticle: NewsArticle = await newsService.getById(String(article.id));
+      console.log("Editing article with full details:", {
+        id: fullArticle.id,
+        title: fullArticle.title,
+        slug: fullArticle.slug,
+        excerpt: fullArticle.excerpt,
+        image: fullArticle.image,
+        author: fullArticle.author,
+        publishedAt: fullArticle.published_at
+      });
+
+      setSelectedArticle(fullArticle);
+      setIsFormOpen(true);
+    } catch (error) {
+      console.error("Error loading article for editing:", error);
+      toast.error("Failed to load the article");
+    }
   };
 
   const handleDeleteArticle = (id: string) => {
@@ -631,6 +641,17 @@ const NewsAdmin = () => {
                   </TableBody>
                 </Table>
               )}
+              {hasMoreArticles && (
+                <div className="p-4 text-center border-t">
+                  <Button
+                    variant="outline"
+                    onClick={() => fetchMoreArticles()}
+                    disabled={isFetchingMoreArticles}
+                  >
+                    {isFetchingMoreArticles ? "Loading..." : "Load more"}
+                  </Button>
+                </div>
+              )}
             </div>
           )}
         </TabsContent>